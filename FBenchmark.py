@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 17:35:18 2026
+
+Benchmarks of the design, response and redraw hot paths. The results are
+saved as JSON, so two commits can be compared:
+
+    python FBenchmark.py -o base.json
+    python FBenchmark.py -o nuevo.json --comparar base.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from statistics import median
+from time import perf_counter, strftime
+from numpy import log10, sqrt, cosh, arccosh, pi
+import numpy
+import scipy
+from Resources.Filters import Filter
+from Resources.PFilter import frecResponse
+
+ORDENES = (2, 5, 10, 20, 40, 80)
+TAPS = (31, 101, 301, 1001, 3001, 10001)
+ORDENES_RAPIDO = (2, 10, 40)
+TAPS_RAPIDO = (31, 301, 3001)
+Ap, Ar, fp, fs = 1, 60, 1e+3, 48e+3
+
+def frButter(N):
+    # Reject frequency that gives a Butterworth filter of order N
+    k = log10((10**(Ap/10)-1)/(10**(Ar/10)-1))
+    return fp/10**(k/(2*(N - .5)))
+
+def frCheby(N):
+    # Reject frequency that gives a Chebyshev filter of order N
+    return fp*cosh(arccosh(sqrt((10**(Ar/10)-1)/(10**(Ap/10)-1)))/(N - .5))
+
+def frFIR(N):
+    # Reject frequency that gives about N taps with the blackman window
+    return fp + 12*pi/(N - 1)*fs/(2*pi)
+
+def Medir(func, objetivo = 0.2, repeticiones = 5):
+    '''
+    Time func, the number of calls of each repetition is chosen so a
+    repetition takes about objetivo/repeticiones seconds
+
+    Returns
+    -------
+    tiempos : list
+        Seconds per call of each repetition
+
+    '''
+    func()
+    llamadas, t = 1, 0
+    while True:
+        t0 = perf_counter()
+        for i in range(llamadas):
+            func()
+        t = perf_counter() - t0
+        if t >= objetivo/repeticiones or llamadas >= 2**16:
+            break
+        llamadas *= 2
+    tiempos = [t/llamadas]
+    for r in range(repeticiones - 1):
+        t0 = perf_counter()
+        for i in range(llamadas):
+            func()
+        tiempos.append((perf_counter() - t0)/llamadas)
+    return tiempos
+
+def Caso(resultados, nombre, parametro, func, **kwargs):
+    tiempos = Medir(func, **kwargs)
+    resultados.append({"nombre": nombre, "parametro": parametro,
+                       "min_s": min(tiempos), "mediana_s": median(tiempos),
+                       "repeticiones": len(tiempos)})
+    print("{:<24}{:>8}{:>14.1f} us".format(nombre, parametro, min(tiempos)*1e6))
+
+def Diseno(resultados, ordenes, taps):
+    r = frecResponse()
+    for N in ordenes:
+        fr = frButter(N)
+        Caso(resultados, "Butterworth", N, lambda: Filter.Butterworth(Ap, Ar, fp, fr))
+        fcB, secB = Filter.Butterworth(Ap, Ar, fp, fr)
+        Caso(resultados, "BilinearTF", N, lambda: Filter.BilinearTF(fs, secB))
+        Caso(resultados, "frecResponse.Fltr", N, lambda: r.Fltr(secB, fcB))
+        iir = Filter.BilinearTF(fs, secB)
+        Caso(resultados, "frecResponse.IIR", N, lambda: r.IIR(iir, fcB, fs))
+        
+        fr = frCheby(N)
+        Caso(resultados, "Chebyshev", N, lambda: Filter.Chebyshev(Ap, Ar, fp, fr))
+    
+    for N in taps:
+        fr = frFIR(N)
+        Caso(resultados, "FIR", N, lambda: Filter.FIR(Ap, Ar, fp, fr, fs))
+        wc, h = Filter.FIR(Ap, Ar, fp, fr, fs)
+        Caso(resultados, "frecResponse.FIR", N, lambda: r.FIR(h))
+
+def Redibujo(resultados, ordenes, taps):
+    # Offscreen redraw of ActualizaCanvas, full and with blitting
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt5 import QtWidgets
+        import FDesigner
+    except ImportError as e:
+        print("Redibujo omitido: {}".format(e))
+        return
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    w = FDesigner.MainWindow()
+    w.show()
+    app.processEvents()
+    w.Iniciar()
+    # The canvas of the current tab is created by Iniciar and shown by the
+    # events, a hidden canvas only marks itself as pending
+    app.processEvents()
+    
+    casos = [("Butterworth", N, frButter(N)) for N in ordenes]
+    casos += [("FIR", N, frFIR(N)) for N in taps]
+    for tipo, N, fr in casos:
+        w.ui.Tfiltro.setCurrentText(tipo)
+        w.EN_DIS()
+        w.ui.IIR.setChecked(False)
+        w.fs, w.fr = fs, fr
+        resultado = w.Disenar(tipo, Ap, Ar, fp, fr, fs, False, False)
+        w.Pintar(resultado)
+        app.processEvents()
+        canvas = getattr(w.ui, FDesigner.CANVAS[w.ui.tabWidget.currentIndex()])
+        assert canvas is not None and canvas.isVisible(), "El canvas no es visible"
+        Response = resultado[3]
+        Caso(resultados, "ActualizaCanvas " + tipo, N,
+             lambda: w.ActualizaCanvas(Response), objetivo = 1, repeticiones = 3)
+        Caso(resultados, "ActualizaCanvas blit " + tipo, N,
+             lambda: w.ActualizaCanvas(Response, completo = False))
+    w.close()
+
+def Meta():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output = True,
+                                text = True, cwd = os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ""
+    return {"commit": commit, "fecha": strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(), "numpy": numpy.__version__,
+            "scipy": scipy.__version__, "plataforma": platform.platform()}
+
+def Comparar(resultados, archivo, umbral):
+    '''
+    Print the ratio of the minimum times against a previous result, the
+    cases slower than umbral are marked as regressions
+
+    Returns
+    -------
+    regresiones : int
+        Number of regressions
+
+    '''
+    with open(archivo) as f:
+        base = {(r["nombre"], r["parametro"]): r for r in json.load(f)["resultados"]}
+    regresiones = 0
+    print("\nComparación con {}".format(archivo))
+    for r in resultados:
+        b = base.get((r["nombre"], r["parametro"]))
+        if b is None:
+            continue
+        razon = r["min_s"]/b["min_s"]
+        marca = ""
+        if razon > 1 + umbral:
+            marca = "  REGRESIÓN"
+            regresiones += 1
+        print("{:<24}{:>8}{:>10.2f}x{}".format(r["nombre"], r["parametro"], razon, marca))
+    return regresiones
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Benchmarks de diseño, respuesta y redibujo")
+    parser.add_argument("-o", "--salida", default = "bench.json", help = "archivo JSON de resultados")
+    parser.add_argument("--comparar", help = "resultados JSON de otro commit")
+    parser.add_argument("--umbral", type = float, default = .1, help = "aumento de tiempo que se marca como regresión")
+    parser.add_argument("--rapido", action = "store_true", help = "rejilla reducida de órdenes y taps")
+    parser.add_argument("--sin-gui", action = "store_true", help = "omite el redibujo de ActualizaCanvas")
+    args = parser.parse_args(argv)
+    
+    ordenes = ORDENES_RAPIDO if args.rapido else ORDENES
+    taps = TAPS_RAPIDO if args.rapido else TAPS
+    resultados = []
+    Diseno(resultados, ordenes, taps)
+    if not args.sin_gui:
+        Redibujo(resultados, ordenes, taps)
+    
+    with open(args.salida, "w") as f:
+        json.dump({"meta": Meta(), "resultados": resultados}, f, indent = 1)
+    
+    if args.comparar:
+        return 1 if Comparar(resultados, args.comparar, args.umbral) else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 16:44:52 2026
+
+Command line designer without Qt, reads one or many specifications from a
+JSON or CSV file and writes the designs to JSON, .npz or the binary
+archive .fsd (see Resources.Archive). Example:
+
+    python FDesignCLI.py specs.csv -o disenos.npz --respuesta
+
+A specification has the parameters of the GUI: tipo (FIR, Equiripple, Butterworth,
+Chebyshev, Chebyshev Inverso, Eliptico or Auto), Ap, Ar, fp, fr, fs, HP, IIR
+and minfase (minimum phase taps of FIR and Equiripple). The missing ones
+take the default values of the GUI.
+"""
+
+import argparse
+import csv
+import json
+import sys
+from numpy import pi, savez, asarray, angle, log10, abs as npabs
+from Resources.Filters import Filter, FIRS
+from Resources.PFilter import frecResponse, DigitalResp
+from Resources.Sections import SecArray
+from Resources.Cost import Cost, FFTCost
+
+DEFAULT = {"tipo": "FIR", "Ap": 1, "Ar": 60, "fp": 1e+3, "fr": 1.5e+3,
+           "fs": 5e+3, "HP": False, "IIR": False, "minfase": False}
+
+def Booleano(valor):
+    if isinstance(valor, str):
+        return valor.strip().lower() in ("1", "true", "si", "sí", "yes")
+    return bool(valor)
+
+def LeerSpecs(archivo):
+    '''
+    Read the specifications of a JSON file (an object or a list of objects)
+    or a CSV file with a header, '-' reads JSON from the standard input
+
+    Returns
+    -------
+    specs : list
+        List of dictionaries with all the parameters
+
+    '''
+    if archivo == "-":
+        datos = json.load(sys.stdin)
+    elif archivo.lower().endswith(".csv"):
+        with open(archivo, newline = "") as f:
+            datos = [fila for fila in csv.DictReader(f)]
+    else:
+        with open(archivo) as f:
+            datos = json.load(f)
+    if isinstance(datos, dict):
+        datos = [datos]
+    
+    specs = []
+    for d in datos:
+        spec = dict(DEFAULT)
+        spec.update({k: v for k, v in d.items() if v not in (None, "")})
+        for k in ("Ap", "Ar", "fp", "fr", "fs"):
+            spec[k] = float(spec[k])
+        spec["HP"] = Booleano(spec["HP"])
+        spec["IIR"] = Booleano(spec["IIR"])
+        spec["minfase"] = Booleano(spec["minfase"])
+        specs.append(spec)
+    return specs
+
+def Disenar(spec, respuesta = False, puntos = None, bits = None):
+    '''
+    Design a specification, the result has the cutoff frequency in hz, the
+    sections (n, 6) or the taps, the costs of its realizations (see
+    Resources.Cost), optionally the response in hz, dB and
+    radians and the fixed point coefficients of a word of bits ("auto" for
+    the shortest word that meets the specification, see Fixed.MinimumBits)
+    with the responses of the float design, of the quantized coefficients
+    and of the integer simulation (see Fixed.FixedResponse)
+
+    '''
+    r = frecResponse()
+    fc, Filtro = Filter.Design(spec["tipo"], spec["Ap"], spec["Ar"], spec["fp"],
+                               spec["fr"], spec["fs"], spec["HP"], spec["IIR"], spec["minfase"])
+    # The outputs of Filter.Design as they are, for the binary archive
+    resultado = {"spec": spec, "diseno": (fc, Filtro),
+                 "costo": [Cost(Filtro, fc, spec["fs"], spec["IIR"])]}
+    
+    if spec["tipo"] in FIRS:
+        resultado["fc"] = fc*spec["fs"]/(2*pi)
+        resultado["taps"] = asarray(Filtro)
+        resultado["costo"].append(FFTCost(Filtro, spec["fs"]))
+        if respuesta:
+            w, Hdb, Hphi, H = r.FIR(Filtro, puntos)
+            resultado["respuesta"] = (w*spec["fs"]/(2*pi), Hdb, Hphi)
+    else:
+        resultado["fc"] = fc
+        resultado["secciones"] = SecArray(Filtro, analog = not spec["IIR"])
+        if respuesta and spec["IIR"]:
+            resultado["respuesta"] = r.IIR(Filtro, fc, spec["fs"], puntos or 512)[:3]
+        elif respuesta:
+            resultado["respuesta"] = r.Fltr(Filtro, fc)[:3]
+    
+    # Only the digital designs can be quantized
+    if bits and (spec["tipo"] in FIRS or spec["IIR"]):
+        resultado["fijo"] = Fijo(Filtro, spec, bits)
+    return resultado
+
+def Fijo(Filtro, spec, bits):
+    # The quantization is only imported when --bits asks for it
+    from Resources import Fixed
+    args = (spec["Ap"], spec["Ar"], spec["fp"], spec["fr"], spec["fs"], spec["HP"])
+    if bits == "auto":
+        bits, informe = Fixed.MinimumBits(Filtro, *args)
+        if bits is None:
+            return {"bits": None}
+    else:
+        bits = int(bits)
+        informe = {"bits": bits}
+    if spec["tipo"] in FIRS:
+        q, frac = Fixed.QuantizeFIR(Filtro, bits)
+    else:
+        q, frac, informe["ganancia"] = Fixed.QuantizeSOS(Filtro, bits)
+        informe.setdefault("ciclo_limite", Fixed.LimitCycle(q, frac, bits))
+    if "respuesta" not in informe:
+        w, Hcoef, Hsim, informe["desbordes"] = Fixed.FixedResponse(q, frac, bits)
+    else:
+        w, Hcoef, Hsim = informe["respuesta"]
+    # The float design at the same frequencies, the gain removed by the
+    # scaling of the sections is put back to compare them
+    if spec["tipo"] in FIRS:
+        H = Fixed.TapsResp(asarray(Filtro, dtype = float), w)
+    else:
+        H = DigitalResp(SecArray(Filtro, analog = False), w)[2]
+        Hcoef, Hsim = Hcoef*informe["ganancia"], Hsim*informe["ganancia"]
+    informe["respuesta"] = (w*spec["fs"]/(2*pi), H, Hcoef, Hsim)
+    informe["frac"] = asarray(frac).tolist()
+    informe["coeficientes"] = q
+    return informe
+
+def Decibeles(H):
+    return 20*log10(npabs(H) + 1e-300)
+
+def EscribirJSON(resultados, archivo):
+    salida = []
+    for r in resultados:
+        d = {"spec": r["spec"], "fc": float(r["fc"]),
+             "costo": [{k: v if isinstance(v, str) else float(v) for k, v in c.items()} for c in r["costo"]]}
+        for k in ("taps", "secciones"):
+            if k in r:
+                d[k] = r[k].tolist()
+        if "respuesta" in r:
+            f, Hdb, Hphi = r["respuesta"]
+            d["respuesta"] = {"f": f.tolist(), "Hdb": Hdb.tolist(), "fase": Hphi.tolist()}
+        if "fijo" in r:
+            d["fijo"] = dict(r["fijo"])
+            if "coeficientes" in d["fijo"]:
+                d["fijo"]["coeficientes"] = d["fijo"]["coeficientes"].tolist()
+            if "respuesta" in d["fijo"]:
+                f, H, Hcoef, Hsim = d["fijo"]["respuesta"]
+                d["fijo"]["respuesta"] = {"f": f.tolist(), "Hdb": Decibeles(H).tolist(),
+                                          "Hdb_coef": Decibeles(Hcoef).tolist(), "Hdb_sim": Decibeles(Hsim).tolist(),
+                                          "fase_coef": angle(Hcoef).tolist(), "fase_sim": angle(Hsim).tolist()}
+        salida.append(d)
+    
+    if archivo == "-":
+        json.dump(salida, sys.stdout)
+    else:
+        with open(archivo, "w") as f:
+            json.dump(salida, f)
+
+def EscribirNPZ(resultados, archivo):
+    # Arrays named <index>_<field>, the specifications go as JSON text
+    arrays = {"specs": json.dumps([r["spec"] for r in resultados])}
+    for i, r in enumerate(resultados):
+        arrays["{}_fc".format(i)] = r["fc"]
+        arrays["{}_costo".format(i)] = json.dumps(r["costo"], default = float)
+        for k in ("taps", "secciones"):
+            if k in r:
+                arrays["{}_{}".format(i, k)] = r[k]
+        if "respuesta" in r:
+            for k, v in zip(("f", "Hdb", "fase"), r["respuesta"]):
+                arrays["{}_{}".format(i, k)] = v
+        if r.get("fijo", {}).get("bits"):
+            arrays["{}_fijo".format(i)] = r["fijo"]["coeficientes"]
+            arrays["{}_frac".format(i)] = r["fijo"]["frac"]
+            arrays["{}_bits".format(i)] = r["fijo"]["bits"]
+            # Complex responses of the float design, the quantized
+            # coefficients and the integer simulation
+            for k, v in zip(("f", "H", "Hcoef", "Hsim"), r["fijo"]["respuesta"]):
+                arrays["{}_fijo_{}".format(i, k)] = v
+    savez(archivo, **arrays)
+
+def EscribirArchivo(resultados, archivo):
+    from Resources.Archive import WriteArchive
+    WriteArchive(archivo, [(r["spec"],) + r["diseno"] for r in resultados])
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Diseña filtros sin interfaz gráfica")
+    parser.add_argument("specs", help = "archivo JSON o CSV con las especificaciones, - para JSON en la entrada estándar")
+    parser.add_argument("-o", "--salida", default = "-", help = "archivo .json, .npz o .fsd, - para JSON en la salida estándar")
+    parser.add_argument("--respuesta", action = "store_true", help = "incluye la respuesta en frecuencia")
+    parser.add_argument("--puntos", type = int, default = None, help = "puntos de la respuesta de FIR e IIR")
+    parser.add_argument("--bits", default = None, help = "cuantiza FIR e IIR a palabras de bits (16 es Q15, hasta 31), auto elige la palabra más corta que cumple")
+    args = parser.parse_args(argv)
+    # Longer words can wrap the 64 bit accumulator of the simulation
+    if args.bits not in (None, "auto") and not (args.bits.isdigit() and 2 <= int(args.bits) <= 31):
+        parser.error("--bits debe ser auto o una palabra de 2 a 31 bits")
+    
+    resultados = [Disenar(spec, args.respuesta, args.puntos, args.bits) for spec in LeerSpecs(args.specs)]
+    
+    if args.salida.lower().endswith(".npz"):
+        EscribirNPZ(resultados, args.salida)
+    elif args.salida.lower().endswith(".fsd"):
+        EscribirArchivo(resultados, args.salida)
+    else:
+        EscribirJSON(resultados, args.salida)
+
+if __name__ == "__main__":
+    main()
@@ -10,26 +10,60 @@ http://creativecommons.org/licenses/by/4.0/ or send a letter to
 Creative Commons, PO Box 1866, Mountain View, CA 94042, USA.
 """
 
-from numpy import pi
-from Resources.Filters import Filter
-from Resources.PFilter import frecResponse
-from Resources.DesignerGUI import Ui_MainWindow, QtWidgets
+from time import perf_counter
+from collections import namedtuple
+# Timings of the startup, printed with --tiempos
+TIEMPOS = [("inicio", perf_counter())]
+
+from numpy import pi, nanmedian, errstate
+TIEMPOS.append(("numpy", perf_counter()))
+from Resources.Filters import Filter, FIRS, IIRS
+from Resources.PFilter import frecResponse, GroupDelay, TapsDelay
+from Resources.Sections import SecArray
+from Resources.Cache import DesignCache
+from Resources.Trace import Trace
+TIEMPOS.append(("Filters, PFilter", perf_counter()))
+from Resources.Worker import DesignQueue
+from Resources.DesignerGUI import Ui_MainWindow, QtWidgets, QtCore, QtGui
+TIEMPOS.append(("PyQt5, DesignerGUI", perf_counter()))
+
+CANVAS = ("MagCanvas", "PhaseCanvas", "NyCanvas")
+# Frame of the tab of each canvas in DesignerGUI
+MARCOS = ("Mag_frame", "Phase_frame", "Nyquist_frame")
+# Specification of a design, it is the key of the cache and it goes with the
+# result so a result is painted with the values that produced it
+Espec = namedtuple("Espec", ("tipo", "Ap", "Ar", "fp", "fr", "fs", "HP", "IIR", "minfase"))
+
+def ReporteTiempos():
+    anterior = TIEMPOS[0][1]
+    for nombre, t in TIEMPOS[1:]:
+        print("{:<28}{:>9.1f} ms{:>10.1f} ms".format(nombre, (t - anterior)*1e3, (t - TIEMPOS[0][1])*1e3))
+        anterior = t
 
 class MainWindow(QtWidgets.QMainWindow, frecResponse):
     
-    def __init__(self, parent = None):
+    def __init__(self, parent = None, tiempos = False, traza = None):
         super().__init__(parent)
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
-        # Setup matplotlib canvas to hold four graphs in the given layout, with a toolbar
-        self.ui.MagCanvas.setupCanvas(toolbar = True)
-        self.ui.PhaseCanvas.setupCanvas(toolbar = True)
-        self.ui.NyCanvas.setupCanvas(toolbar = True)
+        # The matplotlib canvas are created when their tab is shown, the
+        # generated DesignerGUI only has their frames
+        for nombre in CANVAS:
+            setattr(self.ui, nombre, None)
+        self.tiempos = tiempos
+        self.Respuesta = None
+        # Phases of every design, exported to the file traza when it is given
+        self.traza = Trace(activo = traza is not None)
+        self.archivoTraza = traza
         
         self.opciones = {
             "Butterworth": Filter.Butterworth,
             "Chebyshev": Filter.Chebyshev,
+            "Chebyshev Inverso": Filter.InverseChebyshev,
+            "Eliptico": Filter.Elliptic,
+            "Auto": Filter.Auto,
             "FIR": Filter.FIR,
+            "Equiripple": Filter.Equiripple,
             }
         self.Tipo = self.opciones["FIR"]
         self.HPoLP = False
@@ -41,6 +75,13 @@ class MainWindow(QtWidgets.QMainWindow, frecResponse):
         self.fs = 5e+3
         self.cutf = float()
         self.Filtro = []
+        self.spec = None
+        self.costos = []
+        self.retardo = None
+        self.cache = DesignCache()
+        self.cola = DesignQueue(self.Disenar, self)
+        self.cola.resultado.connect(self.Resultado)
+        self.cola.fallo.connect(self.Fallo)
         
         self.ui.Ap.setMinimum(int(self.Ap))
         self.setAp()
@@ -58,11 +99,15 @@ class MainWindow(QtWidgets.QMainWindow, frecResponse):
         self.setfs()
         self.ui.fs.setMinimum(1)
         
-        self.Generar()
+        # The icon, matplotlib and the first design are loaded after the
+        # window is shown
+        QtCore.QTimer.singleShot(0, self.Iniciar)
         
+        self.ui.tabWidget.currentChanged.connect(self.MostrarTab)
         self.ui.Tfiltro.currentIndexChanged.connect(self.EN_DIS)
         self.ui.HP.stateChanged.connect(self.setHPoLP)
         self.ui.IIR.stateChanged.connect(self.EN_DIS)
+        self.ui.MinFase.stateChanged.connect(self.Generar)
         self.ui.Ap.valueChanged.connect(self.setAp)
         self.ui.Ar.valueChanged.connect(self.setAr)
         self.ui.fp.valueChanged.connect(self.setfp)
@@ -73,24 +118,70 @@ class MainWindow(QtWidgets.QMainWindow, frecResponse):
         self.ui.Ar_slider.sliderMoved.connect(self.Slider)
         self.ui.fr_slider.sliderMoved.connect(self.Slider)
         self.ui.fp_slider.sliderMoved.connect(self.Slider)
+        self.ui.Ap_slider.sliderReleased.connect(self.Generar)
+        self.ui.Ar_slider.sliderReleased.connect(self.Generar)
+        self.ui.fr_slider.sliderReleased.connect(self.Generar)
+        self.ui.fp_slider.sliderReleased.connect(self.Generar)
         
         
         
+    def Iniciar(self):
+        TIEMPOS.append(("ventana mostrada", perf_counter()))
+        # The embedded resources are registered when they are imported
+        import Resources.logo
+        self.setWindowIcon(QtGui.QIcon(":logo/igun.png"))
+        TIEMPOS.append(("recursos", perf_counter()))
+        self.Canvas(self.ui.tabWidget.currentIndex())
+        TIEMPOS.append(("matplotlib, canvas", perf_counter()))
+        if self.Respuesta is None:
+            self.Generar()
+        TIEMPOS.append(("primer diseño dibujado", perf_counter()))
+        if self.tiempos:
+            ReporteTiempos()
+    
+    def Canvas(self, indice):
+        canvas = getattr(self.ui, CANVAS[indice])
+        if canvas is None:
+            canvas = self.CrearCanvas(indice)
+            canvas.setupCanvas(toolbar = True)
+        return canvas
+    
+    def CrearCanvas(self, indice):
+        # matplotlib is imported with the first canvas
+        from Resources.Canvas import QMatplotlibCanvas
+        marco = getattr(self.ui, MARCOS[indice])
+        layout = QtWidgets.QGridLayout(marco)
+        canvas = QMatplotlibCanvas(marco)
+        canvas.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        canvas.setObjectName(CANVAS[indice])
+        layout.addWidget(canvas, 0, 0, 1, 1)
+        setattr(self.ui, CANVAS[indice], canvas)
+        return canvas
+    
+    def MostrarTab(self, indice):
+        nuevo = getattr(self.ui, CANVAS[indice]) is None
+        self.Canvas(indice)
+        if nuevo and self.Respuesta is not None:
+            self.Actualiza(indice, self.Respuesta)
+    
     def EN_DIS(self):
         key = self.ui.Tfiltro.currentText()
         self.Tipo = self.opciones[key]
-        if  (key == "Butterworth" or key == "Chebyshev") and (not self.ui.IIR.isChecked()):
+        if  (key in IIRS) and (not self.ui.IIR.isChecked()):
             self.ui.fs.setEnabled(False)
             self.ui.fs.setValue(0)
             self.ui.IIR.setEnabled(True)
-        elif (key == "Butterworth" or key == "Chebyshev") and (self.ui.IIR.isChecked()):
+            self.ui.MinFase.setEnabled(False)
+        elif (key in IIRS) and (self.ui.IIR.isChecked()):
             self.ui.fs.setEnabled(True)
             self.ui.fs.setValue(0)
             self.ui.IIR.setEnabled(True)
-        elif key == "FIR":
+            self.ui.MinFase.setEnabled(False)
+        elif key in FIRS:
             self.ui.fs.setEnabled(True)
             self.ui.fs.setValue(0)
             self.ui.IIR.setEnabled(False)
+            self.ui.MinFase.setEnabled(True)
     
     def setHPoLP(self):
         if self.ui.HP.isChecked():
@@ -126,28 +217,72 @@ class MainWindow(QtWidgets.QMainWindow, frecResponse):
     def setfs(self):
         self.fs = self.ui.fs.value()
         
+    def Disenar(self, key, Ap, Ar, fp, fr, fs, HP, IIR, minfase = False):
+        llave = Espec(key, Ap, Ar, fp, fr, fs, HP, IIR, minfase)
+        guardado = self.cache.get(llave)
+        if guardado is not None:
+            return guardado
+        
+        # The bilinear transform is done here so it is timed apart
+        with self.traza.fase("diseño"):
+            cutf, Filtro = Filter.Design(key, Ap, Ar, fp, fr, fs, HP, minfase = minfase)
+        if IIR and key not in FIRS:
+            with self.traza.fase("bilineal"):
+                Filtro = Filter.BilinearTF(fs, Filtro)
+        with self.traza.fase("respuesta"):
+            if key in FIRS:
+                Response = super().FIR(Filtro)
+            elif IIR:
+                Response = super().IIR(Filtro, cutf, fs)
+            else:
+                Response = super().Fltr(Filtro, cutf)
+            retardo = self.RetardoGrupo(llave, Filtro, Response)
+        # The cost model is evaluated once per design, painting only
+        # formats it
+        with self.traza.fase("costo"):
+            costos = self.Costos(llave, cutf, Filtro)
+        
+        resultado = (llave, cutf, Filtro, Response, costos, retardo)
+        self.cache.put(llave, resultado)
+        return resultado
+        
+    def Especificacion(self):
+        return Espec(self.ui.Tfiltro.currentText(), self.Ap, self.Ar, self.fp, self.fr,
+                     self.fs, self.HPoLP, self.ui.IIR.isChecked(), self.ui.MinFase.isChecked())
+    
     def Generar(self):
-        key = self.ui.Tfiltro.currentText()
+        self.cola.cancelar()
+        self.traza.reiniciar()
         try:
-            if key == "Butterworth" or key == "Chebyshev":
-                self.cutf, self.Filtro = self.Tipo(self.Ap, self.Ar, self.fp, self.fr,self.HPoLP)
-                if self.ui.IIR.isChecked():
-                    self.Filtro = Filter.BilinearTF(self.fs, self.Filtro)
-                    Response = super().IIR(self.Filtro, self.cutf, self.fs)
-                else:
-                    Response = super().Fltr(self.Filtro, self.cutf)      
-            elif key == "FIR":
-                self.cutf, self.Filtro = self.Tipo(self.Ap, self.Ar, self.fp, self.fr, self.fs, self.HPoLP)
-                Response = super().FIR(self.Filtro)
-            
+            self.Pintar(self.Disenar(*self.Especificacion()))
+        except Exception as e:
+            self.Fallo(e)
+    
+    def Resultado(self, resultado):
+        # While dragging a slider only the persistent artists are redrawn
+        try:
+            self.Pintar(resultado, completo = False)
+        except Exception as e:
+            self.Fallo(e)
+    
+    def Pintar(self, resultado, completo = True):
+        # Everything is painted with the specification of the result, a
+        # slider may already be somewhere else
+        self.spec, self.cutf, self.Filtro, Response, self.costos, self.retardo = resultado
+        with self.traza.fase("secciones"):
             self.MostrarSecciones()
-            self.ActualizaCanvas(Response)
-        
-        except ZeroDivisionError:
+        self.ActualizaCanvas(Response, completo)
+        if self.traza.activo:
+            self.statusBar().showMessage("{} | {}".format(self.traza.resumen(), self.cache.info()))
+        else:
+            self.statusBar().showMessage(self.cache.info())
+    
+    def Fallo(self, e):
+        if isinstance(e, ZeroDivisionError):
             self.MostrarSecciones("Seleccione numeros mayores que cero.")
-            
-        except Exception as e:
+        else:
             self.MostrarSecciones("Seleccione valores adecuados sin fuera de limite o que sobrepasen a las especificaciones.\n{}".format(e))
+        self.statusBar().showMessage(self.cache.info())
     
     def MostrarSecciones(self, mensaje = None):
         if mensaje:
@@ -155,98 +290,193 @@ class MainWindow(QtWidgets.QMainWindow, frecResponse):
         else:
             mensaje = "Secciones del Filtro: {}\n".format(len(self.Filtro))
             
-            key = self.ui.Tfiltro.currentText()
-            if key == "Butterworth" or key == "Chebyshev":
-                for sec in self.Filtro:
-                    mensaje += "{}\n".format(sec)
-            elif key == "FIR":
-                mensaje += "["
-                for sec in self.Filtro:
-                    if sec != self.Filtro[-1]:
-                        mensaje += "{}, ".format(sec)
-                    else:
-                        mensaje += "{}".format(sec)
-                mensaje += "]"
+            spec = self.spec
+            key = spec.tipo
+            if key == "Auto":
+                mensaje += "Familia: {}\n".format(Filter.AutoFamily(spec.Ap, spec.Ar, spec.fp, spec.fr))
+            # Cost is already imported by the design of the result
+            from Resources.Cost import Summary
+            mensaje += "".join("Costo {}\n".format(Summary(c)) for c in self.costos)
+            if key in IIRS:
+                for sec, fos in zip(self.Filtro, self.Filtro.fos):
+                    mensaje += "{} {}\n".format("FOS" if fos else "SOS", sec)
+            elif key in FIRS:
+                if key == "Equiripple":
+                    ventana, taps, ahorro = Filter.TapSavings(spec.Ap, spec.Ar, spec.fp, spec.fr, spec.fs, self.Filtro)
+                    mensaje += "Taps: {} (ventana: {}, {:.0%} menos)\n".format(taps, ventana, ahorro)
+                # The taps of linear phase filters repeat, so they are joined by position
+                mensaje += "[" + ", ".join("{}".format(sec) for sec in self.Filtro) + "]"
             
         self.ui.plainTextEdit.setPlainText(mensaje)
         
-    def ActualizaCanvas(self, Response):
-        self.ActualizaMag((Response[0],Response[1]))
-        self.ActualizaFas((Response[0], Response[2]))
-        self.ActualizaNy(Response[3])
+    def Costos(self, spec, cutf, Filtro):
+        # The cost model needs scipy.signal, it is imported with the first design
+        from Resources import Cost
+        if spec.tipo in FIRS:
+            return Cost.Realizations(Filtro, spec.fs)
+        return [Cost.Cost(Filtro, cutf, spec.fs, spec.IIR)]
+    
+    def ActualizaCanvas(self, Response, completo = True):
+        self.Respuesta = Response
+        self.Canvas(self.ui.tabWidget.currentIndex())
+        # Only the canvas already created are drawn
+        for indice, nombre in enumerate(CANVAS):
+            if getattr(self.ui, nombre) is not None:
+                self.Actualiza(indice, Response, completo)
+    
+    def Actualiza(self, indice, Response, completo = True):
+        with self.traza.fase(CANVAS[indice]):
+            self._Actualiza(indice, Response, completo)
+    
+    def _Actualiza(self, indice, Response, completo):
+        if indice == 0:
+            self.ActualizaMag((Response[0],Response[1]), completo)
+        elif indice == 1:
+            self.ActualizaFas((Response[0], Response[2]), completo)
+        elif indice == 2:
+            self.ActualizaNy(Response[3], completo)
+    
+    def Frecuencias(self, w):
+        key = self.spec.tipo
+        if key in IIRS:
+            return w, self.cutf
+        elif key in FIRS:
+            return w*self.spec.fs/(2*pi), self.cutf*self.spec.fs/(2*pi)
+    
+    def RetardoGrupo(self, spec, Filtro, Response):
+        # Group delay in samples of the digital designs and in ms of the
+        # analog ones over the frequencies of the response, and its median
+        # in the pass band, -3 dB of the maximum
+        if spec.tipo in FIRS:
+            gd, unidad = TapsDelay(Filtro)[1], "muestras"
+        elif spec.IIR:
+            gd, unidad = GroupDelay(SecArray(Filtro, analog = False), 2*pi*Response[0]/spec.fs, analog = False), "muestras"
+        else:
+            gd, unidad = 1e3*GroupDelay(SecArray(Filtro), 2*pi*Response[0]), "ms"
+        with errstate(invalid = 'ignore'):
+            retardo = nanmedian(gd[Response[1] >= Response[1].max() - 3])
+        return gd, unidad, retardo
+    
+    def ActualizaMag(self, Response, completo = True):
+        spec = self.spec
+        key = spec.tipo
+        canvas = self.ui.MagCanvas
+        ax = canvas.axes[0]
+        f, fc = self.Frecuencias(Response[0])
         
-    def ActualizaMag(self, Response):
-        key = self.ui.Tfiltro.currentText()
-        ax = self.ui.MagCanvas.axes[0]
-        ax.clear()
-        #ax.semilogx(Response[0], Response[1])
-        if key == "Butterworth" or key == "Chebyshev":
-            ax.semilogx(Response[0], Response[1])
-            ax.axis([2*self.cutf*.1,self.cutf*10/2,-self.Ar-self.Ar/2,10])
-            ax.axvline(self.cutf,linestyle=':',c='r',label='$f_c = ${}'.format(round(self.cutf,2)))
-            ax.axvline(self.fr,linestyle=':',c='g',label='$f_r = ${}'.format(round(self.fr,2)))
-            ax.axvline(self.fp,linestyle=':',c='c',label='$f_p = ${}'.format(round(self.fp,2)))
-            
-        elif key == "FIR":
-            fc = self.cutf*self.fs/(2*pi)
-            ax.semilogx(Response[0]*self.fs/(2*pi), Response[1])
-            ax.axis([.3*fc,fc*10/2,-self.Ar-self.Ar/2,10])
-            ax.axvline(fc,linestyle=':',c='r',label='$f_c = ${}'.format(round(fc,2)))
-            ax.axvline(self.fr,linestyle=':',c='g',label='$f_r = ${}'.format(round(self.fr,2)))
-            ax.axvline(self.fp,linestyle=':',c='c',label='$f_p = ${}'.format(round(self.fp,2)))
-        
-        ax.set_xlabel("f ($Hz$)")
-        ax.axhline(-self.Ap,linestyle=':',c='c',label='$Ap = $ {}'.format(-self.Ap))
-        ax.axhline(-self.Ar,linestyle=':',c='g',label='$Ar = $ {}'.format(-self.Ar))
-        ax.axhline(-3,linestyle=':',c='r',label='-3 dB')
-        ax.set_ylabel("Gain ($dB$)")
-        ax.legend()
-        ax.grid()
-        self.ui.MagCanvas.draw()
-    
-    def ActualizaFas(self, Response):
+        if completo or not canvas.artistas:
+            ax.clear()
+            canvas.limpiar()
+            canvas.animar('H', ax.semilogx(f, Response[1])[0])
+            if key in IIRS:
+                ax.axis([2*fc*.1,fc*10/2,-spec.Ar-spec.Ar/2,10])
+            elif key in FIRS:
+                ax.axis([.3*fc,fc*10/2,-spec.Ar-spec.Ar/2,10])
+            canvas.animar('fc', ax.axvline(fc,linestyle=':',c='r',label='$f_c = ${}'.format(round(fc,2))))
+            canvas.animar('fr', ax.axvline(spec.fr,linestyle=':',c='g',label='$f_r = ${}'.format(round(spec.fr,2))))
+            canvas.animar('fp', ax.axvline(spec.fp,linestyle=':',c='c',label='$f_p = ${}'.format(round(spec.fp,2))))
+            ax.set_xlabel("f ($Hz$)")
+            canvas.animar('Ap', ax.axhline(-spec.Ap,linestyle=':',c='c',label='$Ap = $ {}'.format(-spec.Ap)))
+            canvas.animar('Ar', ax.axhline(-spec.Ar,linestyle=':',c='g',label='$Ar = $ {}'.format(-spec.Ar)))
+            ax.axhline(-3,linestyle=':',c='r',label='-3 dB')
+            ax.set_ylabel("Gain ($dB$)")
+            # The legend is part of the background, it is renewed when the
+            # slider is released
+            ax.legend()
+            ax.grid()
+            canvas.draw()
+        else:
+            canvas.artistas['H'].set_data(f, Response[1])
+            canvas.artistas['fc'].set_xdata([fc, fc])
+            canvas.artistas['fr'].set_xdata([spec.fr, spec.fr])
+            canvas.artistas['fp'].set_xdata([spec.fp, spec.fp])
+            canvas.artistas['Ap'].set_ydata([-spec.Ap, -spec.Ap])
+            canvas.artistas['Ar'].set_ydata([-spec.Ar, -spec.Ar])
+            canvas.redibujar()
+    
+    def ActualizaFas(self, Response, completo = True):
         
-        key = self.ui.Tfiltro.currentText()
-        ax = self.ui.PhaseCanvas.axes[0]
-        ax.clear()
-        if key == "Butterworth" or key == "Chebyshev":
-            ax.semilogx(Response[0], Response[1]*180/pi)
-            ax.axis([2*self.cutf*.1,self.cutf*10/2,-200,200])
-            ax.axvline(self.cutf,linestyle=':',c='r',label='$f_c = ${}'.format(round(self.cutf,2)))
-            
-        elif key == "FIR":
-            fc = self.cutf*self.fs/(2*pi)
-            ax.semilogx(Response[0]*self.fs/(2*pi), Response[1]*180/pi)
-            ax.axis([.3*fc,fc*10/2,-200,200])
-            ax.axvline(fc,linestyle=':',c='r',label='$f_c = ${}'.format(round(fc,2)))
-        
-        ax.set_xlabel("f ($Hz$)")
-        ax.set_ylabel("Phase ($deg$)")
-        ax.legend()
-        ax.grid()
-        self.ui.PhaseCanvas.draw()
-        
-    def ActualizaNy(self,Response):
-        ax = self.ui.NyCanvas.axes[0]
-        ax.clear()
-        ax.plot(Response.imag,Response.real, c = "#FF8300")
-        ax.plot(Response.imag,-Response.real, c = "#FF8300")
-        ax.set_xlabel("Real")
-        ax.set_ylabel("Imag")
-        ax.grid()
-        self.ui.NyCanvas.draw()
+        key = self.spec.tipo
+        canvas = self.ui.PhaseCanvas
+        ax = canvas.axes[0]
+        f, fc = self.Frecuencias(Response[0])
+        # Computed with the response of the result, see RetardoGrupo
+        gd, unidad, retardo = self.retardo
+        
+        # The group delay goes in a second y axis that shares the frequencies
+        if len(canvas.axes) == 1:
+            canvas.axes.append(ax.twinx())
+        axgd = canvas.axes[1]
+        
+        if completo or not canvas.artistas:
+            ax.clear()
+            axgd.clear()
+            # clear forgets that the twin axis is on the right
+            axgd.yaxis.tick_right()
+            axgd.yaxis.set_label_position('right')
+            axgd.patch.set_visible(False)
+            canvas.limpiar()
+            canvas.animar('H', ax.semilogx(f, Response[1]*180/pi)[0])
+            canvas.animar('gd', axgd.semilogx(f, gd, c='m', label='retardo de grupo = {:.4g} {}'.format(retardo, unidad))[0])
+            if key in IIRS:
+                ax.axis([2*fc*.1,fc*10/2,-200,200])
+            elif key in FIRS:
+                ax.axis([.3*fc,fc*10/2,-200,200])
+            axgd.set_ylim(0, 2*retardo if retardo > 0 else 1)
+            canvas.animar('fc', ax.axvline(fc,linestyle=':',c='r',label='$f_c = ${}'.format(round(fc,2))))
+            ax.set_xlabel("f ($Hz$)")
+            ax.set_ylabel("Phase ($deg$)")
+            axgd.set_ylabel("Group delay ({})".format(unidad))
+            axgd.legend(handles = [canvas.artistas['fc'], canvas.artistas['gd']])
+            ax.grid()
+            canvas.draw()
+        else:
+            canvas.artistas['H'].set_data(f, Response[1]*180/pi)
+            canvas.artistas['gd'].set_data(f, gd)
+            canvas.artistas['fc'].set_xdata([fc, fc])
+            canvas.redibujar()
+        
+    def ActualizaNy(self, Response, completo = True):
+        canvas = self.ui.NyCanvas
+        ax = canvas.axes[0]
+        
+        if completo or not canvas.artistas:
+            ax.clear()
+            canvas.limpiar()
+            canvas.animar('H', ax.plot(Response.imag,Response.real, c = "#FF8300")[0])
+            canvas.animar('Hc', ax.plot(Response.imag,-Response.real, c = "#FF8300")[0])
+            ax.set_xlabel("Real")
+            ax.set_ylabel("Imag")
+            ax.grid()
+            canvas.draw()
+        else:
+            canvas.artistas['H'].set_data(Response.imag, Response.real)
+            canvas.artistas['Hc'].set_data(Response.imag, -Response.real)
+            canvas.redibujar()
     
     def Slider(self):
         self.Ap = 2*self.Ap_max*self.ui.Ap_slider.value()/100
         self.Ar = self.ui.Ar_slider.value()
         self.fp = self.ui.fp_slider.value()
         self.fr = self.ui.fr_slider.value()
-        self.Generar()
+        self.traza.reiniciar()
+        self.cola.solicitar(*self.Especificacion())
+    
+    def closeEvent(self, event):
+        if self.archivoTraza:
+            self.traza.exportar(self.archivoTraza)
+        super().closeEvent(event)
 
 
 if __name__ == "__main__":
     import sys
     app = QtWidgets.QApplication(sys.argv)
-    w = MainWindow()
+    # --traza [archivo] shows the phases in the status bar and writes them
+    # to archivo (traza.json by default) when the window is closed
+    traza = None
+    if "--traza" in sys.argv:
+        i = sys.argv.index("--traza") + 1
+        traza = sys.argv[i] if i < len(sys.argv) and not sys.argv[i].startswith("--") else "traza.json"
+    w = MainWindow(tiempos = "--tiempos" in sys.argv, traza = traza)
     w.show()
     sys.exit(app.exec_())
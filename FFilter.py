@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:41:09 2026
+
+Applies a Filter Studio design to a raw sample file without loading it in
+memory, the design takes the same parameters of the GUI. Example:
+
+    python FFilter.py entrada.raw salida.raw --tipo Butterworth --fs 48000
+        --fp 1000 --fr 2000 --dtype int16 --canales 2
+"""
+
+import argparse
+from Resources.Filters import Filter
+from Resources.FileFilter import FilterFile
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Filtra un archivo de muestras crudas con un diseño de Filter Studio")
+    parser.add_argument("entrada", help = "archivo de muestras entrelazadas")
+    parser.add_argument("salida", help = "archivo filtrado, mismo tipo y canales")
+    parser.add_argument("--tipo", default = "FIR", choices = ["FIR", "Equiripple", "Butterworth", "Chebyshev",
+                                                                "Chebyshev Inverso", "Eliptico", "Auto"])
+    parser.add_argument("--Ap", type = float, default = 1)
+    parser.add_argument("--Ar", type = float, default = 60)
+    parser.add_argument("--fp", type = float, default = 1e+3)
+    parser.add_argument("--fr", type = float, default = 1.5e+3)
+    parser.add_argument("--fs", type = float, default = 5e+3)
+    parser.add_argument("--HP", action = "store_true", help = "paso altas")
+    parser.add_argument("--minfase", action = "store_true", help = "FIR de fase mínima, menor retardo")
+    parser.add_argument("--dtype", default = "float32", help = "int16, float32, ...")
+    parser.add_argument("--canales", type = int, default = 1)
+    parser.add_argument("--bloque", type = int, default = 2**16, help = "frames por bloque")
+    parser.add_argument("--metodo", default = "auto", choices = ["auto", "directo", "ols", "ola"])
+    parser.add_argument("--offset", type = int, default = 0, help = "bytes de encabezado")
+    args = parser.parse_args(argv)
+    
+    # The analog families are always digitalized to filter samples
+    cutf, Filtro = Filter.Design(args.tipo, args.Ap, args.Ar, args.fp, args.fr,
+                                 args.fs, args.HP, IIR = True, minfase = args.minfase)
+    muestras, segundos = FilterFile(args.entrada, args.salida, Filtro, args.dtype,
+                                    args.canales, args.bloque, args.metodo, args.offset)
+    
+    print("{} muestras en {:.3f} s: {:.0f} muestras/s".format(
+        muestras, segundos, muestras/segundos if segundos else float('inf')))
+
+if __name__ == "__main__":
+    main()
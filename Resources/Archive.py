@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 19:41:07 2026
+
+Compact binary archive of designs, memory-mapped with an index of the
+specifications
+"""
+
+import json
+from numpy import asarray, zeros, dtype, memmap, frombuffer, float64, uint8, ones
+from Resources.Sections import SecArray, SectionBank
+
+MAGIC = b"FLTRSTDO"
+VERSION = 3
+
+# Header: magic, version, number of designs, then offset and length in bytes
+# of the index, the coefficients, the lengths of the polynomials and the
+# metadata
+CABECERA = dtype([("magic", "S8"), ("version", "<u4"), ("n", "<u4"),
+                  ("indice", "<u8", 2), ("datos", "<u8", 2),
+                  ("formas", "<u8", 2), ("meta", "<u8", 2)])
+
+# One record per design. inicio and filas locate the coefficients: filas
+# rows of 6 for sections, filas taps for FIR. The lengths (num, den) of the
+# polynomials of the sections start at inicio_forma. tipo holds up to TIPO
+# bytes of the name of the family
+TIPO = 32
+INDICE = dtype([("tipo", "S{}".format(TIPO)), ("Ap", "<f8"), ("Ar", "<f8"), ("fp", "<f8"),
+                ("fr", "<f8"), ("fs", "<f8"), ("HP", "?"), ("IIR", "?"), ("minfase", "?"),
+                ("analogico", "?"), ("secciones", "?"), ("fc", "<f8"),
+                ("inicio", "<u8"), ("filas", "<u8"), ("inicio_forma", "<u8")])
+
+CAMPOS = ("tipo", "Ap", "Ar", "fp", "fr", "fs", "HP", "IIR", "minfase")
+
+def _alinea(n, a = 8):
+    return -(-n//a)*a
+
+def WriteArchive(archivo, disenos, meta = None):
+    '''
+    Write designs to a binary archive
+
+    Parameters
+    ----------
+    archivo : str
+        Path of the archive
+    disenos : iterable
+        Tuples (spec, fc, Filtro): spec is a dict with the parameters of
+        Filter.Design (tipo, Ap, Ar, fp, fr, fs, HP, IIR, minfase), fc and
+        Filtro are its outputs
+    meta : dict, optional
+        Metadata of the archive, saved as JSON. The default is None.
+
+    Returns
+    -------
+    n : int
+        Number of designs written
+
+    Raises
+    ------
+    ValueError
+        If the name of a family does not fit in the TIPO bytes of the index.
+
+    '''
+    disenos = list(disenos)
+    indice = zeros(len(disenos), dtype = INDICE)
+    bloques, formas = [], []
+    inicio = inicio_forma = 0
+    for i, (spec, fc, Filtro) in enumerate(disenos):
+        registro = indice[i]
+        tipo = spec["tipo"].encode()
+        if len(tipo) > TIPO:
+            raise ValueError("El tipo {} no cabe en {} bytes".format(spec["tipo"], TIPO))
+        for campo in CAMPOS:
+            registro[campo] = spec.get(campo, 0) if campo != "tipo" else tipo
+        registro["fc"] = fc
+        registro["secciones"] = isinstance(Filtro, (SectionBank, list, tuple))
+        registro["analogico"] = registro["secciones"] and not registro["IIR"]
+        if registro["secciones"]:
+            coef = SecArray(Filtro, analog = bool(registro["analogico"])).ravel()
+            forma = asarray([(len(num), len(den)) for num, den in Filtro], dtype = uint8).ravel()
+            registro["filas"] = len(Filtro)
+        else:
+            coef = asarray(Filtro, dtype = float64).ravel()
+            forma = zeros(0, dtype = uint8)
+            registro["filas"] = len(coef)
+        registro["inicio"] = inicio
+        registro["inicio_forma"] = inicio_forma
+        bloques.append(coef)
+        formas.append(forma)
+        inicio += len(coef)
+        inicio_forma += len(forma)
+
+    texto = json.dumps(meta or {}).encode()
+    cabecera = zeros(1, dtype = CABECERA)
+    pos = _alinea(CABECERA.itemsize)
+    partes = []
+    for nombre, contenido in (("indice", indice.tobytes()),
+                              ("datos", b"".join(b.astype("<f8").tobytes() for b in bloques)),
+                              ("formas", b"".join(f.tobytes() for f in formas)),
+                              ("meta", texto)):
+        cabecera[0][nombre] = (pos, len(contenido))
+        partes.append((pos, contenido))
+        pos = _alinea(pos + len(contenido))
+    cabecera[0]["magic"] = MAGIC
+    cabecera[0]["version"] = VERSION
+    cabecera[0]["n"] = len(disenos)
+
+    with open(archivo, "wb") as f:
+        f.write(cabecera.tobytes())
+        for inicio, contenido in partes:
+            f.seek(inicio)
+            f.write(contenido)
+        f.truncate(pos)
+    return len(disenos)
+
+class DesignArchive:
+    """
+    Read only view of an archive written by WriteArchive. The index and the
+    coefficients are memory-mapped, opening an archive reads only the
+    header and the metadata, and a design is read from disk when it is
+    used.
+    """
+    def __init__(self, archivo):
+        '''
+        Parameters
+        ----------
+        archivo : str
+            Path of the archive
+
+        '''
+        self.archivo = archivo
+        with open(archivo, "rb") as f:
+            cabecera = frombuffer(f.read(CABECERA.itemsize), dtype = CABECERA)[0]
+            if cabecera["magic"] != MAGIC:
+                raise ValueError("{} no es un archivo de diseños".format(archivo))
+            if cabecera["version"] != VERSION:
+                raise ValueError("Versión {} no soportada".format(cabecera["version"]))
+            pos, largo = cabecera["meta"]
+            f.seek(pos)
+            self.meta = json.loads(f.read(int(largo)).decode() or "{}")
+
+        self.n = int(cabecera["n"])
+        self.indice = self._mapa(cabecera["indice"], INDICE)
+        self.datos = self._mapa(cabecera["datos"], dtype("<f8"))
+        self.formas = self._mapa(cabecera["formas"], dtype(uint8))
+
+    def _mapa(self, seccion, tipo):
+        pos, largo = (int(v) for v in seccion)
+        if largo == 0:
+            return zeros(0, dtype = tipo)
+        return memmap(self.archivo, dtype = tipo, mode = "r", offset = pos, shape = (largo//tipo.itemsize,))
+
+    def __len__(self):
+        return self.n
+
+    def spec(self, i):
+        '''
+        Returns the specification of the design i as a dict
+        '''
+        registro = self.indice[i]
+        spec = {campo: registro[campo].item() for campo in CAMPOS}
+        spec["tipo"] = registro["tipo"].decode()
+        return spec
+
+    def coefficients(self, i):
+        '''
+        View without copy of the coefficients of the design i: Array (n, 6)
+        of sections (see SecArray) or the taps of a FIR filter
+        '''
+        registro = self.indice[i]
+        inicio, filas = int(registro["inicio"]), int(registro["filas"])
+        if registro["secciones"]:
+            return self.datos[inicio:inicio + 6*filas].reshape(filas, 6)
+        return self.datos[inicio:inicio + filas]
+
+    def __getitem__(self, i):
+        '''
+        Returns (spec, fc, Filtro) of the design i, Filtro has the format of
+        the outputs of Filter: a SectionBank over the mapped coefficients,
+        without copies, or the taps
+        '''
+        registro = self.indice[i]
+        coef = self.coefficients(i)
+        if registro["secciones"]:
+            inicio = int(registro["inicio_forma"])
+            formas = self.formas[inicio:inicio + 2*len(coef)].reshape(-1, 2)
+            # A denominator of two coefficients is a FOS
+            Filtro = SectionBank(coef, formas[:, 1] == 2, bool(registro["analogico"]))
+        else:
+            Filtro = asarray(coef)
+        return self.spec(i), float(registro["fc"]), Filtro
+
+    def __iter__(self):
+        for i in range(self.n):
+            yield self[i]
+
+    def find(self, **spec):
+        '''
+        Indices of the designs whose specification matches all the given
+        fields, the search is a vectorized comparison over the index
+
+            archivo.find(tipo = "Butterworth", fp = 1000)
+
+        '''
+        mascara = ones(self.n, dtype = bool)
+        for campo, valor in spec.items():
+            if campo not in CAMPOS:
+                raise ValueError("Campo desconocido: {}".format(campo))
+            if campo == "tipo":
+                valor = valor.encode()
+            mascara &= self.indice[campo] == valor
+        return mascara.nonzero()[0]
+
+    def lookup(self, **spec):
+        '''
+        First design that matches the specification (see find), None if no
+        design matches
+        '''
+        encontrados = self.find(**spec)
+        if len(encontrados) == 0:
+            return None
+        return self[int(encontrados[0])]
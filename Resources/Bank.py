@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 20:17:25 2026
+
+Octave and fractional octave filter banks designed in one vectorized pass
+and applied to a signal in one pass over its blocks
+"""
+
+from numpy import asarray, arange, ceil, floor, log10, pi, tan, sqrt, abs as npabs
+from numpy import zeros, empty, where, inf, minimum, concatenate, stack, mean
+from scipy.signal import sosfilt
+from Resources.Filters import Filter
+from Resources.Stream import StreamFilter
+
+# Octave ratio of base 10 of IEC 61260
+G = 10**(3/10)
+
+def OctaveBands(fraccion = 1, fmin = 20, fmax = 20e+3, fref = 1e+3):
+    '''
+    Center and edge frequencies of the bands of 1/fraccion octave between
+    fmin and fmax, the bands are aligned to fref like IEC 61260
+
+    Parameters
+    ----------
+    fraccion : int, optional
+        Bands per octave, 1 for octaves and 3 for third octaves. The
+        default is 1.
+    fmin : float, optional
+        Lowest center frequency in hz. The default is 20.
+    fmax : float, optional
+        Highest center frequency in hz. The default is 20e+3.
+    fref : float, optional
+        Reference frequency in hz. The default is 1e+3.
+
+    Returns
+    -------
+    fm : Array
+        Center frequencies
+    f1 : Array
+        Lower edges
+    f2 : Array
+        Upper edges
+
+    '''
+    b = int(fraccion)
+    # Odd fractions have a band centered at fref, even ones have an edge
+    desfase = 0 if b % 2 else .5
+    xmin = int(ceil(b*log10(fmin/fref)/log10(G) - desfase))
+    xmax = int(floor(b*log10(fmax/fref)/log10(G) - desfase))
+    x = arange(xmin, xmax + 1)
+    fm = fref*G**((x + desfase)/b)
+    return fm, fm*G**(-1/(2*b)), fm*G**(1/(2*b))
+
+def LowPassToBandPass(sec, w0):
+    '''
+    Transform analog low pass sections into band pass sections with
+    s -> (s^2 + w0^2)/s, each section gives two sections. The pass band
+    edge of the low pass prototype becomes the bandwidth of the band pass
+    filter
+
+    Parameters
+    ----------
+    sec : Array
+        Array (n, S, 6) of analog low pass sections of ButterworthBatch or
+        ChebyshevBatch, unity sections are kept as unity sections
+    w0 : Array
+        Center angular frequency of each filter, geometric mean of the edges
+
+    Returns
+    -------
+    bp : Array
+        Array (n, 2S, 6) of analog band pass sections
+
+    '''
+    sec = asarray(sec, dtype = float)
+    w0 = asarray(w0, dtype = float)[:, None]
+    isSOS = sec[..., 3] != 0
+    isFOS = ~isSOS & (sec[..., 4] != 0)
+
+    # Pole of the low pass section, each one gives two band pass poles, the
+    # roots of s^2 - p s + w0^2
+    p = where(isSOS, (-sec[..., 4] + sqrt(sec[..., 4]**2 - 4*sec[..., 5] + 0j))/2, -sec[..., 5])
+    d = sqrt(p**2 - 4*w0**2)
+    q1, q2 = (p + d)/2, (p - d)/2
+
+    bp = zeros(sec.shape[:2] + (2, 6))
+    # Unity section for padding
+    bp[..., 2] = 1
+    bp[..., 5] = 1
+    # A SOS gives the conjugate pairs of q1 and q2, its gain is split
+    g = sqrt(npabs(sec[..., 2]))
+    for j, q in enumerate((q1, q2)):
+        bp[..., j, :] = where(isSOS[..., None],
+                              stack((zeros(q.shape), g, zeros(q.shape), zeros(q.shape) + 1,
+                                     -2*q.real, npabs(q)**2), axis = -1),
+                              bp[..., j, :])
+    # A FOS gives one SOS with the real pole and a unity section
+    FOS = stack((zeros(p.shape), sec[..., 2], zeros(p.shape), zeros(p.shape) + 1,
+                 sec[..., 5], zeros(p.shape) + w0**2), axis = -1)
+    bp[..., 0, :] = where(isFOS[..., None], FOS, bp[..., 0, :])
+    return bp.reshape(sec.shape[0], -1, 6)
+
+def OctaveBank(fs, fraccion = 1, fmin = 20, fmax = 20e+3, Ap = 3, Ar = 40, tipo = "Butterworth", fref = 1e+3):
+    '''
+    Design a bank of band pass filters of 1/fraccion octave. Every band is
+    designed at once: the low pass prototypes with ButterworthBatch or
+    ChebyshevBatch, the band pass transformation and BilinearTFBatch. The
+    edges are prewarped, so the digital bands have Ap decibels of
+    attenuation at their edges and at least Ar decibels at the centers of
+    the neighbour bands. Bands above fs/2 are dropped.
+
+    Parameters
+    ----------
+    fs : float
+        Sample rate in hz
+    fraccion : int, optional
+        Bands per octave. The default is 1.
+    fmin, fmax : float, optional
+        Range of the center frequencies in hz. The default is 20 to 20e+3.
+    Ap : float, optional
+        Attenuation at the edges of a band in decibels. The default is 3.
+    Ar : float, optional
+        Attenuation at the centers of the neighbour bands in decibels. The
+        default is 40.
+    tipo : str, optional
+        "Butterworth" or "Chebyshev". The default is "Butterworth".
+    fref : float, optional
+        Reference frequency of the bands. The default is 1e+3.
+
+    Returns
+    -------
+    fm : Array
+        Center frequency of each band
+    IIR : Array
+        Array (bands, S, 6) of digital sections [b0, b1, b2, a0, a1, a2] of
+        each band (see BilinearTFBatch)
+
+    '''
+    familias = {"Butterworth": Filter.ButterworthBatch,
+                "Chebyshev": Filter.ChebyshevBatch,
+                }
+    if tipo not in familias:
+        raise ValueError("Tipo de filtro desconocido: {}".format(tipo))
+
+    fm, f1, f2 = OctaveBands(fraccion, fmin, fmax, fref)
+    validas = f2 < fs/2
+    if not validas.any():
+        raise ValueError("Ninguna banda cabe debajo de fs/2")
+    fm, f1, f2 = fm[validas], f1[validas], f2[validas]
+
+    def prewarp(f):
+        return where(f < fs/2, 2*fs*tan(pi*minimum(f, fs/2)/fs), inf)
+    w1, w2 = prewarp(f1), prewarp(f2)
+    w0, B = sqrt(w1*w2), w2 - w1
+    # Frequency of the prototype where the neighbour centers fall
+    wa, wb = prewarp(fm/G**(1/fraccion)), prewarp(fm*G**(1/fraccion))
+    Wa = npabs(wa**2 - w0**2)/wa
+    # An upper neighbour beyond fs/2 is rejected by the bilinear transform
+    Wb = where(wb < inf, npabs(wb**2 - w0**2)/minimum(wb, 1e300), inf)
+    Wr = minimum(Wa, Wb)
+
+    N, fc, sec, fos = familias[tipo](Ap, Ar, B/(2*pi), Wr/(2*pi))
+    return fm, Filter.BilinearTFBatch(fs, LowPassToBandPass(sec, w0))
+
+class BankStream(StreamFilter):
+    """
+    Stream filter of a bank: every block is filtered by all the bands, the
+    output has the bands in axis 1, (time, bands) or (time, bands,
+    channels). The state of every band is kept between blocks. The unity
+    sections that pad the bands of lower order are not filtered.
+    """
+    def __init__(self, IIR):
+        '''
+        Parameters
+        ----------
+        IIR : Array
+            Array (bands, S, 6) of digital sections, like OctaveBank
+
+        '''
+        super().__init__()
+        sos = asarray(IIR, dtype = float)
+        sos = sos/sos[..., 3:4]
+        # One Array (n, 6) per band without the padding [1, 0, 0, 1, 0, 0]
+        unidad = (sos == [1, 0, 0, 1, 0, 0]).all(axis = -1)
+        self.sos = [banda[~u] if not u.all() else banda[:1] for banda, u in zip(sos, unidad)]
+
+    def initial(self, canales):
+        return [zeros((len(sos), 2) + canales) for sos in self.sos]
+
+    def kernel(self, x):
+        y = empty((x.shape[0], len(self.sos)) + x.shape[1:])
+        zi = [None]*len(self.sos)
+        for b in range(len(self.sos)):
+            y[:, b], zi[b] = sosfilt(self.sos[b], x, axis = 0, zi = self.zi[b])
+        return y, zi
+
+def FilterBank(IIR, x):
+    '''
+    Filter a signal with every band of a bank
+
+    Returns
+    -------
+    y : Array
+        Output with the bands in axis 1
+    '''
+    return BankStream(IIR).process(x)
+
+def BandLevels(y, referencia = 1.):
+    '''
+    Level of every band of the output of a bank in decibels relative to
+    referencia RMS
+    '''
+    return 10*log10(mean(asarray(y)**2, axis = 0)/referencia**2 + 1e-300)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:02:10 2026
+
+LRU cache for the designs and responses computed by the GUI
+"""
+
+from collections import OrderedDict
+from sys import getsizeof
+from threading import Lock
+
+def Tamano(obj):
+    '''
+    Aproximate size in bytes of a design or a response: NumPy arrays count
+    their buffer and lists/tuples are traversed recursively
+
+    Parameters
+    ----------
+    obj : object
+        The object to measure
+
+    Returns
+    -------
+    size : int
+        Aproximate size in bytes
+
+    '''
+    if hasattr(obj, 'nbytes'):
+        return int(obj.nbytes)
+    if isinstance(obj, (list, tuple)):
+        return getsizeof(obj) + sum(Tamano(o) for o in obj)
+    return getsizeof(obj)
+
+class DesignCache:
+    """
+    Least recently used cache bounded by number of entries and by memory,
+    it can be shared with the design worker thread
+    """
+    def __init__(self, maxsize = 256, maxbytes = 64*2**20):
+        '''
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of entries. The default is 256.
+        maxbytes : int, optional
+            Maximum aproximate memory of all the entries in bytes.
+            The default is 64 MiB.
+
+        '''
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._datos = OrderedDict()
+        self._lock = Lock()
+    
+    def __len__(self):
+        return len(self._datos)
+    
+    def __contains__(self, key):
+        return key in self._datos
+    
+    def get(self, key):
+        '''
+        Returns the value of key and marks it as the most recently used,
+        None if key is not in the cache
+        '''
+        with self._lock:
+            if key in self._datos:
+                self._datos.move_to_end(key)
+                self.hits += 1
+                return self._datos[key][0]
+            self.misses += 1
+            return None
+    
+    def put(self, key, value):
+        '''
+        Stores value with key, the least recently used entries are discarded
+        while the cache exceeds maxsize or maxbytes. A value bigger than
+        maxbytes is not stored.
+        '''
+        size = Tamano(value)
+        if size > self.maxbytes:
+            return
+        with self._lock:
+            if key in self._datos:
+                self.nbytes -= self._datos.pop(key)[1]
+            self._datos[key] = (value, size)
+            self.nbytes += size
+            while len(self._datos) > self.maxsize or self.nbytes > self.maxbytes:
+                self.nbytes -= self._datos.popitem(last = False)[1][1]
+    
+    def clear(self):
+        with self._lock:
+            self._datos.clear()
+            self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def info(self):
+        '''
+        Returns a text with the hits, misses and the memory used
+        '''
+        return "Cache: {} aciertos, {} fallos, {} diseños ({:.1f} KiB)".format(
+            self.hits, self.misses, len(self._datos), self.nbytes/1024)
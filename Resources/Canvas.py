@@ -23,6 +23,11 @@ class QMatplotlibCanvas(FigureCanvasQTAgg):
         self.fig = Figure(dpi=dpi)
         # Link figure with PyQt widget
         super().__init__(self.fig)
+        # Persistent artists updated with blitting and the background without them
+        self.artistas = {}
+        self.fondo = None
+        self.pendiente = False
+        self.mpl_connect('draw_event', self._alDibujar)
 
     def setupCanvas(self, gridspec=(1, 1), axes=[(0, 1, 0, 1)], toolbar=False, x_label = ""):
         """
@@ -41,3 +46,50 @@ class QMatplotlibCanvas(FigureCanvasQTAgg):
         # Add a toolbar if requested
         if toolbar:
             self.toolbar = NavigationToolbar2QT(self, self)
+    
+    def limpiar(self):
+        """
+        Forgets the persistent artists, call it before clearing the axes
+        """
+        self.artistas = {}
+        self.fondo = None
+    
+    def animar(self, nombre, artista):
+        """
+        Registers an artist with a name, it is excluded from the full draw
+        and painted over the cached background by redibujar
+        """
+        artista.set_animated(True)
+        self.artistas[nombre] = artista
+        return artista
+    
+    def redibujar(self):
+        """
+        Restores the cached background and only renders the persistent
+        artists, a full draw is done if there is no background yet. A hidden
+        canvas is drawn when it is shown again.
+        """
+        if not self.isVisible():
+            self.pendiente = True
+            return
+        if self.fondo is None:
+            self.draw()
+            return
+        self.restore_region(self.fondo)
+        self._dibujaArtistas()
+        self.blit(self.fig.bbox)
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.pendiente:
+            self.pendiente = False
+            self.draw_idle()
+    
+    def _alDibujar(self, event):
+        # A full draw (first paint, resize, zoom) renews the background
+        self.fondo = self.copy_from_bbox(self.fig.bbox)
+        self._dibujaArtistas()
+    
+    def _dibujaArtistas(self):
+        for artista in self.artistas.values():
+            self.fig.draw_artist(artista)
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 22:05:31 2026
+
+Implementation cost of the designs: multiplies and adds per sample, state
+memory, coefficient storage and group delay of every realization
+"""
+
+from numpy import asarray, ndim, log2, nanmedian, logspace, pi, errstate
+from Resources.Sections import SecArray
+from Resources.PFilter import GroupDelay, TapsDelay, AnalogResp, DigitalResp, Grid
+from Resources.PFilter import frecResponse
+from Resources.Stream import FFTSize, SOSArray, Symmetry, ActiveTaps, FoldTaps, FoldedCost
+from Resources.Filters import Filter
+
+def _Retardo(gd, Hdb):
+    # Median of the group delay in the pass band, -3 dB of the maximum gain
+    banda = Hdb >= Hdb.max() - 3
+    return float(nanmedian(gd[banda]))
+
+def TapsRetardo(h):
+    '''
+    Group delay in samples of the pass band of the taps of a FIR filter,
+    exact for linear phase
+    '''
+    h = asarray(h, dtype = float)
+    if Symmetry(h):
+        return (len(h) - 1)/2
+    w, gd = TapsDelay(h)
+    with errstate(divide = 'ignore'):
+        return _Retardo(gd, frecResponse().FIR(h)[1])
+
+def FIRCost(h, fs = 1):
+    '''
+    Cost of the direct convolution of the taps of a FIR filter, one multiply
+    and one add for every nonzero tap (see Stream.ActiveTaps)
+
+    Parameters
+    ----------
+    h : Array
+        Taps of the filter
+    fs : float, optional
+        Sample rate in hz. The default is 1.
+
+    Returns
+    -------
+    costo : dict
+        realizacion, multiplicaciones and sumas per output sample, estado
+        (samples of memory), coeficientes (stored values), retardo (group
+        delay of the pass band in samples) and retardo_s (in seconds)
+
+    '''
+    h = asarray(h, dtype = float)
+    activos = int(ActiveTaps(h).sum())
+    retardo = TapsRetardo(h)
+    return {"realizacion": "directa",
+            "multiplicaciones": activos,
+            "sumas": max(activos - 1, 0),
+            "estado": len(h) - 1,
+            "coeficientes": len(h),
+            "retardo": retardo,
+            "retardo_s": retardo/fs}
+
+def FoldedFIRCost(h, fs = 1):
+    '''
+    Cost of the convolution with the folded taps of FIRStream 'plegado':
+    one multiply for every pair of mirror taps and none for the zero taps,
+    every pair adds its two samples before the multiply. It models a fixed
+    point or hardware filter, in NumPy the folded kernel is slower than the
+    direct convolution so Realizations does not report it
+
+    Returns
+    -------
+    costo : dict
+        The fields of FIRCost
+
+    '''
+    h = asarray(h, dtype = float)
+    plegado = FoldTaps(h)
+    productos = FoldedCost(plegado)
+    retardo = TapsRetardo(h)
+    return {"realizacion": "plegada",
+            "multiplicaciones": productos,
+            "sumas": len(plegado[1][0]) + max(productos - 1, 0),
+            "estado": len(h) - 1,
+            "coeficientes": productos,
+            "retardo": retardo,
+            "retardo_s": retardo/fs}
+
+def FFTCost(h, fs = 1, n = None, L = None):
+    '''
+    Cost of the overlap-save convolution of FIRStream with a FFT of length
+    L. A real FFT of L points takes about L log2(L) multiplies and
+    1.5 L log2(L) adds, every block takes two of them and the product of
+    L/2 + 1 complex bins, and gives L - len(h) + 1 output samples
+
+    Parameters
+    ----------
+    h : Array
+        Taps of the filter
+    fs : float, optional
+        Sample rate in hz. The default is 1.
+    n : int, optional
+        Samples of the chunks (see FFTSize). The default is None.
+    L : int, optional
+        Length of the FFT. The default is None, chosen by FFTSize.
+
+    Returns
+    -------
+    costo : dict
+        The fields of FIRCost, multiplies and adds are averages per output
+        sample, plus fft (L), bloque (output samples of a block) and
+        latencia (samples to wait for a block)
+
+    '''
+    h = asarray(h, dtype = float)
+    if L is None:
+        L = FFTSize(len(h), n)[0]
+    B = L - (len(h) - 1)
+    if B <= 0:
+        raise ValueError("La FFT debe ser más larga que el filtro")
+    bins = L//2 + 1
+    retardo = TapsRetardo(h)
+    return {"realizacion": "fft",
+            "multiplicaciones": (2*L*log2(L) + 4*bins)/B,
+            "sumas": (3*L*log2(L) + 2*bins)/B,
+            "estado": L,
+            "coeficientes": 2*bins,
+            "retardo": retardo,
+            "retardo_s": retardo/fs,
+            "fft": L,
+            "bloque": B,
+            "latencia": B - 1}
+
+def PolyphaseCost(h, L = 1, M = 1, fs = 1):
+    '''
+    Cost of the polyphase resampler by L/M of Resample.Resampler, each output
+    sample is computed with one subfilter of ceil(len(h)/L) taps
+
+    Parameters
+    ----------
+    h : Array
+        Taps of the filter at the upsampled rate
+    L : int, optional
+        Interpolation factor. The default is 1.
+    M : int, optional
+        Decimation factor. The default is 1.
+    fs : float, optional
+        Input sample rate in hz. The default is 1.
+
+    Returns
+    -------
+    costo : dict
+        The fields of FIRCost per output sample, retardo is in output
+        samples, plus tasa (output samples per input sample)
+
+    '''
+    h = asarray(h, dtype = float)
+    K = -(-len(h)//L)
+    # Group delay at the upsampled rate L fs
+    retardo_s = TapsRetardo(h)/(L*fs)
+    return {"realizacion": "polifase",
+            "multiplicaciones": K,
+            "sumas": K - 1,
+            "estado": K - 1,
+            "coeficientes": L*K,
+            "retardo": retardo_s*fs*L/M,
+            "retardo_s": retardo_s,
+            "tasa": L/M}
+
+def SOSCost(IIR, fs = 1):
+    '''
+    Cost of the cascade of digital sections with sosfilt (transposed direct
+    form II), one multiply for every nonzero coefficient after dividing by
+    a0 and the state of the order of every section
+
+    Parameters
+    ----------
+    IIR : list or Array
+        Digital sections of Filter.BilinearTF
+    fs : float, optional
+        Sample rate in hz. The default is 1.
+
+    Returns
+    -------
+    costo : dict
+        The fields of FIRCost
+
+    '''
+    sos = SOSArray(IIR)
+    b, a = sos[:, :3] != 0, sos[:, 4:] != 0
+    terminos = b.sum(axis = 1) + a.sum(axis = 1)
+    # Order of every section, the last nonzero power of z^-1
+    orden = (b | (sos[:, 3:] != 0)).cumsum(axis = 1).argmax(axis = 1)
+
+    w = Grid(8192)
+    with errstate(divide = 'ignore'):
+        retardo = _Retardo(GroupDelay(sos, w, analog = False), DigitalResp(sos, w, True)[0])
+    return {"realizacion": "secciones",
+            "multiplicaciones": int(terminos.sum()),
+            "sumas": int((terminos - 1).sum()),
+            "estado": int(orden.sum()),
+            "coeficientes": int(terminos.sum()),
+            "retardo": retardo,
+            "retardo_s": retardo/fs}
+
+def AnalogCost(sec, fc):
+    '''
+    Cost of an analog design. The multiplies and adds per sample are the
+    ones of its digitalization with BilinearTF, estado are the integrators
+    and the group delay is in seconds
+
+    Parameters
+    ----------
+    sec : SectionBank
+        Analog sections of Filter.Butterworth, Filter.Chebyshev, ...
+    fc : float
+        Cutoff frequency in hz
+
+    Returns
+    -------
+    costo : dict
+        The fields of FIRCost, retardo is in seconds
+
+    '''
+    # The nonzero coefficients of the bilinear sections do not depend on fs
+    costo = SOSCost(Filter.BilinearTF(1, sec))
+    s = SecArray(sec)
+    w = 2*pi*fc*logspace(-2, 1, 4000)
+    with errstate(divide = 'ignore'):
+        retardo = _Retardo(GroupDelay(s, w), AnalogResp(s, w, True)[0])
+    costo.update({"realizacion": "analogica",
+                  "retardo": retardo,
+                  "retardo_s": retardo})
+    return costo
+
+def Cost(Filtro, fc = None, fs = 1, IIR = True):
+    '''
+    Cost of an output of Filter.Design: the taps of a FIR filter, digital
+    sections (IIR true) or analog sections (IIR false, fc is needed)
+
+    Returns
+    -------
+    costo : dict
+        See FIRCost
+
+    '''
+    if not isinstance(Filtro, (list, tuple)) and ndim(Filtro) == 1:
+        return FIRCost(Filtro, fs)
+    if IIR:
+        return SOSCost(Filtro, fs)
+    return AnalogCost(Filtro, fc)
+
+def Realizations(h, fs = 1, n = None):
+    '''
+    Cost of the direct and FFT realizations of the taps of a FIR filter,
+    the ones that FIRStream chooses between with 'auto'
+    '''
+    return [FIRCost(h, fs), FFTCost(h, fs, n)]
+
+def Summary(costo):
+    '''
+    One line of text with a cost, like the text of the sections
+    '''
+    texto = "{}: {:.4g} mult, {:.4g} sumas, estado {}, {} coeficientes".format(
+        costo["realizacion"], costo["multiplicaciones"], costo["sumas"],
+        costo["estado"], costo["coeficientes"])
+    if costo["realizacion"] == "analogica":
+        return texto + ", retardo {:.4g} ms".format(1e3*costo["retardo_s"])
+    texto += ", retardo {:.4g} muestras ({:.4g} ms)".format(costo["retardo"], 1e3*costo["retardo_s"])
+    if "latencia" in costo:
+        texto += ", FFT {} con latencia {}".format(costo["fft"], costo["latencia"])
+    return texto
@@ -2,13 +2,14 @@
 
 # Form implementation generated from reading ui file 'DesignerGUI.ui'
 #
-# Created by: PyQt5 UI code generator 5.9.2
+# Created by: PyQt5 UI code generator 5.15.11
 #
-# WARNING! All changes made in this file will be lost!
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
 
 from PyQt5 import QtCore, QtGui, QtWidgets
-from Resources.Canvas import QMatplotlibCanvas as Qcanvas
-import Resources.logo
+
 
 class Ui_MainWindow(object):
     def setupUi(self, MainWindow):
@@ -50,7 +51,9 @@ class Ui_MainWindow(object):
         self.Tfiltro.addItem("")
         self.Tfiltro.addItem("")
         self.Tfiltro.addItem("")
-        self.Tfiltro.setItemText(3, "")
+        self.Tfiltro.addItem("")
+        self.Tfiltro.addItem("")
+        self.Tfiltro.addItem("")
         self.verticalLayout.addWidget(self.Tfiltro)
         self.HP = QtWidgets.QCheckBox(self.frame)
         font = QtGui.QFont()
@@ -71,6 +74,16 @@ class Ui_MainWindow(object):
         self.IIR.setStyleSheet("color: rgb(140, 129, 255);")
         self.IIR.setObjectName("IIR")
         self.verticalLayout.addWidget(self.IIR)
+        self.MinFase = QtWidgets.QCheckBox(self.frame)
+        self.MinFase.setEnabled(True)
+        font = QtGui.QFont()
+        font.setFamily("MS Serif")
+        font.setBold(True)
+        font.setWeight(75)
+        self.MinFase.setFont(font)
+        self.MinFase.setStyleSheet("color: rgb(140, 129, 255);")
+        self.MinFase.setObjectName("MinFase")
+        self.verticalLayout.addWidget(self.MinFase)
         self.Ap_label = QtWidgets.QLabel(self.frame)
         font = QtGui.QFont()
         font.setFamily("MS Serif")
@@ -228,18 +241,6 @@ class Ui_MainWindow(object):
         self.Mag_frame.setFrameShadow(QtWidgets.QFrame.Raised)
         self.Mag_frame.setObjectName("Mag_frame")
         self.verticalLayout_5.addWidget(self.Mag_frame)
-        
-        self.gridLayout_1 = QtWidgets.QGridLayout(self.Mag_frame)
-        self.gridLayout_1.setObjectName("gridLayout")
-        self.MagCanvas = Qcanvas(self.Mag_frame)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.MagCanvas.sizePolicy().hasHeightForWidth())
-        self.MagCanvas.setSizePolicy(sizePolicy)
-        self.MagCanvas.setObjectName("matplotlibCanvas")
-        self.gridLayout_1.addWidget(self.MagCanvas, 0, 0, 1, 1)
-        
         self.tabWidget.addTab(self.Tab1, "")
         self.tab2 = QtWidgets.QWidget()
         self.tab2.setObjectName("tab2")
@@ -251,18 +252,6 @@ class Ui_MainWindow(object):
         self.Phase_frame.setFrameShadow(QtWidgets.QFrame.Raised)
         self.Phase_frame.setObjectName("Phase_frame")
         self.verticalLayout_6.addWidget(self.Phase_frame)
-        
-        self.gridLayout_2 = QtWidgets.QGridLayout(self.Phase_frame)
-        self.gridLayout_2.setObjectName("gridLayout")
-        self.PhaseCanvas = Qcanvas(self.Phase_frame)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.PhaseCanvas.sizePolicy().hasHeightForWidth())
-        self.PhaseCanvas.setSizePolicy(sizePolicy)
-        self.PhaseCanvas.setObjectName("matplotlibCanvas")
-        self.gridLayout_2.addWidget(self.PhaseCanvas, 0, 0, 1, 1)
-        
         self.tabWidget.addTab(self.tab2, "")
         self.tab3 = QtWidgets.QWidget()
         self.tab3.setObjectName("tab3")
@@ -274,18 +263,6 @@ class Ui_MainWindow(object):
         self.Nyquist_frame.setFrameShadow(QtWidgets.QFrame.Raised)
         self.Nyquist_frame.setObjectName("Nyquist_frame")
         self.verticalLayout_7.addWidget(self.Nyquist_frame)
-        
-        self.gridLayout_3 = QtWidgets.QGridLayout(self.Nyquist_frame)
-        self.gridLayout_3.setObjectName("gridLayout")
-        self.NyCanvas = Qcanvas(self.Nyquist_frame)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.NyCanvas.sizePolicy().hasHeightForWidth())
-        self.NyCanvas.setSizePolicy(sizePolicy)
-        self.NyCanvas.setObjectName("matplotlibCanvas")
-        self.gridLayout_3.addWidget(self.NyCanvas, 0, 0, 1, 1)
-        
         self.tabWidget.addTab(self.tab3, "")
         self.verticalLayout_2.addWidget(self.tabWidget)
         self.verticalLayout_4.addLayout(self.verticalLayout_2)
@@ -389,14 +366,18 @@ class Ui_MainWindow(object):
 
     def retranslateUi(self, MainWindow):
         _translate = QtCore.QCoreApplication.translate
-        MainWindow.setWindowTitle(_translate("Filter Studio", "Filter Studio"))
-        MainWindow.setWindowIcon(QtGui.QIcon(":logo/igun.png"))
+        MainWindow.setWindowTitle(_translate("MainWindow", "Filter Studio"))
         self.label.setText(_translate("MainWindow", "Seleccione el tipo de filtro"))
         self.Tfiltro.setItemText(0, _translate("MainWindow", "FIR"))
         self.Tfiltro.setItemText(1, _translate("MainWindow", "Butterworth"))
         self.Tfiltro.setItemText(2, _translate("MainWindow", "Chebyshev"))
+        self.Tfiltro.setItemText(3, _translate("MainWindow", "Equiripple"))
+        self.Tfiltro.setItemText(4, _translate("MainWindow", "Chebyshev Inverso"))
+        self.Tfiltro.setItemText(5, _translate("MainWindow", "Eliptico"))
+        self.Tfiltro.setItemText(6, _translate("MainWindow", "Auto"))
         self.HP.setText(_translate("MainWindow", "HP"))
         self.IIR.setText(_translate("MainWindow", "IIR"))
+        self.MinFase.setText(_translate("MainWindow", "Fase mínima"))
         self.Ap_label.setText(_translate("MainWindow", "Ap"))
         self.Ap.setSuffix(_translate("MainWindow", " dB"))
         self.Ar_label.setText(_translate("MainWindow", "Ar"))
@@ -416,15 +397,3 @@ class Ui_MainWindow(object):
         self.label_11.setText(_translate("MainWindow", "fp"))
         self.label_12.setText(_translate("MainWindow", "fr"))
         self.plainTextEdit.setPlainText(_translate("MainWindow", "Secciones del filtro"))
-'''
-
-if __name__ == "__main__":
-    import sys
-    app = QtWidgets.QApplication(sys.argv)
-    MainWindow = QtWidgets.QMainWindow()
-    ui = Ui_MainWindow()
-    ui.setupUi(MainWindow)
-    MainWindow.show()
-    sys.exit(app.exec_())
-
-'''
\ No newline at end of file
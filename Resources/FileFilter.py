@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 14:20:37 2026
+
+Filtering of raw sample files bigger than the memory with numpy.memmap
+"""
+
+from time import perf_counter
+from numpy import memmap, dtype as npdtype, iinfo, rint, clip, issubdtype, integer
+from Resources.Stream import CreateStream
+
+def FilterFile(entrada, salida, Filtro, dtype = 'float32', canales = 1,
+               bloque = 2**16, metodo = 'auto', offset = 0):
+    '''
+    Filter a raw file of interleaved samples chunk by chunk. The input and the
+    output are memory mapped, so the memory used depends on bloque and not on
+    the size of the file
+
+    Parameters
+    ----------
+    entrada : str
+        Path of the raw input file
+    salida : str
+        Path of the raw output file, it has the same dtype and channels
+    Filtro : list or Array
+        Output of Filter.BilinearTF or Filter.FIR
+    dtype : str, optional
+        Type of the samples, integer samples are rounded and saturated at
+        the output. The default is 'float32'.
+    canales : int, optional
+        Number of interleaved channels. The default is 1.
+    bloque : int, optional
+        Number of frames of each chunk. The default is 2**16.
+    metodo : str, optional
+        Convolution method of a FIR filter (see CreateStream). The default
+        is 'auto'.
+    offset : int, optional
+        Bytes of header at the start of the input that are not filtered.
+        The default is 0.
+
+    Returns
+    -------
+    muestras : int
+        Number of filtered samples (frames times channels)
+    segundos : float
+        Time of the filtering in seconds
+
+    '''
+    tipo = npdtype(dtype)
+    src = memmap(entrada, dtype = tipo, mode = 'r', offset = offset)
+    frames = src.size//canales
+    if frames == 0:
+        raise ValueError("El archivo no tiene un frame completo")
+    src = src[:frames*canales].reshape(frames, canales)
+    dst = memmap(salida, dtype = tipo, mode = 'w+', shape = (frames, canales))
+    
+    stream = CreateStream(Filtro, metodo)
+    t0 = perf_counter()
+    for i in range(0, frames, bloque):
+        y = stream.process(src[i:i + bloque])
+        if issubdtype(tipo, integer):
+            y = clip(rint(y), iinfo(tipo).min, iinfo(tipo).max)
+        dst[i:i + bloque] = y
+    dst.flush()
+    segundos = perf_counter() - t0
+    del dst
+    
+    return frames*canales, segundos
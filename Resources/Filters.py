@@ -5,8 +5,17 @@ Created on Thu Jan 27 21:27:47 2022
 @author: Ortiz Montufar Gerardo
 """
 from numpy import log10, pi, exp, ceil, sqrt, cosh, arccosh, cos, arccos, arcsinh 
-from numpy import sin, sinh, arange
-from scipy.signal import get_window
+from numpy import sin, sinh, arange, asarray, broadcast_arrays, zeros, ones
+from numpy import where, searchsorted, i0, abs as npabs, errstate
+from numpy import argsort, argmax, log, log2, maximum
+from numpy.fft import fft, ifft
+from Resources.Sections import SectionBank, SecArray
+
+# Families whose design are the taps of a FIR filter
+FIRS = ("FIR", "Equiripple")
+# Families designed as analog sections, transformed with BilinearTF for IIR.
+# "Auto" chooses the one with the lowest order (see Filter.AutoFamily)
+IIRS = ("Butterworth", "Chebyshev", "Chebyshev Inverso", "Eliptico", "Auto")
 
 # =============================================================================
 #         Functions: Are use to calculate specific mathematic expresions
@@ -133,6 +142,104 @@ def FOS(ComplexPole, HP):
     
     return (num,den)
 
+def SOSZero(ComplexPole, Zero, HP):
+    '''
+    Second Order Section of a analog filter with complex conjugate poles
+    and a pair of zeros on the imaginary axis, like the sections of the
+    inverse Chebyshev and elliptic filters
+
+    Parameters
+    ----------
+    ComplexPole : complex
+        The complex conjugate pole of the section
+    Zero : complex
+        The imaginary zero of the section
+    HP : boolean
+        If HP true the section has unity gain at infinite frequency, else it
+        has unity gain at zero frequency
+
+    Returns
+    -------
+    num : list
+        The numerator of the filter
+    den : list
+        The denominator of the filter
+
+    '''
+    den = [1, -2*ComplexPole.real, abs(ComplexPole)**2]
+    if not HP:
+        g = abs(ComplexPole)**2/abs(Zero)**2
+        num = [g, 0, g*abs(Zero)**2]
+    elif HP:
+        num = [1, 0, abs(Zero)**2]
+    
+    return (num,den)
+
+def GenSecZP(poles, ceros, HP, wc = None):
+    '''
+    Generate the sections of a analog filter from its poles and zeros: the
+    poles with positive imaginary part, in the order of the sections, and
+    the zeros with positive imaginary part paired with the first poles. A
+    real pole gives the FOS at the end
+
+    Parameters
+    ----------
+    poles : complex Array
+        Poles of the low pass filter
+    ceros : complex Array
+        Zeros of the low pass filter
+    HP : boolean
+        If HP true return the sections of the high pass filter with the
+        poles and zeros wc**2/p
+    wc : float, optional
+        Cutoff frequency of the transformation to high pass
+
+    Returns
+    -------
+    sec : SectionBank
+        The SOS and FOS sections of a filter (see SOS, SOSZero and FOS)
+
+    '''
+    poles = asarray(poles, dtype = complex)
+    ceros = asarray(ceros, dtype = complex)
+    if HP:
+        poles = wc**2/poles
+        ceros = wc**2/ceros
+    
+    fos = npabs(poles.imag) <= 1e-9*npabs(poles)
+    mod = npabs(poles)
+    z2 = zeros(len(poles))
+    z2[:len(ceros)] = npabs(ceros)**2
+    cero = z2 > 0
+    
+    sec = zeros((len(poles), 6))
+    sec[:, 3] = where(fos, 0, 1)
+    sec[:, 4] = where(fos, 1, -2*poles.real)
+    sec[:, 5] = where(fos, mod, mod**2)
+    if HP:
+        # s^2 + |z|^2, s^2 or s
+        sec[:, 0] = where(fos, 0, 1)
+        sec[:, 1] = where(fos, 1, 0)
+        sec[:, 2] = where(fos, 0, z2)
+    else:
+        # Unity gain at zero frequency
+        g = where(cero, mod**2/where(cero, z2, 1), 0)
+        sec[:, 0] = where(fos, 0, g)
+        sec[:, 2] = where(fos, mod, where(cero, g*z2, mod**2))
+    return SectionBank(sec, fos)
+
+def SecGain(sec, w):
+    '''
+    Gain of the analog sections of GenSec or GenSecZP at the angular
+    frequencies w
+    '''
+    sec = SecArray(sec)[:, None, :]
+    w2 = w*w
+    # c0 (jw)^2 + c1 jw + c2 of every section
+    num = (sec[..., 2] - sec[..., 0]*w2) + 1j*(sec[..., 1]*w)
+    den = (sec[..., 5] - sec[..., 3]*w2) + 1j*(sec[..., 4]*w)
+    return npabs((num/den).prod(axis = 0))
+
 def Sync(wc, N):
     '''
     The normalized Sinc function Sync(x) = Sin(pi*x)/(pix) with x = wc(n-a)
@@ -168,9 +275,53 @@ def Sync(wc, N):
     x = (wc/pi)*num/den
     return n, x
 
+def Deltas(Ap, As):
+    '''
+    Linear ripples of the pass and reject bands from the attenuations in
+    decibels, the pass band oscillates between 1 - dp and 1 + dp
+
+    Returns
+    -------
+    dp : float
+        Ripple of the pass band
+    ds : float
+        Ripple of the reject band
+
+    '''
+    g = 10**(Ap/20)
+    return (g - 1)/(g + 1), 10**(-As/20)
+
+def Herrmann(dp, ds, df):
+    '''
+    Herrmann's estimate of the number of taps of an equiripple low pass
+    filter
+
+    Parameters
+    ----------
+    dp : float
+        Ripple of the pass band
+    ds : float
+        Ripple of the reject band
+    df : float
+        Width of the transition band in cycles per sample
+
+    Returns
+    -------
+    N : int
+        Odd number of taps
+
+    '''
+    lp, ls = log10(dp), log10(ds)
+    Dinf = ls*(5.309e-3*lp**2 + 7.114e-2*lp - 4.761e-1) - (2.66e-3*lp**2 + 5.941e-1*lp + 4.278e-1)
+    f = 11.01217 + 0.51244*(lp - ls)
+    N = int(ceil(Dinf/df - f*df + 1))
+    # Type I, so it can be a high pass filter
+    return max(N + 1 - N % 2, 3)
+
 def GenSec(func, HP, *args):
     '''
-    Generate the sections of a analog filter
+    Generate the sections of a analog filter, every pole is evaluated at
+    once and the sections are built by GenSecBatch
 
     Parameters
     ----------
@@ -183,30 +334,118 @@ def GenSec(func, HP, *args):
 
     Returns
     -------
-    sec : list
-        Returns a list of tuples with SOS and FOS sections of a filter
+    sec : SectionBank
+        The SOS and FOS sections of a filter
+
+    '''
+    
+    N = int(args[0])
+    # One pole of each SOS and the pole of the FOS
+    k = arange((N + 1)//2)
+    poles = asarray(func(k, *args), dtype = complex)
+    sec, fos = GenSecBatch(poles[None, :], asarray([N]), HP)
+    return SectionBank(sec[0], fos[0])
+
+def GenSecBatch(poles, N, HP):
+    '''
+    Vectorized version of GenSec. Builds every section of many filters at
+    once from a matrix of poles, the section k of each row uses the pole k.
+
+    Each section is stored as a row [b0, b1, b2, a0, a1, a2] with the
+    coefficients of s in descending powers, so a FOS is left padded with
+    zeros. Rows beyond the order of a filter are filled with the unity
+    section [0, 0, 1, 0, 0, 1] so a cascade can be evaluated without masks.
+
+    Parameters
+    ----------
+    poles : complex Array
+        Matrix (n, S) with the pole k of each of the n filters
+    N : int Array
+        Order of each filter
+    HP : boolean or boolean Array
+        If HP true returns the sections of a high pass filter
+
+    Returns
+    -------
+    sec : Array
+        Array (n, S, 6) with the SOS and FOS of each filter
+    fos : Array
+        Boolean mask (n, S), true where the section is a FOS
 
     '''
+    N = asarray(N)
+    HP = broadcast_arrays(asarray(HP, dtype=bool), N)[0][:, None]
+    N = N[:, None]
+    k = arange(poles.shape[1])[None, :]
     
-    N = args[0]
-    sec = []
+    isSOS = k < N//2
+    isFOS = (k == N//2) & (N % 2 != 0)
     
-    if N != 1:
-        
-        n = int(N/2)
-        for i in range(n):
-            p = func(i, *args)
-            sec.append( SOS(p, HP) )
-                            
-        if N % 2 != 0:
-            i += 1
-            p = func(i, *args)
-            sec.append( FOS(p, HP) )
-    else:
-        p = func(0, *args)
-        sec.append( FOS(p, HP) )
+    mod = npabs(poles)
+    sec = zeros(poles.shape + (6,))
+    # Unity section for padding
+    sec[..., 2] = 1
+    sec[..., 5] = 1
+    
+    # SOS
+    SOS = zeros(poles.shape + (6,))
+    SOS[..., 0] = where(HP, 1, 0)
+    SOS[..., 2] = where(HP, 0, mod**2)
+    SOS[..., 3] = 1
+    SOS[..., 4] = -2*poles.real
+    SOS[..., 5] = mod**2
+    
+    # FOS
+    FOS = zeros(poles.shape + (6,))
+    FOS[..., 1] = where(HP, 1, 0)
+    FOS[..., 2] = where(HP, 0, mod)
+    FOS[..., 4] = 1
+    FOS[..., 5] = mod
+    
+    sec = where(isSOS[..., None], SOS, sec)
+    sec = where(isFOS[..., None], FOS, sec)
     
-    return sec
+    return sec, isFOS
+
+def WindowBatch(window, N, beta):
+    '''
+    Evaluate the symmetric windows used by Filter.FIR for many filters at
+    once, the same values that get_window(window, N, fftbins = False) gives
+
+    Parameters
+    ----------
+    window : int Array
+        Index of the window of each filter in the order boxcar, bartlett,
+        hamming, hanning, blackman, kaiser
+    N : int Array
+        Number of points of each filter
+    beta : float Array
+        Parameter of the kaiser window (only used if window is kaiser)
+
+    Returns
+    -------
+    w : Array
+        Matrix (n, max(N)) with the windows, zero after the N points of
+        each filter
+
+    '''
+    n = arange(N.max())[None, :]
+    M = N[:, None].astype(float)
+    # Symmetric windows span N - 1 intervals
+    D = maximum(M - 1, 1)
+    window = window[:, None]
+    x = 2*pi*n/D
+    
+    w = ones((len(N), n.shape[1]))
+    w = where(window == 1, 1 - npabs(2*n/D - 1), w)
+    w = where(window == 2, 0.54 - 0.46*cos(x), w)
+    w = where(window == 3, 0.5 - 0.5*cos(x), w)
+    w = where(window == 4, 0.42 - 0.5*cos(x) + 0.08*cos(2*x), w)
+    with errstate(invalid = 'ignore'):
+        K = i0(beta[:, None]*sqrt(1 - (2*n/D - 1)**2))/i0(beta[:, None])
+    w = where(window == 5, K, w)
+    
+    return where(n < M, w, 0)
 #                              END FUNCTIONS
 # =============================================================================
 
@@ -239,8 +478,8 @@ class Filter:
         -------
         fcB  : int
             Cutoff frequency of the total filter in hz
-        secB : list
-            returns a list of tuples with the SOS and FOS of a Butterworth filter
+        secB : SectionBank
+            returns the SOS and FOS of a Butterworth filter
 
         '''
         
@@ -275,8 +514,8 @@ class Filter:
         -------
         fcT : int
             The cutoff frequency of all the filter
-        secT : list
-            Returns a list of tuples with the SOS and FOS of a Chebyshev filter
+        secT : SectionBank
+            Returns the SOS and FOS of a Chebyshev filter
 
         '''
         
@@ -295,68 +534,185 @@ class Filter:
         elif HP:
             secT = GenSec(polesCheby, HP, NT, 2*pi*fp, a, wcT)
         
-        if len(secT[-1][1]) == 3:#Para mantener ganancia unitaria
+        if not secT.fos[-1]:#Para mantener ganancia unitaria
             A = 10**(-Ap/20)
-            secT[-1][0][0] *= A
+            secT.sec[-1, :3] *= A
         
         return wcT/(2*pi), secT
     
+    @staticmethod
+    def InverseChebyshev(Ap, Ar, fp, fr, HP = False):
+        '''
+        Generate an inverse Chebyshev filter with relative specificaitions,
+        it is flat in the pass band and has ripple of Ar in the reject band
+
+        Parameters
+        ----------
+        Ap : float
+            Minimum attenuation in the pass band in decibels
+        Ar : float
+            Attenuation in the reject band in decibels
+        fp : float
+            Frequency of the pass band in hz
+        fr : float
+            Frequency of the reject band in hz
+        HP : boolen, optional
+            If HP is true returns a high pass filter of a low pass design
+            with the same cutoff frequency. The default is False.
+
+        Returns
+        -------
+        fcI : float
+            Cutoff frequency of the total filter in hz
+        secI : SectionBank
+            Returns the SOS and FOS of the filter
+
+        '''
+        
+        NI = int(ceil(arccosh(sqrt((10**(Ar/10)-1)/(10**(Ap/10)-1)))/arccosh(fr/fp)))
+        wr = 2*pi*fr
+        e = 1/sqrt(10**(Ar/10)-1)
+        a = (1/NI)*arcsinh(1/e)
+        
+        k = arange(int(ceil(NI/2)))
+        theta = (2*k + 1)*pi/(2*NI)
+        # Inverse of the Chebyshev poles with ripple e, scaled to wr
+        poles = wr/(-sinh(a)*sin(theta) + 1j*cosh(a)*cos(theta))
+        zeros = 1j*wr/cos(theta[:NI//2])
+        wcI = wr/cosh(arccosh(1/e)/NI)
+        
+        secI = GenSecZP(poles, zeros, HP, wcI)
+        return wcI/(2*pi), secI
+    
+    @staticmethod
+    def Elliptic(Ap, Ar, fp, fr, HP = False):
+        '''
+        Generate an elliptic (Cauer) filter with relative specificaitions,
+        it has ripple in both bands and the lowest order of all the families
+
+        Parameters
+        ----------
+        Ap : float
+            Minimum attenuation in the pass band in decibels
+        Ar : float
+            Attenuation in the reject band in decibels
+        fp : float
+            Frequency of the pass band in hz
+        fr : float
+            Frequency of the reject band in hz
+        HP : boolen, optional
+            If HP is true returns a high pass filter of a low pass design
+            with the same cutoff frequency. The default is False.
+
+        Returns
+        -------
+        fcE : float
+            Cutoff frequency of the total filter in hz, where the gain is
+            -3 dB or fp if Ap is larger than 3 dB
+        secE : SectionBank
+            Returns the SOS and FOS of the filter
+
+        '''
+        # scipy.signal is slow to import, see Filter.FIR
+        from scipy.signal import ellipord, ellipap
+        
+        wp = 2*pi*fp
+        NE = int(ellipord(wp, 2*pi*fr, Ap, Ar, analog = True)[0])
+        z, p, k = ellipap(NE, Ap, Ar)
+        z, p = z*wp, p*wp
+        # One pole of each pair sorted by Q, the highest Q pole gets the
+        # nearest zero
+        p = p[p.imag >= 0]
+        p = p[argsort(npabs(p)/(-2*p.real))[::-1]]
+        z = z[z.imag > 0]
+        z = z[argsort(z.imag)]
+        
+        def Secciones(HP, wc = None):
+            sec = GenSecZP(p, z, HP, wc)
+            # Even orders start the pass band at the top of the ripple
+            if NE % 2 == 0:
+                A = 10**(-Ap/20)
+                sec.sec[-1, :3] *= A
+            return sec
+        
+        secE = Secciones(False)
+        wcE = wp
+        if Ap < 3:
+            # First frequency of the transition band with -3 dB
+            w = wp*(fr/fp)**(arange(1, 2001)/2000)
+            wcE = w[argmax(SecGain(secE, w) <= 10**(-3/20))]
+        if HP:
+            secE = Secciones(True, wcE)
+        return wcE/(2*pi), secE
+    
+    @staticmethod
+    def Orders(Ap, Ar, fp, fr):
+        '''
+        Minimum order of each analog family for a specification
+
+        Returns
+        -------
+        ordenes : dict
+            Order of each family of IIRS, without "Auto"
+
+        '''
+        from scipy.signal import ellipord
+        
+        NB = int(ceil( log10( (10**(Ap/10)-1)/(10**(Ar/10)-1) ) / (2*log10(fp/fr)) ))
+        NT = int(ceil(arccosh(sqrt((10**(Ar/10)-1)/(10**(Ap/10)-1)))/arccosh(fr/fp)))
+        NE = int(ellipord(2*pi*fp, 2*pi*fr, Ap, Ar, analog = True)[0])
+        return {"Butterworth": NB, "Chebyshev": NT, "Chebyshev Inverso": NT, "Eliptico": NE}
+    
+    @staticmethod
+    def AutoFamily(Ap, Ar, fp, fr):
+        '''
+        Family with the lowest cost per sample that meets the specification.
+        The cost grows with the number of sections, so it is the family of
+        lowest order, the ties go to the family that comes first in IIRS
+        (all pole families before the ones with zeros in the reject band)
+
+        Returns
+        -------
+        tipo : str
+            Name of the family
+
+        '''
+        ordenes = Filter.Orders(Ap, Ar, fp, fr)
+        return min(ordenes, key = lambda tipo: (int(ceil(ordenes[tipo]/2)), ordenes[tipo], IIRS.index(tipo)))
+    
+    @staticmethod
+    def Auto(Ap, Ar, fp, fr, HP = False):
+        '''
+        Generate the filter of the family chosen by Filter.AutoFamily, same
+        parameters and outputs of Filter.Butterworth
+        '''
+        return Filter.Design(Filter.AutoFamily(Ap, Ar, fp, fr), Ap, Ar, fp, fr, HP = HP)
+    
     @staticmethod
     def BilinearTF(fs, FilterBank):
         '''
-        Construct the bilinear transformation of a FOS or SOS system
+        Construct the bilinear transformation of a FOS or SOS system, all the
+        sections are transformed at once by BilinearTFBatch
 
         Parameters
         ----------
         fs : int
             Sample rate in hz
-        FilterBank : list
-            A list of tuples of a analog filter design (only FOS and SOS)
+        FilterBank : SectionBank or list
+            The analog sections of a filter design (only FOS and SOS), a list
+            of tuples is also accepted
 
         Returns
         -------
-        IIR : list
-            Returns a list of tuples of a IIR digital filter
+        IIR : SectionBank
+            The digital sections of the IIR filter
 
         '''
         
-        T = 1/fs
-        IIR = []
-        
-        for i in range(len(FilterBank)):
-            AF = FilterBank[i] #Analog Filter
-            num = AF[0]
-            den = AF[1]
-            
-            if len(den) == 2: #FOS
-                a = den[-1]*T
-                
-                if len(num) == 1: #LP
-                    num_iir = [a, a]
-                else: #HP
-                    num_iir = [2,-2]
-                
-                IIR.append( (num_iir,[a+2, a-2]) )
-            
-            elif len(den) == 3: #SOS
-                a = den[-1]*(T**2)
-                b0 = 4 + 2*den[1]*T + a
-                b2 = 4 - 2*den[1]*T + a
-                b1 = 2*a - 8
-                
-                if len(num) == 1: #LP
-                    num_iir = [a,2*a,a]
-                    
-                else: #HP
-                    num_iir = [4,-8,4]
-                
-                IIR.append( (num_iir,[b0,b1,b2]) )
-                
-            else:
-                #levantar excepcion no se acepta de orden mayor a dos
-                pass
-        
-        return IIR
+        if not isinstance(FilterBank, SectionBank):
+            FilterBank = SectionBank.fromList(FilterBank)
+        IIR = Filter.BilinearTFBatch(fs, FilterBank.sec)
+        return SectionBank(IIR, FilterBank.fos, analog = False)
     
     @staticmethod
     def FIR(Ap, As, fp, fs, sps = 1, HP = False):
@@ -389,12 +745,43 @@ class Filter:
 
         '''
         
+        wp, ws = fp*2*pi/sps, fs*2*pi/sps #digital frequency
+        window, N = Filter.WindowOrder(As, fp, fs, sps)
+        
+        wc = (ws+wp)/2
+        n, h = Sync(wc, N)
+        
+        if HP:
+            n, h1 = Sync(pi, N) #all pass
+            h = (h1-h)
+            
+        if window:
+            # scipy.signal is slow to import, only the window method needs it
+            from scipy.signal import get_window
+            # Symmetric window, so the taps keep the linear phase
+            h = h*get_window(window, N, fftbins = False)
+        
+        return wc, h
+    
+    @staticmethod
+    def WindowOrder(As, fp, fs, sps = 1):
+        '''
+        Window and number of taps that Filter.FIR uses for a specification
+
+        Returns
+        -------
+        window : str or tuple
+            Name of the window or ('kaiser', beta)
+        N : int
+            Odd number of taps
+
+        '''
         wp, ws = fp*2*pi/sps, fs*2*pi/sps #digital frequency
         
         windows = {21 : ('boxcar', 4*pi), 
                    25 : ('bartlett', 4*pi), 
                    44 : ('hamming', 8*pi),
-                   53 : ('hanning', 8*pi),
+                   53 : ('hann', 8*pi),
                    74 : ('blackman', 12*pi)
                    }
         
@@ -416,15 +803,396 @@ class Filter:
         # Type I
         if N % 2 == 0:
             N += 1
+        return window, int(N)
+    
+    @staticmethod
+    def Equiripple(Ap, As, fp, fs, sps = 1, HP = False, intentos = 20):
+        '''
+        Generate an equiripple FIR filter with the Parks-McClellan algorithm.
+        The number of taps starts at Herrmann's estimate and grows until the
+        ripples of Ap and As are met, so it usually needs fewer taps than
+        Filter.FIR for the same specification
+
+        Parameters
+        ----------
+        Ap : float
+            Maximum ripple of the pass band in decibels
+        As : float
+            Attenuation in the reject band in decibels
+        fp : float
+            Frequency of the pass band in hz
+        fs : float
+            Frequency of the reject band in hz
+        sps : float, optional
+            Sample rate. The default is 1.
+        HP : boolean, optional
+            If HP is true returns a high pass FIR filter. The default is False.
+        intentos : int, optional
+            Maximum number of times the estimate is increased by two taps.
+            The default is 20.
+
+        Raises
+        ------
+        ValueError
+            If no design meets Ap and As after intentos tries
+
+        Returns
+        -------
+        wc : float
+            Middle of the transition band as digital frequency
+        h : Array
+            Returns the FIR filter
+
+        '''
+        # scipy.signal is slow to import, see Filter.FIR
+        from scipy.signal import remez
+        from numpy.fft import rfft
+        
+        dp, ds = Deltas(Ap, As)
+        f1, f2 = sorted((fp/sps, fs/sps))
+        N = Herrmann(dp, ds, f2 - f1)
+        bandas = [0, f1, f2, .5]
+        deseado = [0, 1] if HP else [1, 0]
+        # The error of each band is weighted by the inverse of its ripple
+        peso = [dp/ds, 1] if HP else [1, dp/ds]
+        
+        for i in range(intentos):
+            h = remez(N, bandas, deseado, weight = peso)
+            nfft = int(2**ceil(log10(16*N)/log10(2)))
+            H = npabs(rfft(h, nfft))
+            f = arange(H.size)/nfft
+            banda1, banda2 = H[f <= f1], H[f >= f2]
+            paso, rechazo = (banda2, banda1) if HP else (banda1, banda2)
+            if npabs(paso - 1).max() <= dp and rechazo.max() <= ds:
+                break
+            N += 2
+        else:
+            raise ValueError("El diseño equiripple no cumple Ap = {} y As = {} con {} taps".format(Ap, As, N - 2))
+        
+        return (fp + fs)*pi/sps, h
+    
+    @staticmethod
+    def TapSavings(Ap, As, fp, fs, sps = 1, h = None):
+        '''
+        Taps of the window design and of the equiripple design of the same
+        specification
+
+        Parameters
+        ----------
+        h : Array, optional
+            Taps of an equiripple design already computed. The default is
+            None, that designs it.
+
+        Returns
+        -------
+        ventana : int
+            Taps of Filter.FIR
+        equiripple : int
+            Taps of Filter.Equiripple
+        ahorro : float
+            Fraction of the taps of the window design that are saved
+
+        '''
+        ventana = Filter.WindowOrder(As, fp, fs, sps)[1]
+        if h is None:
+            h = Filter.Equiripple(Ap, As, fp, fs, sps)[1]
+        return ventana, len(h), 1 - len(h)/ventana
+    
+    @staticmethod
+    def MinimumPhase(h, nfft = None):
+        '''
+        Minimum phase filter with the same magnitude response and the same
+        number of taps than h, by the folding of the real cepstrum of
+        log|H|. The energy of the taps moves to the start, so the group
+        delay in the pass band is much lower than the (N-1)/2 samples of a
+        linear phase filter
+
+        Parameters
+        ----------
+        h : Array
+            Taps of a FIR filter
+        nfft : int, optional
+            Length of the FFT, long enough so the cepstrum does not alias.
+            The default is None, a power of two with 32 points per tap.
+
+        Returns
+        -------
+        hmin : Array
+            Taps of the minimum phase filter
+
+        '''
+        h = asarray(h, dtype = float)
+        if nfft is None:
+            nfft = int(2**ceil(log2(max(32*len(h), 1024))))
+        H = npabs(fft(h, nfft))
+        # The zeros on the unit circle are moved just inside of it
+        c = ifft(log(maximum(H, 1e-10*H.max()))).real
+        # Causal part of the cepstrum: c[0], 2c[n] and c[nfft/2]
+        plegado = zeros(nfft)
+        plegado[0] = c[0]
+        plegado[1:nfft//2] = 2*c[1:nfft//2]
+        plegado[nfft//2] = c[nfft//2]
+        return ifft(exp(fft(plegado))).real[:len(h)]
+    
+    @staticmethod
+    def Design(tipo, Ap, Ar, fp, fr, fs = 1, HP = False, IIR = False, minfase = False):
+        '''
+        Generate a filter of any family with the parameters of the GUI
+
+        Parameters
+        ----------
+        tipo : str
+            Family of the filter: one of IIRS or FIRS
+        Ap : float
+            Minimum attenuation in the pass band in decibels
+        Ar : float
+            Attenuation in the reject band in decibels
+        fp : float
+            Frequency of the pass band in hz
+        fr : float
+            Frequency of the reject band in hz
+        fs : float, optional
+            Sample rate in hz, used by FIR and IIR designs. The default is 1.
+        HP : boolean, optional
+            If HP is true returns a high pass filter. The default is False.
+        IIR : boolean, optional
+            If IIR is true the analog design is transformed with BilinearTF.
+            The default is False.
+        minfase : boolean, optional
+            If minfase is true the taps of a FIR family are converted to
+            minimum phase with MinimumPhase. The default is False.
+
+        Returns
+        -------
+        fc : float
+            Cutoff frequency, in hz for the analog families and as digital
+            frequency for the FIR families
+        sec : SectionBank or Array
+            Sections of the filter or taps of a FIR filter
+
+        '''
+        if tipo in FIRS:
+            disenos = {"FIR": Filter.FIR, "Equiripple": Filter.Equiripple}
+            fc, h = disenos[tipo](Ap, Ar, fp, fr, fs, HP)
+            if minfase:
+                h = Filter.MinimumPhase(h)
+            return fc, h
+        
+        familias = {"Butterworth": Filter.Butterworth,
+                    "Chebyshev": Filter.Chebyshev,
+                    "Chebyshev Inverso": Filter.InverseChebyshev,
+                    "Eliptico": Filter.Elliptic,
+                    "Auto": Filter.Auto,
+                    }
+        if tipo not in familias:
+            raise ValueError("Tipo de filtro desconocido: {}".format(tipo))
+        
+        fc, sec = familias[tipo](Ap, Ar, fp, fr, HP)
+        if IIR:
+            sec = Filter.BilinearTF(fs, sec)
+        return fc, sec
+    
+    @staticmethod
+    def ButterworthBatch(Ap, Ar, fp, fr, HP = False):
+        '''
+        Generate many Butterworth filters in one vectorized pass. The
+        specifications are broadcast against each other like NumPy arrays
+
+        Parameters
+        ----------
+        Ap : float or Array
+            Minimum attenuation in the pass band in decibels
+        Ar : float or Array
+            Attenuation in the reject band in decibels
+        fp : float or Array
+            Frequency of the pass band in hz
+        fr : float or Array
+            Frequency of the reject band in hz
+        HP : boolean or Array, optional
+            If HP is true returns high pass filters. The default is False.
+
+        Returns
+        -------
+        NB : Array
+            Order of each filter
+        fcB : Array
+            Cutoff frequency of each filter in hz
+        secB : Array
+            Array (n, S, 6) with the SOS and FOS of each filter (see GenSecBatch)
+        fos : Array
+            Boolean mask (n, S), true where the section is a FOS
+
+        '''
+        
+        Ap, Ar, fp, fr, HP = [a.ravel() for a in broadcast_arrays(Ap, Ar, fp, fr, HP)]
+        NB = ceil( log10( (10**(Ap/10)-1)/(10**(Ar/10)-1) ) / (2*log10(fp/fr)) ).astype('int')
+        wcB = 2*pi*fp / ( 10**(Ap/10)-1 )**( 1/(2*NB) )
+        
+        k = arange(max(int(ceil(NB.max()/2)), 1))[None, :]
+        pB = polesButter(k, NB[:, None], wcB[:, None])
+        secB, fos = GenSecBatch(pB, NB, HP)
+        
+        return NB, wcB/(2*pi), secB, fos
+    
+    @staticmethod
+    def ChebyshevBatch(Ap, Ar, fp, fr, HP = False):
+        '''
+        Generate many Chebyshev filters in one vectorized pass. The
+        specifications are broadcast against each other like NumPy arrays
+
+        Parameters
+        ----------
+        Ap : float or Array
+            Minimum attenuation in the pass band in decibels
+        Ar : float or Array
+            Attenuation in the reject band in decibels
+        fp : float or Array
+            Frequency of the pass band in hz
+        fr : float or Array
+            Frequency of the reject band in hz
+        HP : boolean or Array, optional
+            If HP is true returns high pass filters. The default is False.
+
+        Returns
+        -------
+        NT : Array
+            Order of each filter
+        fcT : Array
+            Cutoff frequency of each filter in hz
+        secT : Array
+            Array (n, S, 6) with the SOS and FOS of each filter (see GenSecBatch)
+        fos : Array
+            Boolean mask (n, S), true where the section is a FOS
+
+        '''
+        
+        Ap, Ar, fp, fr, HP = [a.ravel() for a in broadcast_arrays(Ap, Ar, fp, fr, HP)]
+        HP = HP.astype(bool)
+        e = sqrt(10**(Ap/10)-1)
+        NT = ceil(arccosh(sqrt((10**(Ar/10)-1)/(10**(Ap/10)-1)))/arccosh(fr/fp)).astype('int')
+        a = (1/NT)*arcsinh(1/e)
+        
+        with errstate(invalid = 'ignore'):
+            wcT = where(Ap <= 3,
+                        2*pi*fp*cosh(arccosh(1/e)/NT),
+                        2*pi*fp*cos(arccos(1/e)/NT))
+        
+        k = arange(max(int(ceil(NT.max()/2)), 1))[None, :]
+        pT = polesCheby(k, NT[:, None], 2*pi*fp[:, None], a[:, None])
+        pT = where(HP[:, None], (wcT[:, None]**2)/pT, pT)
+        secT, fos = GenSecBatch(pT, NT, HP)
+        
+        #Para mantener ganancia unitaria
+        even = (NT % 2 == 0) & (NT > 0)
+        rows = arange(len(NT))[even]
+        secT[rows, NT[even]//2 - 1, :3] *= 10**(-Ap[even, None]/20)
+        
+        return NT, wcT/(2*pi), secT, fos
+    
+    @staticmethod
+    def BilinearTFBatch(fs, FilterBank):
+        '''
+        Vectorized bilinear transformation of the sections given by
+        ButterworthBatch or ChebyshevBatch
+
+        Parameters
+        ----------
+        fs : float or Array
+            Sample rate in hz, an Array gives one sample rate per filter
+        FilterBank : Array
+            Array (..., 6) of analog sections in descending powers of s
+
+        Returns
+        -------
+        IIR : Array
+            Array (..., 6) of digital sections [b0, b1, b2, a0, a1, a2] in
+            ascending powers of z^-1, a FOS is right padded with zeros. The
+            unity sections of the padding give [1, 0, 0, 1, 0, 0].
+
+        '''
+        
+        FilterBank = asarray(FilterBank, dtype=float)
+        T = 1/asarray(fs, dtype=float)
+        T = T.reshape(T.shape + (1,)*(FilterBank.ndim - 1 - T.ndim))
+        fos = FilterBank[..., 3] == 0
+        # Sections of order zero, like the padding, are only a gain. As a FOS
+        # they would get a pole and a zero at z = -1
+        gain = fos & (FilterBank[..., 4] == 0)
+        IIR = zeros(FilterBank.shape)
+        
+        for j in (0, 3):
+            c0, c1, c2 = FilterBank[..., j], FilterBank[..., j+1], FilterBank[..., j+2]
+            # SOS: (1 + z^-1)^2 times the polynomial, scaled by T^2
+            s0 = 4*c0 + 2*c1*T + c2*T**2
+            s1 = 2*c2*T**2 - 8*c0
+            s2 = 4*c0 - 2*c1*T + c2*T**2
+            # FOS: (1 + z^-1) times the polynomial, scaled by T
+            IIR[..., j] = where(gain, c2, where(fos, 2*c1 + c2*T, s0))
+            IIR[..., j+1] = where(gain, 0, where(fos, c2*T - 2*c1, s1))
+            IIR[..., j+2] = where(fos, 0, s2)
+        
+        return IIR
+    
+    @staticmethod
+    def FIRBatch(Ap, As, fp, fs, sps = 1, HP = False):
+        '''
+        Generate many FIR filters with the windows method in one vectorized
+        pass. The specifications are broadcast against each other like NumPy
+        arrays
+
+        Parameters
+        ----------
+        Ap : float or Array
+            Minimum attenuation in the pass band in decibels (not implemented)
+        As : float or Array
+            Attenuation in the reject band in decibels
+        fp : float or Array
+            Frequency of the pass band in hz
+        fs : float or Array
+            Frequency of the reject band in hz
+        sps : float or Array, optional
+            Sample rate
+        HP : boolean or Array, optional
+            If HP is true returns high pass FIR filters. The default is False.
+
+        Returns
+        -------
+        N : Array
+            Number of taps of each filter
+        wc : Array
+            Aproximate cutoff frequency of each design
+        h : Array
+            Matrix (n, max(N)) with the taps of each filter, zero padded at
+            the end
+
+        '''
+        
+        Ap, As, fp, fs, sps, HP = [a.ravel() for a in broadcast_arrays(Ap, As, fp, fs, sps, HP)]
+        HP = HP.astype(bool)
+        wp, ws = fp*2*pi/sps, fs*2*pi/sps #digital frequency
+        
+        # Same table of Filter.FIR, kaiser is the index 5
+        attenuation = asarray([21, 25, 44, 53, 74])
+        rad = asarray([4*pi, 4*pi, 8*pi, 8*pi, 12*pi, 0])
+        window = searchsorted(attenuation, As, side = 'left')
+        kaiser = window == 5
+        
+        N = where(kaiser,
+                  ceil( (As - 7.95) / (2.285*npabs(ws-wp)) + 1 ),
+                  ceil( rad[window]/npabs(ws - wp) )).astype('int')
+        beta = 0.1102*(As-8.7)
+        
+        # Type I
+        N = where(N % 2 == 0, N + 1, N)
         
         wc = (ws+wp)/2
-        n, h = Sync(wc, N)
+        n = arange(N.max())[None, :]
+        x = n - ((N-1)/2)[:, None]
+        center = x == 0
+        x = where(center, 1, x)
         
-        if HP:
-            n, h1 = Sync(pi, N) #all pass
-            h = (h1-h)
-            
-        if window:
-            h = h*get_window(window, N)
+        h = where(center, wc[:, None]/pi, sin(wc[:, None]*x)/(pi*x))
+        h = where(HP[:, None], where(center, 1, sin(pi*x)/(pi*x)) - h, h)
+        h = h*WindowBatch(window, N, beta)
         
-        return wc, h
+        return N, wc, h
@@ -0,0 +1,590 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:52:36 2026
+
+Fixed point quantization of the designs and simulation with integer
+arithmetic, like a MCU with Q15 or Q31 words
+"""
+
+from numpy import asarray, zeros, empty, concatenate, floor, log2, round as npround, clip
+from numpy import int64, cumprod, sin, cos, arange, pi, log10, log, exp
+from numpy import roots, ceil, stack, maximum, where
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.linalg import lstsq
+from numpy import abs as npabs, random
+from Resources.PFilter import DigitalResp, Grid
+from Resources.Sections import SecArray
+from Resources.Stream import SOSArray
+
+def Frac(x, bits):
+    '''
+    Fraction bits of the format of a signed word of bits that holds the
+    largest magnitude of x, small coefficients get more fraction bits than
+    bits - 1
+
+    Parameters
+    ----------
+    x : Array
+        Values to quantize
+    bits : int
+        Length of the word
+
+    Returns
+    -------
+    frac : int
+        Fraction bits, x is stored as round(x*2**frac)
+
+    '''
+    m = float(npabs(asarray(x, dtype = float)).max())
+    if m == 0:
+        return bits - 1
+    return int(bits - 2 - floor(log2(m)))
+
+def Wrap(v, bits, saturar = True):
+    '''
+    Bring integers to the range of a signed word of bits
+
+    Parameters
+    ----------
+    v : int Array
+        Values
+    bits : int
+        Length of the word
+    saturar : boolean, optional
+        If true the values out of range saturate, if false they wrap around
+        like two's complement. The default is True.
+
+    Returns
+    -------
+    v : int Array
+        Values in [-2**(bits-1), 2**(bits-1) - 1]
+    desbordes : int
+        Number of values that were out of range
+
+    '''
+    lim = int64(1) << (bits - 1)
+    fuera = (v >= lim) | (v < -lim)
+    desbordes = int(fuera.sum())
+    if not desbordes:
+        return v, 0
+    if saturar:
+        return clip(v, -lim, lim - 1), desbordes
+    return ((v + lim) & (2*lim - 1)) - lim, desbordes
+
+def Quantize(x, bits, frac = None, saturar = True):
+    '''
+    Quantize x to signed words of bits with frac fraction bits
+
+    Returns
+    -------
+    q : int Array
+        Quantized values
+    frac : int
+        Fraction bits (see Frac)
+
+    '''
+    x = asarray(x, dtype = float)
+    if frac is None:
+        frac = Frac(x, bits)
+    q = npround(x*2.0**frac).astype(int64)
+    return Wrap(q, bits, saturar)[0], frac
+
+def Shift(acc, frac, redondeo = True):
+    # Arithmetic shift of the accumulator, rounding to the nearest or
+    # truncating towards -inf like a plain shift. frac can be an Array that
+    # broadcasts with acc
+    frac = asarray(frac, dtype = int64)
+    acc = acc << maximum(-frac, 0)
+    derecha = maximum(frac, 0)
+    if redondeo:
+        acc = acc + where(derecha > 0, int64(1) << maximum(derecha - 1, 0), 0)
+    return acc >> derecha
+
+def TapsResp(h, w):
+    # Response of the taps h at the frequencies w
+    return (h[:, None]*exp(-1j*w*arange(len(h))[:, None])).sum(axis = 0)
+
+def QuantizeFIR(h, bits = 16):
+    '''
+    Quantize the taps of Filter.FIR or Filter.Equiripple
+
+    Parameters
+    ----------
+    h : Array
+        Taps of the filter
+    bits : int, optional
+        Length of the words. The default is 16, Q15.
+
+    Returns
+    -------
+    q : int Array
+        Quantized taps
+    frac : int
+        Fraction bits of the taps, the output of the accumulator is shifted
+        by frac
+
+    '''
+    return Quantize(h, bits)
+
+def Scaling(sos, N = 1024):
+    '''
+    L-infinity scaling of a cascade: the numerator of every section is
+    scaled so the peak gain from the input to its output is one, no
+    sinusoid of amplitude below one overflows inside the cascade
+
+    Parameters
+    ----------
+    sos : Array
+        Normalized sections (n, 6) (see SOSArray)
+    N : int, optional
+        Points of the frequency grid. The default is 1024.
+
+    Returns
+    -------
+    sos : Array
+        Scaled sections
+    ganancia : float
+        Gain removed from the cascade, multiply the output by it to recover
+        the original response
+
+    '''
+    w = Grid(N)
+    # Response of each section alone, then of the cascade up to each one
+    H = DigitalResp(sos[:, None, :], w)[2]
+    pico = npabs(cumprod(H, axis = 0)).max(axis = 1)
+    anterior = concatenate(([1.], pico[:-1]))
+    sos = sos.copy()
+    sos[:, :3] *= (anterior/pico)[:, None]
+    return sos, float(pico[-1])
+
+def QuantizeSOS(IIR, bits = 16, escalar = True):
+    '''
+    Quantize the sections of Filter.BilinearTF for a direct form I cascade.
+    The numerator and the denominator of each section have their own
+    format, so the small numerators of narrow filters keep their precision.
+    The difference between both formats is limited so the aligned products
+    fit in a 64 bit accumulator
+
+    Parameters
+    ----------
+    IIR : SectionBank, list or Array
+        The sections of a IIR digital filter or an Array (n, 6)
+    bits : int, optional
+        Length of the words. The default is 16, Q15.
+    escalar : boolean, optional
+        If true the sections are scaled with Scaling. The default is True.
+
+    Returns
+    -------
+    q : int Array
+        Array (n, 6) of quantized sections [b0, b1, b2, a0, a1, a2], a0 is
+        2**frac
+    frac : int Array
+        Array (n, 2) with the fraction bits of the numerator and the
+        denominator of each section
+    ganancia : float
+        Gain removed by the scaling
+
+    '''
+    sos = SOSArray(IIR)
+    ganancia = 1.
+    if escalar:
+        sos, ganancia = Scaling(sos)
+    q = zeros(sos.shape, dtype = int64)
+    frac = zeros((len(sos), 2), dtype = int)
+    margen = max(0, 62 - 2*bits)
+    for i, fila in enumerate(sos):
+        fa = Frac(fila[3:], bits)
+        fb = min(Frac(fila[:3], bits), fa + margen)
+        q[i, :3], frac[i, 0] = Quantize(fila[:3], bits, fb)
+        q[i, 3:], frac[i, 1] = Quantize(fila[3:], bits, fa)
+    return q, frac, ganancia
+
+def Align(q, frac):
+    '''
+    Coefficients [b0, b1, b2, a1, a2] of the quantized sections aligned to
+    the larger of the two formats of each section, and that format
+    '''
+    q = asarray(q, dtype = int64)
+    frac = asarray(frac, dtype = int64)
+    f = maximum(frac[:, 0], frac[:, 1])
+    alineados = stack([q[:, k] << (f - frac[:, 0]) for k in range(3)] +
+                      [q[:, k] << (f - frac[:, 1]) for k in (4, 5)], axis = 1)
+    return alineados, f
+
+def Headroom(q, frac, bits):
+    '''
+    Bits to spare in the 64 bit accumulator of SimulateFIR or SimulateSOS:
+    63 minus the bits of the largest sum of products of words of bits with
+    the coefficients, plus the rounding of the shift. A negative value means
+    that the accumulator can wrap around, like the 32 bit words, whose
+    products already take 62 bits
+
+    Parameters
+    ----------
+    q, frac : int Array
+        Output of QuantizeSOS (q is 2D) or QuantizeFIR (q is 1D)
+    bits : int
+        Length of the words
+
+    Returns
+    -------
+    margen : float
+        Bits to spare, the simulation is exact if it is positive
+
+    '''
+    if asarray(q).ndim == 2:
+        # In float, the shifts of Align could wrap around themselves
+        frac = asarray(frac, dtype = float)
+        f = maximum(frac[:, 0], frac[:, 1])
+        escala = 2.0**(f[:, None] - frac[:, [0, 0, 0, 1, 1]])
+        coef = npabs(asarray(q, dtype = float)[:, [0, 1, 2, 4, 5]])*escala
+    else:
+        f = asarray(frac, dtype = float)
+        coef = npabs(asarray(q, dtype = float))
+    cota = coef.sum(axis = -1)*2.0**(bits - 1) + 2.0**(f - 1)
+    return float(63 - log2(cota.max()))
+
+def Fits(q, frac, bits):
+    # The simulators refuse the words that can wrap the accumulator around
+    if Headroom(q, frac, bits) <= 0:
+        raise ValueError("Las palabras de {} bits desbordan el acumulador de 64 bits".format(bits))
+
+def Dequantize(q, frac):
+    '''
+    Float value of quantized taps or sections, to evaluate the response of
+    the quantized coefficients with frecResponse or DigitalResp
+    '''
+    q = asarray(q, dtype = float)
+    frac = asarray(frac)
+    if q.ndim == 2:
+        return q/2.0**frac.repeat(3, axis = 1)
+    return q/2.0**frac
+
+def SimulateFIR(q, frac, x, bits = 16, saturar = True, redondeo = True):
+    '''
+    Filter with integer arithmetic: the input is quantized to the format
+    Q(bits-1), the products are added in a 64 bit accumulator and the
+    accumulator is shifted and brought back to a word of bits
+
+    Parameters
+    ----------
+    q, frac : int Array, int
+        Output of QuantizeFIR
+    x : Array
+        Signal in [-1, 1), time in axis 0, a 2D Array has one signal per
+        column
+    bits : int, optional
+        Length of the words. The default is 16.
+    saturar : boolean, optional
+        Saturate or wrap around the overflows (see Wrap). The default is True.
+    redondeo : boolean, optional
+        Round or truncate the shift (see Shift). The default is True.
+
+    Returns
+    -------
+    y : Array
+        Output as float, same length of x
+    desbordes : int
+        Number of output samples that overflowed
+
+    Raises
+    ------
+    ValueError
+        If the sum of the products can wrap the accumulator (see Headroom).
+
+    '''
+    Fits(q, frac, bits)
+    xq = Quantize(x, bits, bits - 1)[0]
+    q = asarray(q, dtype = int64)
+    # Every output and column at once: the windows of len(q) inputs ending
+    # at each sample times the reversed taps, exact in 64 bits
+    xp = concatenate((zeros((len(q) - 1,) + xq.shape[1:], dtype = int64), xq))
+    acc = sliding_window_view(xp, len(q), axis = 0) @ q[::-1]
+    y, desbordes = Wrap(Shift(acc, frac, redondeo), bits, saturar)
+    return y/2.0**(bits - 1), desbordes
+
+def SimulateSOS(q, frac, x, bits = 16, saturar = True, redondeo = True, yi = None):
+    '''
+    Filter with integer arithmetic a direct form I cascade. The signals are
+    Q(bits-1) words, each section aligns its five products to the larger of
+    its two formats, adds them in a 64 bit accumulator, shifts it back and
+    brings it to a word.
+    
+    Every section and every column of x advance together: the section i
+    filters the sample n - i in the step n, so its input is the output of
+    the section i - 1 of the step before, and the cascade takes
+    len(x) + len(q) - 1 vectorized steps. The loop over the samples stays:
+    the rounding and the saturation of each output feed the next one, so
+    the recursion is not a linear filter that lfilter or a FFT could run.
+    Each step takes some tens of microseconds, for signals longer than
+    about 10**5 samples the float response of the quantized coefficients
+    (Dequantize) is the practical estimate
+
+    Parameters
+    ----------
+    q, frac : int Array
+        Output of QuantizeSOS
+    x : Array
+        Signal in [-1, 1), time in axis 0, a 2D Array has one signal per
+        column
+    bits : int, optional
+        Length of the words. The default is 16.
+    saturar : boolean, optional
+        Saturate or wrap around the overflows (see Wrap). The default is True.
+    redondeo : boolean, optional
+        Round or truncate the shift (see Shift). The default is True.
+    yi : int Array, optional
+        Initial outputs y[-1], y[-2] of each section, shape (n, 2) or
+        (n, 2, columns). The default is None, zeros.
+
+    Returns
+    -------
+    y : Array
+        Output as float with the shape of x, without the gain of the scaling
+    desbordes : int
+        Number of section outputs that overflowed
+
+    Raises
+    ------
+    ValueError
+        If the sum of the products can wrap the accumulator (see Headroom).
+
+    '''
+    Fits(q, frac, bits)
+    x = asarray(x, dtype = float)
+    s = Quantize(x, bits, bits - 1)[0]
+    L, S = len(s), len(q)
+    # Coefficients aligned to the format of each section, one row per
+    # section that broadcasts with the columns
+    alineados, f = Align(q, frac)
+    forma = (S,) + (1,)*(s.ndim - 1)
+    b0, b1, b2, a1, a2 = (alineados[:, k].reshape(forma) for k in range(5))
+    f = f.reshape(forma)
+    
+    estado = (S,) + s.shape[1:]
+    x1, x2 = zeros(estado, dtype = int64), zeros(estado, dtype = int64)
+    y1, y2 = zeros(estado, dtype = int64), zeros(estado, dtype = int64)
+    if yi is not None:
+        yi = asarray(yi, dtype = int64)
+        yi = yi.reshape(yi.shape + (1,)*(len(estado) + 1 - yi.ndim))
+        y1, y2 = y1 + yi[:, 0], y2 + yi[:, 1]
+    entrada = zeros(estado, dtype = int64)
+    salida = empty(s.shape, dtype = int64)
+    desbordes = 0
+    for n in range(L + S - 1):
+        # The section 0 takes the sample n, the others the output of the
+        # section before them in the step n - 1
+        entrada[1:] = y1[:-1]
+        entrada[0] = s[n] if n < L else 0
+        acc = b0*entrada + b1*x1 + b2*x2 - a1*y1 - a2*y2
+        if S - 1 <= n < L:
+            yn, d = Wrap(Shift(acc, f, redondeo), bits, saturar)
+            x2, x1, y2, y1 = x1, entrada.copy(), y1, yn
+        else:
+            # Filling or emptying the cascade, the sections without a
+            # sample keep their state
+            m = n - arange(S)
+            activa = ((m >= 0) & (m < L)).reshape(forma)
+            yn, d = Wrap(where(activa, Shift(acc, f, redondeo), 0), bits, saturar)
+            x2, x1 = where(activa, x1, x2), where(activa, entrada, x1)
+            y2, y1 = where(activa, y1, y2), where(activa, yn, y1)
+        desbordes += d
+        if n >= S - 1:
+            salida[n - S + 1] = y1[-1]
+    return salida/2.0**(bits - 1), desbordes
+
+def Decay(q, frac, bits = 16, maximo = 2**15):
+    '''
+    Samples that the slowest pole of the quantized sections needs to decay
+    from full scale to one least significant bit
+
+    Returns
+    -------
+    muestras : int
+        Number of samples, maximo if a pole is on or outside the unit circle
+
+    '''
+    sos = Dequantize(q, frac)
+    radio = max(npabs(roots(fila[3:])).max(initial = 0) for fila in sos)
+    if radio >= 1:
+        return maximo
+    if radio == 0:
+        return 2
+    return int(min(maximo, ceil(bits*log(2)/-log(radio))))
+
+def LimitCycle(q, frac, bits = 16, muestras = None, pruebas = 32, saturar = True, redondeo = True, semilla = 0):
+    '''
+    Amplitude of the zero input limit cycles: the cascade starts from random
+    states and is fed with zeros, a stable float filter decays to zero while
+    the quantized one can keep oscillating
+
+    Parameters
+    ----------
+    muestras : int, optional
+        Length of the simulation. The default is None, four times the decay
+        of the float filter (see Decay).
+    pruebas : int, optional
+        Number of random initial states, simulated together. The default
+        is 32.
+
+    Returns
+    -------
+    amplitud : int
+        Largest output in the last quarter of the simulation in units of the
+        least significant bit, 0 if there is no limit cycle
+
+    '''
+    if muestras is None:
+        muestras = 4*Decay(q, frac, bits) + 256
+    generador = random.default_rng(semilla)
+    lim = 1 << (bits - 3)
+    yi = generador.integers(-lim, lim, (len(q), 2, pruebas))
+    y = SimulateSOS(q, frac, zeros((muestras, pruebas)), bits, saturar, redondeo, yi)[0]
+    return int(npabs(y[-muestras//4:]).max()*2**(bits - 1) + .5)
+
+def FixedResponse(q, frac, bits = 16, N = 64, amplitud = .5, muestras = None, saturar = True, redondeo = True):
+    '''
+    Response of the quantized coefficients and response measured with
+    integer arithmetic, to compare both with the float design. The
+    simulation feeds N cosines at once, one per column, and fits the
+    amplitude and phase of the last half of the output
+
+    Parameters
+    ----------
+    q, frac : int Array
+        Output of QuantizeSOS (q is 2D) or QuantizeFIR (q is 1D)
+    N : int, optional
+        Number of frequencies of the simulation. The default is 64.
+    amplitud : float, optional
+        Amplitude of the sinusoids. The default is 0.5.
+    muestras : int, optional
+        Length of the simulation. The default is None, enough for the
+        transient to end before the last half.
+
+    Returns
+    -------
+    w : Array
+        Normalized angular frequencies of the simulation
+    Hcoef : complex Array
+        Exact response of the quantized coefficients at w
+    Hsim : complex Array
+        Response measured with the integer simulation at w
+    desbordes : int
+        Number of overflows of the simulation
+
+    '''
+    IIR = asarray(q).ndim == 2
+    if muestras is None:
+        muestras = 2*(Decay(q, frac, bits) if IIR else len(q)) + 1024
+    w = Grid(N)
+    n = arange(muestras)[:, None]
+    x = amplitud*cos(w*n)
+    if IIR:
+        Hcoef = DigitalResp(Dequantize(q, frac), w)[2]
+        y, desbordes = SimulateSOS(q, frac, x, bits, saturar, redondeo)
+    else:
+        Hcoef = TapsResp(Dequantize(q, frac), w)
+        y, desbordes = SimulateFIR(q, frac, x, bits, saturar, redondeo)
+    # Least squares fit of y = c cos(wn) + s sin(wn) over the steady state,
+    # the output is A|H|cos(wn + phi) so H = (c - js)/A
+    m = muestras//2
+    Hsim = zeros(N, dtype = complex)
+    for i in range(N):
+        base = stack((cos(w[i]*n[m:, 0]), sin(w[i]*n[m:, 0])), axis = 1)
+        (c, s), *_ = lstsq(base, y[m:, i], rcond = None)
+        Hsim[i] = (c - 1j*s)/amplitud
+    return w, Hcoef, Hsim, desbordes
+
+def Bands(w, fp, fr, fs, HP = False):
+    # Masks of the pass and reject bands on the normalized grid w
+    f1, f2 = sorted((fp*2*pi/fs, fr*2*pi/fs))
+    baja, alta = w <= f1, w >= f2
+    return (alta, baja) if HP else (baja, alta)
+
+def MeetsSpec(H, w, Ap, Ar, fp, fr, fs, HP = False):
+    '''
+    Ripple of the pass band and attenuation of the reject band of a
+    response, relative to the peak of the pass band
+
+    Returns
+    -------
+    rizo : float
+        Difference in dB between the peak and the valley of the pass band
+    atenuacion : float
+        Difference in dB between the peak of the pass band and the peak of
+        the reject band
+
+    '''
+    paso, rechazo = Bands(w, fp, fr, fs, HP)
+    Hdb = 20*log10(npabs(H) + 1e-300)
+    pico = Hdb[paso].max()
+    return pico - Hdb[paso].min(), pico - Hdb[rechazo].max()
+
+def MinimumBits(Filtro, Ap, Ar, fp, fr, fs, HP = False, palabras = range(8, 32), tolerancia = .1, ciclos = True, N = 2048):
+    '''
+    Shortest word that keeps the design inside the specification. The
+    float design sets the reference: the quantized response can not have
+    more ripple than max(Ap, ripple of the float design) or less attenuation
+    than min(Ar, attenuation of the float design), with tolerancia dB of
+    margin. The zero input limit cycles of IIR designs must also stay
+    below Ar decibels from full scale, so the idle output is not louder
+    than what the reject band lets through. The words without Headroom in
+    the 64 bit accumulator are skipped
+
+    Parameters
+    ----------
+    Filtro : list or Array
+        Output of Filter.BilinearTF, or the taps of a FIR filter
+    Ap, Ar, fp, fr, fs, HP :
+        Specification of the design, like Filter.Design
+    palabras : iterable, optional
+        Lengths of word to try in increasing order. The default is 8 to 31.
+    tolerancia : float, optional
+        Margin in dB. The default is 0.1.
+    ciclos : boolean, optional
+        Check the limit cycles of IIR designs. The default is True.
+    N : int, optional
+        Points of the frequency grid. The default is 2048.
+
+    Returns
+    -------
+    bits : int
+        Length of the word, None if no word meets the specification
+    informe : dict
+        Ripple, attenuation, frac, limit cycle amplitude, overflows and
+        respuesta (w, Hcoef, Hsim of FixedResponse) of the chosen word
+
+    '''
+    w = Grid(N)
+    IIR = isinstance(Filtro, (list, tuple)) or asarray(Filtro).ndim == 2
+    if IIR:
+        Hf = DigitalResp(SecArray(Filtro, analog = False), w)[2]
+    else:
+        Hf = TapsResp(asarray(Filtro, dtype = float), w)
+    rizo, atenuacion = MeetsSpec(Hf, w, Ap, Ar, fp, fr, fs, HP)
+    rizo = max(Ap, rizo) + tolerancia
+    atenuacion = min(Ar, atenuacion) - tolerancia
+
+    for bits in palabras:
+        if IIR:
+            q, frac, ganancia = QuantizeSOS(Filtro, bits)
+            H = DigitalResp(Dequantize(q, frac), w)[2]
+        else:
+            q, frac = QuantizeFIR(Filtro, bits)
+            H = TapsResp(Dequantize(q, frac), w)
+        r, a = MeetsSpec(H, w, Ap, Ar, fp, fr, fs, HP)
+        if r > rizo or a < atenuacion or Headroom(q, frac, bits) <= 0:
+            continue
+        informe = {"bits": bits, "frac": asarray(frac).tolist(), "rizo": float(r),
+                   "atenuacion": float(a), "ciclo_limite": 0}
+        if IIR:
+            informe["ganancia"] = ganancia
+            if ciclos:
+                informe["ciclo_limite"] = LimitCycle(q, frac, bits)
+                if informe["ciclo_limite"] > 2**(bits - 1)*10**(-Ar/20):
+                    continue
+        w, Hcoef, Hsim, informe["desbordes"] = FixedResponse(q, frac, bits)
+        informe["respuesta"] = (w, Hcoef, Hsim)
+        return bits, informe
+    return None, {}
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:12:26 2026
+
+Parallel filtering of signals with many channels, the channels are split in
+groups and each group is filtered by a worker
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from numpy import asarray, empty, ndarray, float64, array_split, arange
+from Resources.Stream import CreateStream
+
+def Groups(canales, workers):
+    '''
+    Split the channels in contiguous groups, one for each worker
+
+    Parameters
+    ----------
+    canales : int
+        Number of channels
+    workers : int
+        Number of workers
+
+    Returns
+    -------
+    grupos : list
+        List of slices of the channels
+
+    '''
+    grupos = array_split(arange(canales), max(1, min(workers, canales)))
+    return [slice(g[0], g[-1] + 1) for g in grupos if len(g)]
+
+class ParallelStream:
+    """
+    Stream filter of blocks (samples, channels), each group of channels has
+    its own stream filter and the groups are filtered in a pool of threads.
+    The NumPy and SciPy kernels release the GIL, and every channel is filtered
+    with the same operations than in serial, so the result is bit identical.
+    """
+    def __init__(self, Filtro, workers = None, metodo = 'auto'):
+        '''
+        Parameters
+        ----------
+        Filtro : list or Array
+            Output of Filter.BilinearTF or Filter.FIR
+        workers : int, optional
+            Number of threads. The default is None, the number of cores.
+        metodo : str, optional
+            Convolution method of a FIR filter (see CreateStream). The default
+            is 'auto'.
+
+        '''
+        self.Filtro = Filtro
+        self.metodo = metodo
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ThreadPoolExecutor(self.workers)
+        self.grupos = None
+        self.streams = None
+    
+    def reset(self):
+        '''
+        Forgets the state, the next block starts a new signal
+        '''
+        self.grupos = None
+        self.streams = None
+    
+    def process(self, x):
+        '''
+        Filters a block (samples, channels) and keeps the state for the next one
+        '''
+        x = asarray(x, dtype = float64)
+        if self.grupos is None:
+            self.grupos = Groups(x.shape[1], self.workers)
+            self.streams = [CreateStream(self.Filtro, self.metodo) for g in self.grupos]
+        
+        y = empty(x.shape)
+        def tarea(k):
+            g = self.grupos[k]
+            y[:, g] = self.streams[k].process(x[:, g])
+        # list() waits for the groups and raises their exceptions
+        list(self.pool.map(tarea, range(len(self.grupos))))
+        return y
+    
+    def __call__(self, bloques):
+        '''
+        Generator that filters an iterable of blocks
+        '''
+        for x in bloques:
+            yield self.process(x)
+    
+    def close(self):
+        self.pool.shutdown()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *args):
+        self.close()
+
+def _proceso(args):
+    # Worker of a process pool, filters a group of channels in shared memory
+    entrada, salida, shape, g, Filtro, metodo = args
+    shm_in, shm_out = SharedMemory(entrada), SharedMemory(salida)
+    try:
+        x = ndarray(shape, float64, buffer = shm_in.buf)
+        y = ndarray(shape, float64, buffer = shm_out.buf)
+        y[:, g] = CreateStream(Filtro, metodo).process(x[:, g])
+        del x, y
+    finally:
+        shm_in.close()
+        shm_out.close()
+
+def FilterChannels(Filtro, x, workers = None, modo = 'hilos', metodo = 'auto'):
+    '''
+    Filter all the channels of a signal in parallel
+
+    Parameters
+    ----------
+    Filtro : list or Array
+        Output of Filter.BilinearTF or Filter.FIR
+    x : Array
+        Signal (samples, channels)
+    workers : int, optional
+        Number of workers. The default is None, the number of cores.
+    modo : str, optional
+        'hilos' for a pool of threads or 'procesos' for a pool of processes
+        that share the signal with shared memory. The default is 'hilos'.
+    metodo : str, optional
+        Convolution method of a FIR filter (see CreateStream). The default
+        is 'auto'.
+
+    Returns
+    -------
+    y : Array
+        Filtered signal, bit identical to filter the channels in serial
+
+    '''
+    x = asarray(x, dtype = float64)
+    workers = workers or os.cpu_count() or 1
+    
+    if modo == 'hilos':
+        with ParallelStream(Filtro, workers, metodo) as stream:
+            return stream.process(x)
+    elif modo != 'procesos':
+        raise ValueError("modo debe ser 'hilos' o 'procesos'")
+    
+    shm_in = SharedMemory(create = True, size = max(x.nbytes, 1))
+    shm_out = SharedMemory(create = True, size = max(x.nbytes, 1))
+    try:
+        ndarray(x.shape, float64, buffer = shm_in.buf)[:] = x
+        tareas = [(shm_in.name, shm_out.name, x.shape, g, Filtro, metodo)
+                  for g in Groups(x.shape[1], workers)]
+        with ProcessPoolExecutor(len(tareas)) as pool:
+            list(pool.map(_proceso, tareas))
+        y = ndarray(x.shape, float64, buffer = shm_out.buf).copy()
+    finally:
+        for shm in (shm_in, shm_out):
+            shm.close()
+            shm.unlink()
+    return y
@@ -6,40 +6,261 @@ Created on Thu Mar  3 22:48:40 2022
 @author: Gerardo Ortíz Montufar
 """
 
-from numpy import logspace,log10,pi,angle,ones, complex128
-from scipy.signal import freqresp, freqz
+from numpy import logspace,log10,pi,angle
+from numpy import asarray, zeros, exp, linspace, geomspace, concatenate, ceil, log2
+from numpy import arange, errstate
+from numpy.fft import rfft
+from Resources.Sections import SectionBank, SecArray
+
+# Maximum number of section-frequency points evaluated at once
+BLOCK = 2**20
+
+def Cascade(num, den, log = False):
+    '''
+    Multiply the responses num/den of all the sections of a filter
+
+    Parameters
+    ----------
+    num : complex Array
+        Array (..., n, M) with the numerator of the n sections at M points
+    den : complex Array
+        Array (..., n, M) with the denominator of the n sections at M points
+    log : boolean, optional
+        If true the gain is accumulated as a sum of logarithms, so high
+        orders do not overflow or underflow. The default is False.
+
+    Returns
+    -------
+    Hdb : Array
+        Gain in dB
+    Hphi : Array
+        Phase in radians in [-pi, pi]
+    H : Array
+        Complex response
+
+    '''
+    if log:
+        Hdb = 20*(log10(abs(num)) - log10(abs(den))).sum(axis = -2)
+        Hphi = angle(exp(1j*(angle(num) - angle(den)).sum(axis = -2)))
+        return Hdb, Hphi, 10**(Hdb/20)*exp(1j*Hphi)
+    
+    num /= den
+    H = num.prod(axis = -2)
+    return 20*log10(abs(H)), angle(H), H
+
+def Blocks(func, sec, w, log = False):
+    '''
+    Evaluate func(sec, w, log) over blocks of w, so a dense grid over many
+    sections never holds more than BLOCK complex points per array
+    '''
+    sec = asarray(sec, dtype = float)
+    w = asarray(w, dtype = float)
+    size = max(1, BLOCK//max(1, sec[..., 0].size))
+    if w.size <= size:
+        return func(sec, w, log)
+    
+    partes = [func(sec, w[i:i+size], log) for i in range(0, w.size, size)]
+    return tuple(concatenate(p, axis = -1) for p in zip(*partes))
+
+def _analog(sec, w, log):
+    sec = sec[..., None, :]
+    w2 = w*w
+    # c0 (jw)^2 + c1 jw + c2 with the real and imaginary parts
+    num = (sec[..., 2] - sec[..., 0]*w2) + 1j*(sec[..., 1]*w)
+    den = (sec[..., 5] - sec[..., 3]*w2) + 1j*(sec[..., 4]*w)
+    return Cascade(num, den, log)
+
+def _digital(sec, w, log):
+    sec = sec[..., None, :]
+    z1 = exp(-1j*w)
+    z2 = z1*z1
+    # c0 + c1 z^-1 + c2 z^-2
+    num = sec[..., 0] + sec[..., 1]*z1 + sec[..., 2]*z2
+    den = sec[..., 3] + sec[..., 4]*z1 + sec[..., 5]*z2
+    return Cascade(num, den, log)
+
+def AnalogResp(sec, w, log = False):
+    '''
+    Evaluate all the analog sections at s = jw in one broadcast operation
+
+    Parameters
+    ----------
+    sec : Array
+        Array (..., n, 6) of analog sections (see SecArray)
+    w : Array
+        Angular frequencies
+    log : boolean, optional
+        If true the gain is accumulated as a sum of logarithms. The default
+        is False.
+
+    Returns
+    -------
+    Hdb, Hphi, H : Array
+        Gain in dB, phase in radians and complex response (see Cascade)
+
+    '''
+    return Blocks(_analog, sec, w, log)
+
+def DigitalResp(sec, w, log = False):
+    '''
+    Evaluate all the digital sections at z = e^jw in one broadcast operation
+
+    Parameters
+    ----------
+    sec : Array
+        Array (..., n, 6) of digital sections (see SecArray)
+    w : Array
+        Normalized angular frequencies in [0, pi]
+    log : boolean, optional
+        If true the gain is accumulated as a sum of logarithms. The default
+        is False.
+
+    Returns
+    -------
+    Hdb, Hphi, H : Array
+        Gain in dB, phase in radians and complex response (see Cascade)
+
+    '''
+    return Blocks(_digital, sec, w, log)
+
+def GroupDelay(sec, w, analog = True):
+    '''
+    Group delay of a cascade of sections, the sum of the delays of every
+    numerator minus the delays of every denominator. The delay is undefined
+    at the zeros on the axis, there it is nan
+
+    Parameters
+    ----------
+    sec : Array
+        Array (..., n, 6) of sections (see SecArray)
+    w : Array
+        Angular frequencies, normalized in [0, pi] for digital sections
+    analog : boolean, optional
+        If true the sections are polynomials of s. The default is True.
+
+    Returns
+    -------
+    gd : Array
+        Group delay in seconds for analog sections and in samples for
+        digital sections
+
+    '''
+    sec = asarray(sec, dtype = float)[..., None, :]
+    w = asarray(w, dtype = float)
+    
+    def retardo(c0, c1, c2):
+        if analog:
+            # Re(P'(jw)/P(jw)) of P(s) = c0 s^2 + c1 s + c2
+            s = 1j*w
+            return ((2*c0*s + c1)/(c0*s*s + c1*s + c2)).real
+        # Re(sum k c_k z^-k / P) of P = c0 + c1 z^-1 + c2 z^-2
+        z1 = exp(-1j*w)
+        return ((c1*z1 + 2*c2*z1*z1)/(c0 + c1*z1 + c2*z1*z1)).real
+    
+    with errstate(divide = 'ignore', invalid = 'ignore'):
+        if analog:
+            gd = retardo(sec[..., 3], sec[..., 4], sec[..., 5]) - retardo(sec[..., 0], sec[..., 1], sec[..., 2])
+        else:
+            gd = retardo(sec[..., 0], sec[..., 1], sec[..., 2]) - retardo(sec[..., 3], sec[..., 4], sec[..., 5])
+    return gd.sum(axis = -2)
+
+def TapsDelay(h, N = None):
+    '''
+    Group delay in samples of the taps of a FIR filter over the half
+    spectrum of FFTLength, Re(FFT(n h[n])/FFT(h[n]))
+
+    Returns
+    -------
+    w : Array
+        Normalized frequencies
+    gd : Array
+        Group delay in samples, nan at the zeros of the response
+
+    '''
+    h = asarray(h, dtype = float)
+    nfft, paso = FFTLength(len(h), N)
+    with errstate(divide = 'ignore', invalid = 'ignore'):
+        gd = (rfft(arange(len(h))*h, nfft)/rfft(h, nfft)).real[:nfft//2:paso]
+    return 2*pi*arange(0, nfft//2, paso)/nfft, gd
+
+def FFTLength(taps, N = None):
+    '''
+    Length of the zero padded FFT used for the response of a FIR filter
+
+    Parameters
+    ----------
+    taps : int
+        Number of taps of the filter
+    N : int, optional
+        Number of points of the half spectrum. The default is None, that
+        chooses a power of two with at least 8 points per tap and 512 points.
+
+    Returns
+    -------
+    nfft : int
+        Length of the FFT, a multiple of 2N that is not shorter than the
+        taps
+    paso : int
+        Step of the bins of the half spectrum, the bins 0, paso, 2 paso, ...
+        are the N frequencies pi k/N of Grid(N)
+
+    '''
+    if N:
+        N = int(N)
+        paso = max(-(-int(taps)//(2*N)), 1)
+        return 2*N*paso, paso
+    return int(2**ceil(log2(max(8*taps, 1024)))), 1
+
+def Grid(N, escala = 'lin', wmin = None):
+    '''
+    Normalized frequency grid in [0, pi) like freqz
+
+    Parameters
+    ----------
+    N : int
+        Number of points
+    escala : str, optional
+        'lin' for linear spacing or 'log' for logarithmic spacing.
+        The default is 'lin'.
+    wmin : float, optional
+        First frequency of a log grid, it must be lower than pi.
+        The default is pi/N.
+
+    Returns
+    -------
+    w : Array
+        The frequencies
+
+    '''
+    if escala == 'lin':
+        return linspace(0, pi, N, endpoint = False)
+    elif escala == 'log':
+        if not wmin or wmin >= pi:
+            wmin = pi/N
+        return geomspace(wmin, pi, N, endpoint = False)
+    raise ValueError("escala debe ser 'lin' o 'log'")
 
 class frecResponse:
     
-    def Fltr(self, SYS,fc):
-        wx = logspace(0,2,2000)*fc
-        Ny = ones(len(wx),complex128)
-        
-        for i in range(len(SYS)):
-            W, HB = freqresp(SYS[i], wx)
-            Ny *= HB
-        
-        Hdb = 20*log10(abs(Ny))
-        Hphi = angle(Ny)
+    def Fltr(self, SYS, fc, log = False):
+        W = logspace(0,2,2000)*fc
+        Hdb, Hphi, Ny = AnalogResp(SecArray(SYS), W, log)
         
         return W/(2*pi), Hdb, Hphi, Ny
     
     
-    def IIR(self, SYS, fc, sps):
-        W, HB = freqz(SYS[0][0], SYS[0][1], whole = False, fs = 2*pi*sps)
-        Ny = HB
-        for i in range(1,len(SYS)):
-            W, HB = freqz(SYS[i][0], SYS[i][1], whole = False, fs = 2*pi*sps)
-            Ny *= HB
-        
-        Hdb = 20*log10(abs(Ny))
-        Hphi = angle(Ny)
+    def IIR(self, SYS, fc, sps, N = 512, escala = 'lin', log = False):
+        # A log grid starts two decades below the cutoff frequency
+        w = Grid(N, escala, 2*pi*fc/(100*sps))
+        Hdb, Hphi, Ny = DigitalResp(SecArray(SYS, analog = False), w, log)
         
-        return W/(2*pi), Hdb, Hphi, Ny
+        return w*sps/(2*pi), Hdb, Hphi, Ny
     
     
-    def FIR(self, h):
-        w, H = freqz(h, [1])
+    def FIR(self, h, N = None):
+        # Half spectrum [0, pi) of a zero padded real FFT, like freqz
+        nfft, paso = FFTLength(len(h), N)
+        H = rfft(h, nfft)[:nfft//2:paso]
+        w = 2*pi*arange(0, nfft//2, paso)/nfft
         
         return w, 20*log10(abs(H)), angle(H), H
-    
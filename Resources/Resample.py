@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 15:58:03 2026
+
+Polyphase decimation, interpolation and rational resampling with the
+anti-alias filters of Filter.FIR
+"""
+
+from math import gcd
+from numpy import asarray, zeros, arange, concatenate
+from numpy.lib.stride_tricks import sliding_window_view
+from Resources.Filters import Filter
+from Resources.Stream import StreamFilter
+
+def AntiAlias(L, M, Ar = 60, transicion = 0.1):
+    '''
+    Design with the windows method the low pass filter of a resampler L/M,
+    the cutoff frequency is pi/max(L, M) at the rate of the upsampled signal
+
+    Parameters
+    ----------
+    L : int
+        Interpolation factor
+    M : int
+        Decimation factor
+    Ar : float, optional
+        Attenuation in the reject band in decibels. The default is 60.
+    transicion : float, optional
+        Width of the transition band as a fraction of the cutoff frequency.
+        The default is 0.1.
+
+    Returns
+    -------
+    h : Array
+        Taps of the filter with gain L
+
+    '''
+    K = max(L, M)
+    fp = (1 - transicion/2)/(2*K)
+    fr = (1 + transicion/2)/(2*K)
+    wc, h = Filter.FIR(1, Ar, fp, fr, 1)
+    return L*h
+
+class Resampler(StreamFilter):
+    """
+    Polyphase resampler by L/M. The filter h is split in L subfilters
+    h[p::L] and only the output samples that are kept are computed, each one
+    with one subfilter, so the cost scales with the output rate. The last
+    input samples are kept between blocks, so resampling a signal by blocks
+    gives the same samples that resampling it at once. The blocks have the
+    time in axis 0.
+    """
+    def __init__(self, L = 1, M = 1, h = None, Ar = 60, transicion = 0.1):
+        '''
+        Parameters
+        ----------
+        L : int, optional
+            Interpolation factor. The default is 1.
+        M : int, optional
+            Decimation factor. The default is 1.
+        h : Array, optional
+            Taps of the filter at the upsampled rate. The default is None,
+            designed by AntiAlias with Ar and transicion.
+
+        '''
+        super().__init__()
+        g = gcd(int(L), int(M))
+        self.L, self.M = int(L)//g, int(M)//g
+        if h is None:
+            h = AntiAlias(self.L, self.M, Ar, transicion)
+        self.h = asarray(h, dtype = float)
+        # Polyphase matrix (L, K), row p is the subfilter h[p::L]
+        K = -(-len(self.h)//self.L)
+        self.E = zeros((self.L, K))
+        for p in range(self.L):
+            sub = self.h[p::self.L]
+            self.E[p, :len(sub)] = sub
+        self.reset()
+    
+    def reset(self):
+        super().reset()
+        self.entradas = 0
+        self.salidas = 0
+    
+    def initial(self, canales):
+        return zeros((self.E.shape[1] - 1,) + canales)
+    
+    def kernel(self, x):
+        L, M = self.L, self.M
+        K = self.E.shape[1]
+        xe = concatenate((self.zi, x))
+        base = self.entradas - len(self.zi)
+        self.entradas += len(x)
+        
+        # Outputs n with its last input floor(n M / L) already available
+        fin = (self.entradas*L - 1)//M + 1 if self.entradas else 0
+        n = arange(self.salidas, fin)
+        self.salidas = fin
+        
+        # The outputs n, n + L, n + 2L ... use the same subfilter and their
+        # inputs advance M samples, so each phase is one matrix product over
+        # a strided view of the windows of K inputs
+        y = zeros((len(n),) + x.shape[1:])
+        ventanas = sliding_window_view(xe, K, axis = 0)
+        for q in range(min(L, len(n))):
+            j0 = (n[q]*M)//L
+            s0 = j0 - base - K + 1
+            cuenta = len(range(q, len(n), L))
+            y[q::L] = ventanas[s0::M][:cuenta] @ self.E[(n[q]*M) % L, ::-1]
+        return y, xe[len(xe) - (K - 1):] if K > 1 else xe[:0]
+
+def Decimate(x, M, h = None, **kwargs):
+    '''
+    Decimate x by M, time in axis 0
+    '''
+    return Resampler(1, M, h, **kwargs).process(x)
+
+def Interpolate(x, L, h = None, **kwargs):
+    '''
+    Interpolate x by L, time in axis 0
+    '''
+    return Resampler(L, 1, h, **kwargs).process(x)
+
+def Resample(x, L, M, h = None, **kwargs):
+    '''
+    Resample x by L/M, time in axis 0
+    '''
+    return Resampler(L, M, h, **kwargs).process(x)
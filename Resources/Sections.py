@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 09:12:37 2026
+
+Sections of a filter in one Array, shared by the design and the response modules
+"""
+
+from numpy import asarray, zeros, ascontiguousarray, trim_zeros
+
+class SectionBank:
+    """
+    Sections of a filter in one contiguous Array (n, 6) of rows
+    [b0, b1, b2, a0, a1, a2] with the layout of SecArray and a mask of the
+    first order sections. The Array is handed to the response and filtering
+    kernels without copies, np.asarray(bank) is the Array. Iterating gives
+    the tuples (num, den) of the sections.
+    """
+    __slots__ = ("sec", "fos", "analog")
+    
+    def __init__(self, sec, fos = None, analog = True):
+        '''
+        Parameters
+        ----------
+        sec : Array
+            Array (n, 6) of sections (see SecArray)
+        fos : boolean Array, optional
+            Mask of the FOS. The default is None, a section is a FOS if its
+            denominator has no s^2 (analog) or z^-2 (digital) term.
+        analog : boolean, optional
+            If true the sections are polynomials of s. The default is True.
+
+        '''
+        self.sec = ascontiguousarray(sec, dtype = float).reshape(-1, 6)
+        if fos is None:
+            fos = self.sec[:, 3] == 0 if analog else self.sec[:, 5] == 0
+        self.fos = asarray(fos, dtype = bool).reshape(len(self.sec))
+        self.analog = bool(analog)
+    
+    @classmethod
+    def fromList(cls, SYS, analog = True):
+        '''
+        Bank of a list of tuples (num, den) of SOS and FOS
+        '''
+        fos = [len(den) == 2 for num, den in SYS]
+        return cls(SecArray(SYS, analog), fos, analog)
+    
+    def __len__(self):
+        return len(self.sec)
+    
+    def __array__(self, dtype = None, copy = None):
+        if dtype is None or dtype == self.sec.dtype:
+            return self.sec.copy() if copy else self.sec
+        return self.sec.astype(dtype)
+    
+    @property
+    def nbytes(self):
+        return self.sec.nbytes + self.fos.nbytes
+    
+    def __getitem__(self, i):
+        '''
+        A slice gives a bank that shares the Array, an index gives the
+        tuple (num, den) of the section
+        '''
+        if isinstance(i, slice):
+            return SectionBank(self.sec[i], self.fos[i], self.analog)
+        return self.section(self.sec[i], self.fos[i])
+    
+    def section(self, fila, fos):
+        # The polynomials without the padding, the numerator keeps one term
+        num, den = fila[:3].tolist(), fila[3:].tolist()
+        if self.analog:
+            return trim_zeros(num, 'f') or [0.], den[1:] if fos else den
+        return trim_zeros(num, 'b') or [0.], den[:2] if fos else den
+    
+    def __iter__(self):
+        for fila, fos in zip(self.sec, self.fos):
+            yield self.section(fila, fos)
+    
+    def tolist(self):
+        '''
+        List of tuples (num, den), the format of the sections before SectionBank
+        '''
+        return list(self)
+    
+    def __repr__(self):
+        return "SectionBank({} SOS, {} FOS, {})".format(
+            int((~self.fos).sum()), int(self.fos.sum()), "analog" if self.analog else "digital")
+
+def SecArray(SYS, analog = True):
+    '''
+    Stack a list of tuples (num, den) of SOS and FOS in an Array (n, 6) with
+    rows [b0, b1, b2, a0, a1, a2]. Analog polynomials are in descending powers
+    of s so they are left padded, digital polynomials are in ascending powers
+    of z^-1 so they are right padded. The Array of a SectionBank and an Array
+    are returned as they are.
+
+    Parameters
+    ----------
+    SYS : list or Array
+        Sections of a filter
+    analog : boolean, optional
+        If true the sections are polynomials of s. The default is True.
+
+    Returns
+    -------
+    sec : Array
+        Array (n, 6) of the sections
+
+    '''
+    if isinstance(SYS, SectionBank):
+        return SYS.sec
+    if not isinstance(SYS, (list, tuple)):
+        return asarray(SYS, dtype=float)
+    
+    sec = zeros((len(SYS), 6))
+    for i, (num, den) in enumerate(SYS):
+        if analog:
+            sec[i, 3-len(num):3] = num
+            sec[i, 6-len(den):6] = den
+        else:
+            sec[i, :len(num)] = num
+            sec[i, 3:3+len(den)] = den
+    return sec
@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 13:05:44 2026
+
+Stateful filtering of unbounded signals block by block
+"""
+
+from numpy import asarray, zeros, ndim, concatenate, convolve, empty, ceil, log2
+from numpy import moveaxis, allclose, arange, flatnonzero
+from numpy.fft import rfft, irfft
+from numpy.lib.stride_tricks import sliding_window_view
+from Resources.Sections import SecArray
+
+# Aproximate cost per output sample, in units of one tap of the direct
+# convolution: fixed cost of the direct method, cost per L log2(L) of a FFT
+# block, fixed cost of the FFT method and cost of the FFT calls of a chunk
+COSTO_DIRECTO = 30
+COSTO_FFT = 4
+COSTO_FFT_FIJO = 10
+COSTO_LLAMADA = 150000
+
+# Values gathered at once by FoldedConvolve
+FOLD_CHUNK = 2**20
+
+def FFTSize(taps, n = None):
+    '''
+    Choose the FFT length of the block convolution that minimizes the cost
+    per output sample of a FIR filter
+
+    Parameters
+    ----------
+    taps : int
+        Number of taps of the filter
+    n : int, optional
+        Number of samples of the chunks, the block is never longer than a
+        chunk. The default is None, chunks without limit, the FFT is searched
+        up to 2**20 points or twice the filter.
+
+    Returns
+    -------
+    L : int
+        Length of the FFT, a power of two
+    costo : float
+        Aproximate cost per output sample of the FFT method, compare it
+        with DirectCost
+
+    '''
+    m = taps - 1
+    L = max(int(2**ceil(log2(taps))), 2)
+    # A filter longer than 2**20 taps still gets a FFT with blocks of L + 1
+    Lmax = max(2**20, 2*L) if n is None else max(int(2**ceil(log2(n + m))), 2)
+    mejor = None
+    while L <= Lmax:
+        B = L - m if n is None else min(L - m, n)
+        if B > 0:
+            costo = float(COSTO_FFT*L*log2(L)/B + COSTO_FFT_FIJO)
+            if n:
+                costo += COSTO_LLAMADA/n
+            if mejor is None or costo < mejor[1]:
+                mejor = (L, costo)
+        L *= 2
+    return mejor
+
+def DirectCost(taps):
+    '''
+    Aproximate cost per output sample of the direct convolution
+    '''
+    return COSTO_DIRECTO + taps
+
+def Symmetry(h):
+    '''
+    Symmetry of the taps of a FIR filter: 1 if h[n] = h[N-1-n], -1 if
+    h[n] = -h[N-1-n] and 0 otherwise
+    '''
+    h = asarray(h, dtype = float)
+    tol = 1e-12*abs(h).max() if len(h) else 0
+    if allclose(h, h[::-1], rtol = 0, atol = tol):
+        return 1
+    if allclose(h, -h[::-1], rtol = 0, atol = tol):
+        return -1
+    return 0
+
+def ActiveTaps(h):
+    '''
+    Mask of the nonzero taps of a FIR filter. A tap is zero when its
+    magnitude is within the tolerance of Symmetry, 1e-12 times the largest
+    tap, like the taps of half band filters that are zero up to rounding
+    '''
+    h = asarray(h, dtype = float)
+    tol = 1e-12*abs(h).max() if len(h) else 0
+    return abs(h) > tol
+
+def FoldTaps(h):
+    '''
+    Fold the taps of a FIR filter that are symmetric or antisymmetric, the
+    tap k and its mirror N-1-k share one multiply, and drop the zero taps
+    like the ones of the half band filters (see ActiveTaps)
+
+    Parameters
+    ----------
+    h : Array
+        Taps of the filter
+
+    Returns
+    -------
+    paridad : int
+        Symmetry of the taps (see Symmetry)
+    pares : tuple
+        Positions k < N/2 and coefficients h[k] of the folded taps
+    solos : tuple
+        Positions and coefficients of the taps without mirror: the center
+        of a symmetric filter or every tap of a filter without symmetry
+
+    '''
+    h = asarray(h, dtype = float)
+    N = len(h)
+    paridad = Symmetry(h)
+    activos = ActiveTaps(h)
+    if paridad == 0:
+        k = flatnonzero(activos)
+        return paridad, (k[:0], h[:0]), (k, h[k])
+    k = flatnonzero(activos[:N//2])
+    # The center of an antisymmetric filter is zero
+    c = arange(N//2, N//2 + 1) if N % 2 and paridad == 1 and activos[N//2] else k[:0]
+    return paridad, (k, h[k]), (c, h[c])
+
+def FoldedCost(plegado):
+    '''
+    Multiplies per output sample of the folded taps of FoldTaps
+    '''
+    paridad, pares, solos = plegado
+    return len(pares[0]) + len(solos[0])
+
+def FoldedConvolve(plegado, xe, N):
+    '''
+    Valid convolution of xe with the folded taps of N taps, time in axis 0.
+    The output n is the sum of h[k] (xe[n+N-1-k] + paridad xe[n+k]) over
+    the folded taps and of h[k] xe[n+N-1-k] over the other ones. The windows
+    of N samples are gathered at the folded positions and multiplied by the
+    coefficients in one product, in chunks of about FOLD_CHUNK values
+    '''
+    paridad, pares, solos = plegado
+    L = len(xe) - N + 1
+    y = zeros((L,) + xe.shape[1:])
+    k, g = pares
+    c, gc = solos
+    if L <= 0 or len(g) + len(gc) == 0:
+        return y
+    # Window n has xe[n+j] in position j of the last axis
+    ventanas = sliding_window_view(xe, N, axis = 0)
+    planos = max(xe[0].size, 1)*(2*len(g) + len(gc))
+    paso = max(FOLD_CHUNK//planos, 1)
+    for n in range(0, L, paso):
+        v = ventanas[n:n + paso]
+        if len(g):
+            y[n:n + paso] += (v[..., N-1-k] + paridad*v[..., k]) @ g
+        if len(gc):
+            y[n:n + paso] += v[..., N-1-c] @ gc
+    return y
+
+def SOSArray(IIR):
+    '''
+    Normalize the digital sections of Filter.BilinearTF to the sos format of
+    scipy, rows [b0, b1, b2, 1, a1, a2]
+
+    Parameters
+    ----------
+    IIR : SectionBank, list or Array
+        The sections of a IIR digital filter or an Array (n, 6)
+
+    Returns
+    -------
+    sos : Array
+        Array (n, 6) of the normalized sections
+
+    '''
+    sos = SecArray(IIR, analog = False).copy()
+    sos /= sos[:, 3:4]
+    return sos
+
+class StreamFilter:
+    """
+    Base of the stream filters. The state between blocks is kept, so
+    filtering a signal by blocks gives the same result that filtering it at
+    once. The blocks are arrays with the time in axis 0, a 2D block has one
+    channel per column.
+    """
+    def __init__(self):
+        self.zi = None
+    
+    def reset(self):
+        '''
+        Forgets the state, the next block starts a new signal
+        '''
+        self.zi = None
+    
+    def process(self, x):
+        '''
+        Filters a block and keeps the state for the next one
+
+        Parameters
+        ----------
+        x : Array
+            Block of samples, time in axis 0
+
+        Returns
+        -------
+        y : Array
+            Filtered block with the shape of x
+
+        '''
+        x = asarray(x, dtype = float)
+        if self.zi is None:
+            self.zi = self.initial(x.shape[1:])
+        y, self.zi = self.kernel(x)
+        return y
+    
+    def __call__(self, bloques):
+        '''
+        Generator that filters an iterable of blocks
+        '''
+        for x in bloques:
+            yield self.process(x)
+    
+    def initial(self, canales):
+        raise NotImplementedError
+    
+    def kernel(self, x):
+        raise NotImplementedError
+
+class IIRStream(StreamFilter):
+    """
+    Stream filter of the sections of Filter.BilinearTF
+    """
+    def __init__(self, IIR):
+        super().__init__()
+        self.sos = SOSArray(IIR)
+    
+    def initial(self, canales):
+        return zeros((len(self.sos), 2) + canales)
+    
+    def kernel(self, x):
+        # scipy.signal is slow to import, Cost and the CLI use this module
+        # without filtering
+        from scipy.signal import sosfilt
+        return sosfilt(self.sos, x, axis = 0, zi = self.zi)
+
+class FIRStream(StreamFilter):
+    """
+    Stream filter of the taps of Filter.FIR. Each block is filtered with the
+    direct convolution, with the folded taps of FoldTaps ('plegado') or with
+    a FFT block convolution, overlap-save ('ols') or overlap-add ('ola'). The
+    method 'auto' chooses for every block between the direct convolution and
+    overlap-save with the cost model of FFTSize.
+    
+    'plegado' does about N/2 multiplies per output for linear phase taps and
+    skips the zero taps, it models the multiplies of a hardware or fixed
+    point filter. In NumPy the gather of the folded samples is slower than
+    the compiled direct convolution, so 'auto' does not choose it and
+    Cost.Realizations does not report it.
+    
+    The direct method keeps the last len(h) - 1 input samples, each output is
+    the full dot product of the taps with its input window, so the result
+    does not depend on how the signal is split in blocks. The FFT methods
+    give the same result up to the rounding of the FFT.
+    """
+    def __init__(self, h, metodo = 'auto', L = None):
+        '''
+        Parameters
+        ----------
+        h : Array
+            Taps of the filter
+        metodo : str, optional
+            'auto', 'directo', 'plegado', 'ols' or 'ola'. The default is 'auto'.
+        L : int, optional
+            Length of the FFT, a power of two longer than len(h) - 1. The
+            default is None, chosen by FFTSize.
+
+        '''
+        super().__init__()
+        if metodo not in ('auto', 'directo', 'plegado', 'ols', 'ola'):
+            raise ValueError("metodo debe ser 'auto', 'directo', 'plegado', 'ols' o 'ola'")
+        self.h = asarray(h, dtype = float)
+        # Each block of the FFT gives L - len(h) + 1 samples
+        if L is not None and (int(L) != L or L < 2 or int(L) & (int(L) - 1) or L <= len(self.h) - 1):
+            raise ValueError("L debe ser una potencia de dos mayor que {}".format(len(self.h) - 1))
+        self.plegado = FoldTaps(self.h) if metodo == 'plegado' else None
+        self.metodo = metodo
+        self.L = None if L is None else int(L)
+        self._H = {}
+    
+    def initial(self, canales):
+        # Input history for directo/ols, output tail for ola
+        return zeros((len(self.h) - 1,) + canales)
+    
+    def kernel(self, x):
+        if len(x) == 0:
+            return x, self.zi
+        
+        if self.metodo == 'directo':
+            return self._directo(x)
+        if self.metodo == 'plegado':
+            return self._plegado(x)
+        
+        L = self.L
+        if L is None:
+            L, costo = FFTSize(len(self.h), len(x))
+            if self.metodo == 'auto' and DirectCost(len(self.h)) <= costo:
+                return self._directo(x)
+        
+        if self.metodo == 'ola':
+            return self._ola(x, L)
+        return self._ols(x, L)
+    
+    def spectrum(self, L):
+        '''
+        FFT of length L of the taps, computed once for each L
+        '''
+        if L not in self._H:
+            self._H[L] = rfft(self.h, L)
+        return self._H[L]
+    
+    def _directo(self, x):
+        m = len(self.zi)
+        xe = concatenate((self.zi, x))
+        planos = xe.reshape(len(xe), -1)
+        y = empty((len(x), planos.shape[1]))
+        for c in range(planos.shape[1]):
+            y[:, c] = convolve(planos[:, c], self.h, 'valid')
+        return y.reshape(x.shape), xe[len(xe) - m:]
+    
+    def _plegado(self, x):
+        m = len(self.zi)
+        xe = concatenate((self.zi, x))
+        return FoldedConvolve(self.plegado, xe, len(self.h)), xe[len(xe) - m:]
+    
+    def _ols(self, x, L):
+        m = len(self.zi)
+        B = L - m
+        nseg = -(-len(x)//B)
+        # History plus the block, zero padded to complete the last segment
+        xe = zeros((nseg*B + m,) + x.shape[1:])
+        xe[:m] = self.zi
+        xe[m:m + len(x)] = x
+        # Segments of L samples that overlap m samples, time in the last axis
+        seg = sliding_window_view(xe, L, axis = 0)[::B]
+        Y = irfft(rfft(seg, L, axis = -1)*self.spectrum(L), L, axis = -1)[..., m:]
+        # (nseg, ..., B) to (nseg*B, ...)
+        y = moveaxis(Y, -1, 1).reshape((nseg*B,) + x.shape[1:])[:len(x)]
+        return y, concatenate((self.zi, x))[len(x):]
+    
+    def _ola(self, x, L):
+        m = len(self.zi)
+        B = L - m
+        nseg = -(-len(x)//B)
+        xp = zeros((nseg*B,) + x.shape[1:])
+        xp[:len(x)] = x
+        H = self.spectrum(L).reshape((-1,) + (1,)*(x.ndim - 1))
+        Y = irfft(rfft(xp.reshape((nseg, B) + x.shape[1:]), L, axis = 1)*H, L, axis = 1)
+        # Overlap and add the segments, the previous tail goes at the start
+        y = zeros((nseg*B + m,) + x.shape[1:])
+        y[:m] = self.zi
+        for k in range(nseg):
+            y[k*B:k*B + L] += Y[k]
+        return y[:len(x)], y[len(x):len(x) + m]
+
+def CreateStream(Filtro, metodo = 'auto'):
+    '''
+    Stream filter of a design, a 1D Array are the taps of a FIR filter and a
+    SectionBank, a list of tuples or an Array (n, 6) are the sections of a
+    IIR filter
+
+    Parameters
+    ----------
+    Filtro : list or Array
+        Output of Filter.BilinearTF or Filter.FIR
+    metodo : str, optional
+        Convolution method of a FIR filter (see FIRStream). The default
+        is 'auto'.
+
+    Returns
+    -------
+    stream : StreamFilter
+        The stream filter
+
+    '''
+    if not isinstance(Filtro, (list, tuple)) and ndim(Filtro) == 1:
+        return FIRStream(Filtro, metodo)
+    return IIRStream(Filtro)
+
+def FoldedFilter(h, x):
+    '''
+    Filter x at once with the folded taps of h (see FoldTaps), time in
+    axis 0, the output has the length of x
+    '''
+    return FIRStream(h, 'plegado').process(x)
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 18:04:51 2026
+
+Wall time of the phases of a design, shown in the status bar and exported
+as a trace file
+"""
+
+import json
+import os
+from collections import deque
+from threading import get_ident
+from time import perf_counter
+
+class _Nula:
+    """
+    Phase of a disabled trace, it does nothing
+    """
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+
+NULA = _Nula()
+
+class _Fase:
+    __slots__ = ('traza', 'nombre', 'inicio')
+    
+    def __init__(self, traza, nombre):
+        self.traza = traza
+        self.nombre = nombre
+    
+    def __enter__(self):
+        self.inicio = perf_counter()
+        return self
+    
+    def __exit__(self, *exc):
+        self.traza.agregar(self.nombre, self.inicio, perf_counter() - self.inicio)
+        return False
+
+class Trace:
+    """
+    Records the wall time of named phases. A disabled trace returns the same
+    empty context for every phase, so the instrumented code only pays an
+    attribute lookup and a call.
+    """
+    def __init__(self, activo = False, maxeventos = 100000):
+        '''
+        Parameters
+        ----------
+        activo : boolean, optional
+            If true the phases are recorded. The default is False.
+        maxeventos : int, optional
+            Number of phases kept for the trace file, the oldest are
+            discarded. The default is 100000.
+
+        '''
+        self.activo = activo
+        self.eventos = deque(maxlen = maxeventos)
+        # Duration of the last execution of every phase
+        self.ultimo = {}
+        self.origen = perf_counter()
+    
+    def fase(self, nombre):
+        '''
+        Context manager that measures the phase nombre
+
+            with traza.fase("diseño"):
+                ...
+        '''
+        if not self.activo:
+            return NULA
+        return _Fase(self, nombre)
+    
+    def agregar(self, nombre, inicio, duracion):
+        # The phases can finish in the design worker thread, deque.append
+        # and the dict assignment are atomic
+        self.eventos.append((nombre, inicio, duracion, get_ident()))
+        self.ultimo[nombre] = duracion
+    
+    def reiniciar(self):
+        '''
+        Forgets the durations of the last execution, call it when a new
+        design starts so phases that did not run are not shown
+        '''
+        if self.activo:
+            self.ultimo = {}
+    
+    def resumen(self):
+        '''
+        Returns a text with the duration of the phases of the last execution
+        in milliseconds
+        '''
+        ultimo = dict(self.ultimo)
+        if not ultimo:
+            return ""
+        partes = ["{} {:.1f}".format(nombre, d*1e3) for nombre, d in ultimo.items()]
+        return "{} | total {:.1f} ms".format(" | ".join(partes), sum(ultimo.values())*1e3)
+    
+    def exportar(self, archivo):
+        '''
+        Writes the recorded phases in the Trace Event format of
+        chrome://tracing and Perfetto, times are in microseconds
+
+        Parameters
+        ----------
+        archivo : str
+            Path of the JSON file
+
+        '''
+        pid = os.getpid()
+        eventos = [{"name": nombre, "ph": "X", "pid": pid, "tid": tid,
+                    "ts": (inicio - self.origen)*1e6, "dur": duracion*1e6}
+                   for nombre, inicio, duracion, tid in list(self.eventos)]
+        with open(archivo, "w") as f:
+            json.dump({"traceEvents": eventos, "displayTimeUnit": "ms"}, f)
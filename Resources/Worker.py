@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 11:40:32 2026
+
+Runs the designs out of the GUI thread, only the newest request is painted
+"""
+
+from PyQt5 import QtCore
+
+class WorkerSignals(QtCore.QObject):
+    """
+    Signals of a DesignWorker, QRunnable is not a QObject
+    """
+    terminado = QtCore.pyqtSignal(int, object)
+    error = QtCore.pyqtSignal(int, object)
+
+class DesignWorker(QtCore.QRunnable):
+    """
+    Runs func(*args) in a thread of a QThreadPool and emits the result with
+    the generation number of the request
+    """
+    def __init__(self, gen, func, *args):
+        super().__init__()
+        self.gen = gen
+        self.func = func
+        self.args = args
+        self.signals = WorkerSignals()
+    
+    def run(self):
+        try:
+            resultado = self.func(*self.args)
+        except Exception as e:
+            self.signals.error.emit(self.gen, e)
+        else:
+            self.signals.terminado.emit(self.gen, resultado)
+
+class DesignQueue(QtCore.QObject):
+    """
+    Queue of design requests with a single worker. While a design is running
+    the new requests are coalesced, only the last one is kept and launched
+    when the worker ends. Results of superseded requests are discarded, so
+    resultado is only emitted for the newest request.
+    """
+    resultado = QtCore.pyqtSignal(object)
+    fallo = QtCore.pyqtSignal(object)
+    
+    def __init__(self, func, parent = None):
+        '''
+        Parameters
+        ----------
+        func : function
+            Function that makes the design, it runs outside the GUI thread
+            so it must not touch any widget
+        parent : QObject, optional
+            Parent of the queue. The default is None.
+
+        '''
+        super().__init__(parent)
+        self.func = func
+        self.pool = QtCore.QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.gen = 0
+        self.ocupado = False
+        self.pendiente = None
+        self._workers = {}
+    
+    def solicitar(self, *args):
+        '''
+        Requests a design with func(*args), supersedes every previous request
+        '''
+        self.gen += 1
+        if self.ocupado:
+            self.pendiente = (self.gen, args)
+        else:
+            self._lanzar(self.gen, args)
+    
+    def cancelar(self):
+        '''
+        Discards the pending request and the result of the running one
+        '''
+        self.gen += 1
+        self.pendiente = None
+    
+    def _lanzar(self, gen, args):
+        self.ocupado = True
+        worker = DesignWorker(gen, self.func, *args)
+        worker.signals.terminado.connect(self._terminado)
+        worker.signals.error.connect(self._error)
+        # Keep the signals alive until they are delivered
+        self._workers[gen] = worker
+        self.pool.start(worker)
+    
+    def _siguiente(self, gen):
+        self._workers.pop(gen, None)
+        self.ocupado = False
+        if self.pendiente:
+            self._lanzar(*self.pendiente)
+            self.pendiente = None
+        return gen == self.gen
+    
+    def _terminado(self, gen, resultado):
+        if self._siguiente(gen):
+            self.resultado.emit(resultado)
+    
+    def _error(self, gen, e):
+        if self._siguiente(gen):
+            self.fallo.emit(e)
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 10:02:14 2026
+
+Checks of the binary archive of designs
+"""
+
+from numpy import asarray, array_equal, shares_memory
+from pytest import raises
+from Resources.Filters import Filter, FIRS, IIRS
+from Resources.Archive import WriteArchive, DesignArchive
+
+def Disenos():
+    disenos = []
+    for tipo in IIRS + FIRS:
+        # IIR for the analog families, minfase for the FIR ones
+        for opcion in (False, True):
+            IIR, minfase = (opcion, False) if tipo in IIRS else (False, opcion)
+            spec = {"tipo": tipo, "Ap": 1, "Ar": 40, "fp": 1000, "fr": 1500,
+                    "fs": 8000, "HP": False, "IIR": IIR, "minfase": minfase}
+            fc, Filtro = Filter.Design(tipo, 1, 40, 1000, 1500, 8000, False, IIR, minfase)
+            disenos.append((spec, fc, Filtro))
+    return disenos
+
+def test_ida_y_vuelta(tmp_path):
+    disenos = Disenos()
+    archivo = str(tmp_path/"disenos.fsd")
+    assert WriteArchive(archivo, disenos) == len(disenos)
+    leido = DesignArchive(archivo)
+    assert len(leido) == len(disenos)
+    for i, (spec, fc, Filtro) in enumerate(disenos):
+        spec_l, fc_l, Filtro_l = leido[i]
+        assert spec_l == spec and fc_l == fc
+        assert array_equal(asarray(Filtro_l), asarray(Filtro))
+        assert list(leido.find(tipo = spec["tipo"], IIR = spec["IIR"], minfase = spec["minfase"])) == [i]
+
+def test_tipo_largo(tmp_path):
+    spec, fc, Filtro = Disenos()[0]
+    spec = dict(spec, tipo = "B"*33)
+    with raises(ValueError):
+        WriteArchive(str(tmp_path/"largo.fsd"), [(spec, fc, Filtro)])
+
+def test_busqueda_y_meta(tmp_path):
+    disenos = Disenos()
+    archivo = str(tmp_path/"disenos.fsd")
+    WriteArchive(archivo, disenos, meta = {"origen": "pruebas"})
+    leido = DesignArchive(archivo)
+    assert leido.meta == {"origen": "pruebas"}
+    spec, fc, Filtro = leido.lookup(tipo = "Eliptico", IIR = True)
+    assert spec["tipo"] == "Eliptico" and spec["IIR"]
+    assert leido.lookup(tipo = "Butterworth", fp = 2000) is None
+    # The sections are a view of the memory map, not a copy
+    assert shares_memory(asarray(Filtro), leido.datos)
+    with raises(ValueError):
+        leido.find(orden = 3)
+
+def test_no_es_archivo(tmp_path):
+    archivo = tmp_path/"otro.fsd"
+    archivo.write_bytes(b"0"*256)
+    with raises(ValueError):
+        DesignArchive(str(archivo))
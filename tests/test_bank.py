@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 01:05:52 2026
+
+Checks of the filter banks of Bank
+"""
+
+from numpy import allclose, concatenate, stack
+from numpy.random import default_rng
+from scipy.signal import sosfilt
+from Resources.Bank import OctaveBank, BankStream
+
+def test_sin_relleno():
+    fm, IIR = OctaveBank(48000, 3)
+    banco = BankStream(IIR)
+    # The padding is dropped and no section keeps a pole at z = -1
+    for sos in banco.sos:
+        assert len(sos) < IIR.shape[1]
+        assert (abs(sos[:, 3] - sos[:, 4] + sos[:, 5]) > 1e-12).all()
+
+def test_bloques():
+    fm, IIR = OctaveBank(48000, 1, tipo = "Chebyshev")
+    x = default_rng(0).standard_normal((4000, 2))
+    banco = BankStream(IIR)
+    y = concatenate([banco.process(x[i:i + 700]) for i in range(0, len(x), 700)])
+    referencia = stack([sosfilt(b/b[:, 3:4], x, axis = 0) for b in IIR], axis = 1)
+    assert allclose(y, referencia)
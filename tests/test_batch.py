@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 12:10:41 2026
+
+Checks of the batch designs of Filters against the designs one by one
+"""
+
+from numpy import allclose, asarray, linspace, pi
+from Resources.Filters import Filter
+from Resources.PFilter import AnalogResp, DigitalResp
+
+Ap, Ar, fs = 1, (40, 60, 80), 8000
+fp, fr = 1000, (1300, 1500, 2500)
+w = linspace(.01, 3, 200)*2*pi*fp
+
+def Comparar(Batch, Escalar):
+    for HP in (False, True):
+        N, fc, sec, fos = Batch(Ap, Ar, fp, fr, HP)
+        IIR = Filter.BilinearTFBatch(fs, sec)
+        for i in range(len(N)):
+            fc1, sec1 = Escalar(Ap, Ar[i], fp, fr[i], HP)
+            assert allclose(fc[i], fc1)
+            assert allclose(AnalogResp(sec[i], w)[2], AnalogResp(asarray(sec1), w)[2])
+            digital = Filter.BilinearTF(fs, sec1)
+            assert allclose(DigitalResp(IIR[i], w/fs)[2], DigitalResp(asarray(digital), w/fs)[2])
+
+def test_butterworth_batch():
+    Comparar(Filter.ButterworthBatch, Filter.Butterworth)
+
+def test_chebyshev_batch():
+    Comparar(Filter.ChebyshevBatch, Filter.Chebyshev)
+
+def test_fir_batch():
+    N, wc, h = Filter.FIRBatch(Ap, Ar, fp, fr, fs)
+    for i in range(len(N)):
+        wc1, h1 = Filter.FIR(Ap, Ar[i], fp, fr[i], fs)
+        assert N[i] == len(h1) and allclose(wc[i], wc1)
+        assert allclose(h[i, :N[i]], h1) and not h[i, N[i]:].any()
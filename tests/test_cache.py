@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 12:31:09 2026
+
+Checks of the LRU cache of the designs
+"""
+
+from numpy import zeros
+from Resources.Cache import DesignCache, Tamano
+
+def test_lru_por_entradas():
+    cache = DesignCache(maxsize = 2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    # "a" becomes the most recently used, "b" is discarded
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert "b" not in cache and cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (3, 1)
+
+def test_lru_por_memoria():
+    cache = DesignCache(maxbytes = 3*8000)
+    for i in range(4):
+        cache.put(i, (zeros(1000), zeros(0)))
+    assert 0 not in cache and len(cache) == 2
+    assert cache.nbytes == 2*Tamano((zeros(1000), zeros(0))) <= cache.maxbytes
+    # A value bigger than the cache is not stored
+    cache.put("grande", zeros(4000))
+    assert "grande" not in cache and len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
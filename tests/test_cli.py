@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 10:31:48 2026
+
+Checks of the command line designer
+"""
+
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_sin_scipy_signal():
+    # A Butterworth design and its cost do not need scipy.signal
+    codigo = ("import sys, FDesignCLI; "
+              "FDesignCLI.Disenar({'tipo': 'Butterworth', 'Ap': 1, 'Ar': 40, 'fp': 1000, "
+              "'fr': 1500, 'fs': 8000, 'HP': False, 'IIR': True, 'minfase': False}); "
+              "print('scipy.signal' in sys.modules)")
+    salida = subprocess.run([sys.executable, "-c", codigo], capture_output = True,
+                            text = True, check = True, cwd = RAIZ)
+    assert salida.stdout.strip() == "False"
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 11:05:22 2026
+
+Checks of the cost model of the designs
+"""
+
+from Resources.Filters import Filter
+from Resources.Stream import ActiveTaps, FoldTaps, FoldedCost
+from Resources.Resample import AntiAlias
+from Resources.Cost import FIRCost, FoldedFIRCost, Realizations, FFTCost, PolyphaseCost, Cost, Summary
+
+def test_ceros_media_banda():
+    # The taps of the half band filter that are zero up to rounding do not
+    # count in the direct nor in the folded realization
+    fc, h = Filter.Design('FIR', 1, 40, 10000, 14000, 48000)
+    assert FIRCost(h)["multiplicaciones"] == 25
+    assert FoldedFIRCost(h)["multiplicaciones"] == FoldedCost(FoldTaps(h)) == 13
+
+def test_realizaciones_fir():
+    fc, h = Filter.Design('FIR', 1, 60, 1000, 1500, 8000)
+    assert [c["realizacion"] for c in Realizations(h, 8000)] == ["directa", "fft"]
+
+def test_secciones():
+    fc, sec = Filter.Design('Butterworth', 1, 60, 1000, 1500, 48000)
+    N = int((2 - sec.fos).sum())
+    digital = Cost(Filter.BilinearTF(48000, sec), fs = 48000)
+    # 5 multiplies and 2 states for a SOS, 3 and 1 for a FOS
+    assert digital["multiplicaciones"] == 5*(~sec.fos).sum() + 3*sec.fos.sum()
+    assert digital["estado"] == N and digital["sumas"] == digital["multiplicaciones"] - len(sec)
+    assert 0 < digital["retardo"] and digital["retardo_s"] == digital["retardo"]/48000
+    analogico = Cost(sec, fc, IIR = False)
+    assert analogico["realizacion"] == "analogica"
+    assert analogico["multiplicaciones"] == digital["multiplicaciones"]
+    # About the same delay in seconds, the bilinear warp is small at fp << fs
+    assert abs(analogico["retardo_s"]/digital["retardo_s"] - 1) < .1
+
+def test_fir_y_fft():
+    fc, h = Filter.Design('FIR', 1, 60, 1000, 1500, 8000)
+    directa = Cost(h, fs = 8000)
+    # The zeros of the sinc and the ends of the window are not multiplied
+    assert directa["multiplicaciones"] == ActiveTaps(h).sum() < len(h)
+    assert directa["retardo"] == (len(h) - 1)/2
+    fft = FFTCost(h, 8000, L = 1024)
+    assert fft["bloque"] == 1024 - len(h) + 1 and fft["retardo"] == directa["retardo"]
+    assert "FFT 1024" in Summary(fft) and Summary(directa).startswith("directa")
+
+def test_polifase():
+    h = AntiAlias(3, 2)
+    costo = PolyphaseCost(h, 3, 2)
+    assert costo["multiplicaciones"] == -(-len(h)//3) and costo["tasa"] == 1.5
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 13:41:16 2026
+
+Checks of the inverse Chebyshev, elliptic and Auto families
+"""
+
+from numpy import asarray, linspace, pi
+from Resources.Filters import Filter, IIRS
+from Resources.PFilter import AnalogResp
+
+SPECS = ((1, 40, 1000, 1300), (.5, 60, 1000, 1500), (3, 50, 1000, 1200), (1, 80, 1000, 2000))
+FAMILIAS = {"Chebyshev Inverso": Filter.InverseChebyshev, "Eliptico": Filter.Elliptic}
+
+def Orden(sec):
+    return int((2 - sec.fos).sum())
+
+def test_cumplen_la_especificacion():
+    for tipo, Familia in FAMILIAS.items():
+        for Ap, Ar, fp, fr in SPECS:
+            fc, sec = Familia(Ap, Ar, fp, fr)
+            wp, wr = 2*pi*linspace(1, fp, 500), 2*pi*linspace(fr, 20*fr, 2000)
+            Hp, Hr = AnalogResp(asarray(sec), wp)[0], AnalogResp(asarray(sec), wr)[0]
+            assert Hp.min() >= -Ap - 1e-3 and Hp.max() <= 1e-6
+            assert Hr.max() <= -Ar + 1e-3
+            assert Orden(sec) == Filter.Orders(Ap, Ar, fp, fr)[tipo]
+            # The high pass is the low pass with w in wc^2/w
+            fcH, secH = Familia(Ap, Ar, fp, fr, True)
+            wc = 2*pi*fcH
+            assert abs(AnalogResp(asarray(secH), wc**2/wp)[0] - Hp).max() < 1e-9
+
+def test_ordenes():
+    for Ap, Ar, fp, fr in SPECS:
+        N = Filter.Orders(Ap, Ar, fp, fr)
+        assert N["Eliptico"] <= N["Chebyshev"] == N["Chebyshev Inverso"] <= N["Butterworth"]
+
+def test_auto():
+    for Ap, Ar, fp, fr in SPECS:
+        tipo = Filter.AutoFamily(Ap, Ar, fp, fr)
+        assert tipo in IIRS
+        fc, sec = Filter.Design("Auto", Ap, Ar, fp, fr)
+        fc1, sec1 = Filter.Design(tipo, Ap, Ar, fp, fr)
+        assert fc == fc1 and (asarray(sec) == asarray(sec1)).all()
+    # The ties go to the all pole families
+    assert Filter.AutoFamily(1, 20, 1000, 5000) == "Butterworth"
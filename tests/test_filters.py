@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 00:21:37 2026
+
+Checks of the designs of Filters
+"""
+
+from numpy import abs as npabs, arange, log10, allclose, linspace, pi, asarray
+from numpy.fft import rfft
+from pytest import raises
+from Resources.Filters import Filter
+from Resources.PFilter import DigitalResp
+from Resources.Cost import TapsRetardo
+
+def RespuestaDB(h, fs, nfft = 8192):
+    return arange(nfft//2 + 1)*fs/nfft, 20*log10(npabs(rfft(h, nfft)))
+
+def test_equiripple_cumple():
+    wc, h = Filter.Equiripple(1, 60, 1000, 1500, 5000)
+    f, H = RespuestaDB(h, 5000)
+    assert H[f <= 1000].min() >= -1 and H[f >= 1500].max() <= -60
+
+def test_equiripple_no_cumple():
+    # A single try of the estimate of Herrmann falls short of the spec
+    with raises(ValueError):
+        Filter.Equiripple(1, 60, 1000, 1050, 5000, intentos = 1)
+
+def test_fir_fase_lineal():
+    # Every window of the table gives symmetric taps, like FIRBatch
+    for As in (20, 24, 40, 50, 70, 90):
+        wc, h = Filter.FIR(1, As, 1000, 1500, 8000)
+        assert allclose(h, h[::-1], rtol = 0, atol = 1e-12*npabs(h).max())
+        N, wcb, hb = Filter.FIRBatch(1, As, 1000, 1500, 8000)
+        assert allclose(hb[0, :N[0]], h)
+
+def test_chebyshev_par_digital():
+    # Even orders start the passband at -Ap, the numerator gain of the last
+    # section must survive the bilinear transformation
+    w = linspace(0, pi, 4098)[1:-1]
+    for fr, HP in ((1300, False), (1300, True), (1600, False)):
+        fc, sec = Filter.Design('Chebyshev', 1, 40, 1000, fr, 8000, HP, True)
+        Hdb = DigitalResp(asarray(sec), w)[0]
+        assert abs(Hdb.max()) < 1e-2
+
+def test_fase_minima():
+    for tipo in ('FIR', 'Equiripple'):
+        for HP in (False, True):
+            fc, h = Filter.Design(tipo, 1, 60, 1000, 1500, 8000, HP)
+            fc_m, m = Filter.Design(tipo, 1, 60, 1000, 1500, 8000, HP, minfase = True)
+            assert len(m) == len(h)
+            # Same magnitude, with the energy at the start and less delay
+            H, M = npabs(rfft(h, 8192)), npabs(rfft(m, 8192))
+            assert npabs(M - H).max() < 1e-4*H.max()
+            assert (m[:len(m)//2]**2).sum() > .9*(m**2).sum()
+            assert TapsRetardo(m) < (len(h) - 1)/4
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 00:48:15 2026
+
+Checks of the integer simulation of Fixed
+"""
+
+from numpy import allclose, array_equal, convolve, int64, abs as npabs
+from numpy.random import default_rng
+from pytest import raises
+from scipy.signal import sosfilt
+from Resources.Filters import Filter
+from Resources.Stream import SOSArray
+from Resources import Fixed
+
+def test_fir_entero():
+    fc, h = Filter.Design("FIR", 1, 60, 1000, 1500, 5000)
+    q, frac = Fixed.QuantizeFIR(h, 16)
+    x = default_rng(0).uniform(-.5, .5, (500, 3))
+    y = Fixed.SimulateFIR(q, frac, x, 16)[0]
+    for c in range(3):
+        xq = Fixed.Quantize(x[:, c], 16, 15)[0]
+        acc = convolve(xq, q.astype(int64))[:500]
+        assert array_equal(y[:, c]*2**15, Fixed.Wrap(Fixed.Shift(acc, frac), 16)[0])
+
+def test_sos_flotante():
+    # With long words the integer cascade follows the float one
+    fc, IIR = Filter.Design("Eliptico", 1, 60, 1000, 1200, 5000, IIR = True)
+    q, frac, ganancia = Fixed.QuantizeSOS(IIR, 32)
+    x = default_rng(1).uniform(-.2, .2, (400, 2))
+    y, desbordes = Fixed.SimulateSOS(q, frac, x, 32)
+    assert desbordes == 0
+    assert allclose(y*ganancia, sosfilt(SOSArray(IIR), x, axis = 0), atol = 1e-6)
+
+def test_sos_columnas():
+    # Each column and the state of each section are independent
+    fc, IIR = Filter.Design("Butterworth", 1, 60, 1000, 1500, 5000, IIR = True)
+    q, frac, ganancia = Fixed.QuantizeSOS(IIR, 12)
+    x = default_rng(2).uniform(-1, 1, (300, 3))
+    y = Fixed.SimulateSOS(q, frac, x, 12)[0]
+    for c in range(3):
+        assert array_equal(y[:, c], Fixed.SimulateSOS(q, frac, x[:, c], 12)[0])
+    assert npabs(y).max() <= 1
+
+def test_acumulador_de_64_bits():
+    fc, h = Filter.Design("FIR", 1, 60, 1000, 1300, 8000)
+    x = default_rng(2).uniform(-.5, .5, 200)
+    # The products of Q31 words take 62 bits, many of them wrap around
+    q, frac = Fixed.QuantizeFIR(h, 32)
+    assert Fixed.Headroom(q, frac, 32) < 0
+    with raises(ValueError):
+        Fixed.SimulateFIR(q, frac, x, 32)
+    assert Fixed.MinimumBits(h, 1, 60, 1000, 1300, 8000, palabras = [32])[0] is None
+    q, frac = Fixed.QuantizeFIR(h, 31)
+    assert Fixed.Headroom(q, frac, 31) > 0
+    y = Fixed.SimulateFIR(q, frac, x, 31)[0]
+    assert npabs(y - convolve(x, h)[:len(x)]).max() < 1e-7
+    fc, sec = Filter.Design("Eliptico", 1, 60, 1000, 1300, 8000, IIR = True)
+    bits, informe = Fixed.MinimumBits(sec, 1, 60, 1000, 1300, 8000)
+    assert bits <= 31 and Fixed.Headroom(*Fixed.QuantizeSOS(sec, bits)[:2], bits) > 0
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 13:02:27 2026
+
+Checks of the parallel filtering of many channels
+"""
+
+from numpy import array_equal, allclose, concatenate
+from numpy.random import default_rng
+from Resources.Filters import Filter
+from Resources.Stream import CreateStream
+from Resources.Multichannel import Groups, ParallelStream, FilterChannels
+
+x = default_rng(3).standard_normal((3000, 5))
+DISENOS = (Filter.Design('FIR', 1, 60, 1000, 1500, 8000)[1],
+           Filter.Design('Butterworth', 1, 60, 1000, 1500, 8000, IIR = True)[1])
+
+def test_grupos():
+    assert Groups(5, 2) == [slice(0, 3), slice(3, 5)]
+    assert Groups(2, 8) == [slice(0, 1), slice(1, 2)]
+
+def test_igual_que_en_serie():
+    for Filtro in DISENOS:
+        serie = CreateStream(Filtro).process(x)
+        for modo in ('hilos', 'procesos'):
+            assert array_equal(FilterChannels(Filtro, x, 2, modo), serie)
+
+def test_bloques():
+    for Filtro in DISENOS:
+        with ParallelStream(Filtro, 3) as stream:
+            y = concatenate([stream.process(x[i:i + 700]) for i in range(0, len(x), 700)])
+        # auto may choose another method for a block, equal up to rounding
+        assert allclose(y, CreateStream(Filtro).process(x))
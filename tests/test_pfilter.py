@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:40:12 2026
+
+Checks of the FIR responses of PFilter against scipy.signal.freqz
+"""
+
+from numpy import allclose, arange, pi
+from scipy.signal import firwin, freqz, group_delay
+from Resources.PFilter import frecResponse, FFTLength, TapsDelay, Grid
+
+def test_fftlength_even():
+    # An odd number of taps longer than 2N gave an odd FFT
+    for taps, N in ((301, 100), (31, 512), (1000, 7), (1, 1)):
+        nfft, paso = FFTLength(taps, N)
+        assert nfft % (2*N) == 0 and nfft >= taps and nfft//(2*paso) == N
+
+def test_fir_freqz():
+    for taps, N in ((301, 100), (301, None), (64, 512), (1001, 333)):
+        h = firwin(taps, .3)
+        w, Hdb, Hphi, H = frecResponse().FIR(h, N)
+        if N:
+            assert len(w) == N and allclose(w, Grid(N))
+        H0 = freqz(h, worN = w)[1]
+        assert allclose(H, H0, atol = 1e-9)
+
+def test_tapsdelay_group_delay():
+    h = firwin(301, .3)*arange(1, 302)**.5
+    w, gd = TapsDelay(h, 100)
+    assert len(w) == 100
+    banda = w < .25*pi
+    assert allclose(gd[banda], group_delay((h, 1), w[banda])[1], atol = 1e-6)
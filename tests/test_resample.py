@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 13:20:45 2026
+
+Checks of the polyphase resamplers against upsampling, filtering and
+downsampling
+"""
+
+from numpy import allclose, zeros, convolve, concatenate, stack
+from numpy.random import default_rng
+from Resources.Resample import Resampler, Decimate, Interpolate, Resample
+
+x = default_rng(4).standard_normal(1001)
+
+def Referencia(x, L, M, h):
+    # Zeros between the samples, the filter at the high rate and one of M
+    arriba = zeros(len(x)*L)
+    arriba[::L] = x
+    return convolve(arriba, h)[:len(arriba)][::M]
+
+def test_factores():
+    for L, M in ((1, 3), (4, 1), (3, 2), (2, 3), (6, 4)):
+        r = Resampler(L, M)
+        assert allclose(r.process(x), Referencia(x, r.L, r.M, r.h))
+
+def test_atajos():
+    r = Resampler(3, 2)
+    assert allclose(Resample(x, 3, 2), Referencia(x, 3, 2, r.h))
+    assert allclose(Decimate(x, 3), Referencia(x, 1, 3, Resampler(1, 3).h))
+    assert allclose(Interpolate(x, 3), Referencia(x, 3, 1, Resampler(3, 1).h))
+
+def test_bloques_y_canales():
+    r = Resampler(3, 2)
+    y = concatenate([r.process(x[i:i + 97]) for i in range(0, len(x), 97)])
+    assert allclose(y, Referencia(x, 3, 2, r.h))
+    r.reset()
+    X = stack((x, -x), axis = 1)
+    assert allclose(r.process(X), stack((y, -y), axis = 1))
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Sun Oct 18 23:58:04 2026
+
+Checks of the block convolutions of Stream
+"""
+
+from numpy import allclose, convolve, concatenate, stack
+from numpy.random import default_rng
+from pytest import raises
+from Resources.Filters import Filter
+from Resources.Stream import FIRStream, FFTSize, FoldTaps, FoldedFilter, CreateStream
+
+def test_fft_length_validada():
+    h = default_rng(0).standard_normal(101)
+    for L in (64, 100, 96, 3):
+        with raises(ValueError):
+            FIRStream(h, 'ols', L)
+
+def test_bloques():
+    rng = default_rng(1)
+    h, x = rng.standard_normal(101), rng.standard_normal(1000)
+    for metodo, L in (('ols', 128), ('ola', 128), ('ols', None), ('directo', None)):
+        s = FIRStream(h, metodo, L)
+        y = concatenate([s.process(x[i:i + 300]) for i in range(0, len(x), 300)])
+        assert allclose(y, convolve(x, h)[:len(x)])
+
+def test_fftsize_filtro_largo():
+    L, costo = FFTSize(2**20 + 5)
+    assert L > 2**20 + 4
+
+def test_plegado_media_banda():
+    fc, h = Filter.Design('FIR', 1, 40, 10000, 14000, 48000)
+    paridad, pares, solos = FoldTaps(h)
+    # 24 of the 49 taps of the half band filter are zero up to rounding
+    assert paridad == 1 and len(pares[0]) + len(solos[0]) == 13
+    x = default_rng(2).standard_normal((5000, 2))
+    y = stack([convolve(x[:, c], h)[:len(x)] for c in range(2)], axis = 1)
+    assert allclose(FoldedFilter(h, x), y)
+    assert allclose(CreateStream(h, 'plegado').process(x), y)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Mon Oct 19 12:44:53 2026
+
+Checks of the queue of designs out of the GUI thread
+"""
+
+import time
+from pytest import importorskip
+
+QtCore = importorskip("PyQt5.QtCore")
+# The queue delivers its signals through the event loop of the application
+APP = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+def Esperar(cola, resultados, n = 1, limite = 10):
+    inicio = time.perf_counter()
+    while len(resultados) < n and time.perf_counter() - inicio < limite:
+        APP.processEvents()
+        time.sleep(.005)
+    # Late results of superseded requests would arrive now
+    cola.pool.waitForDone()
+    APP.processEvents()
+
+def Lento(x):
+    time.sleep(.05)
+    return x
+
+def test_solo_el_ultimo():
+    from Resources.Worker import DesignQueue
+    cola = DesignQueue(Lento)
+    resultados = []
+    cola.resultado.connect(resultados.append)
+    for x in range(5):
+        cola.solicitar(x)
+    Esperar(cola, resultados)
+    assert resultados == [4]
+
+def test_error_y_cancelar():
+    from Resources.Worker import DesignQueue
+    cola = DesignQueue(lambda x: 1/x)
+    resultados, fallos = [], []
+    cola.resultado.connect(resultados.append)
+    cola.fallo.connect(fallos.append)
+    cola.solicitar(0)
+    Esperar(cola, fallos)
+    assert resultados == [] and isinstance(fallos[0], ZeroDivisionError)
+    cola.solicitar(1)
+    cola.cancelar()
+    Esperar(cola, resultados, limite = .2)
+    assert resultados == []